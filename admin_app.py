@@ -8,6 +8,7 @@ from api import ApiClient
 from views.auth_view import render_initial_setup_page, render_login_page
 from views.conversation_view import render_conversation_test_page
 from views.image_analysis_view import render_image_analysis_page
+from views.job_view import render_job_panel
 from views.persona_view import render_persona_management_page
 from views.phishing_view import render_phishing_case_management_page
 from views.user_view import render_user_management_page
@@ -29,6 +30,15 @@ def render_server_error_page(error: Exception):
         st.exception(error)
 
 
+@st.cache_resource
+def get_api_client() -> ApiClient:
+    """
+    프로세스 전체에서 공유되는 ApiClient를 생성합니다.
+    Streamlit 재실행마다 새 클라이언트(와 커넥션 풀)를 만들지 않도록 캐시합니다.
+    """
+    return ApiClient()
+
+
 def render_main_app(api_client: ApiClient, token: str):
     """로그인 성공 후 보여질 메인 애플리케이션 UI를 렌더링합니다."""
     st.sidebar.title("🐶 멍탐정 관리 메뉴")
@@ -45,7 +55,6 @@ def render_main_app(api_client: ApiClient, token: str):
     selected_page = st.sidebar.radio("페이지 선택:", list(page_options.keys()))
 
     if st.sidebar.button("로그아웃"):
-        st.cache_data.clear()
         for key in list(st.session_state.keys()):
             del st.session_state[key]
         st.rerun()
@@ -53,16 +62,23 @@ def render_main_app(api_client: ApiClient, token: str):
     # --- ✅ 버전 정보 표시 로직 추가 ---
     st.sidebar.divider()
 
-    @st.cache_data(ttl=300)  # 5분 동안 캐시
-    def get_cached_server_version():
-        return api_client.get_server_version()
-
-    version_info = get_cached_server_version()
+    version_info = api_client.get_server_version()  # 5분 동안 캐시
     if version_info:
         st.sidebar.caption(f"Backend: `{version_info.get('version', 'N/A')}`")
     else:
         st.sidebar.caption("`서버 버전 확인 불가`")
 
+    with st.sidebar.expander("캐시 상태"):
+        st.caption("조회 캐시")
+        st.json(api_client.cache.stats())
+        st.caption("Presigned URL 캐시")
+        st.json(api_client.url_cache.stats())
+        st.caption("이미지 분석 결과 캐시")
+        st.json(api_client.analysis_cache.stats())
+
+    with st.sidebar:
+        render_job_panel(token)
+
     # 선택된 페이지 렌더링 함수를 호출합니다.
     page_options[selected_page](api_client, token)
 
@@ -74,7 +90,7 @@ def main():
     if "logged_in" not in st.session_state:
         st.session_state.logged_in = False
 
-    api_client = ApiClient()
+    api_client = get_api_client()
 
     if st.session_state.logged_in and "jwt_token" in st.session_state:
         render_main_app(api_client, st.session_state.jwt_token)
@@ -83,12 +99,8 @@ def main():
         try:
             st.title("🐶 멍탐정 관리자 페이지")
 
-            @st.cache_data(ttl=10)
-            def get_superuser_existence():
-                # 이 함수는 이제 성공 시 bool을, 실패 시 예외를 발생시킵니다.
-                return api_client.check_superuser_exists()
-
-            superuser_exists = get_superuser_existence()
+            # 성공 시 bool을, 실패 시 예외를 발생시킵니다. (10초 동안 캐시)
+            superuser_exists = api_client.check_superuser_exists()
 
             # --- 아래는 예외가 발생하지 않았을 때만 실행됩니다. ---
             if not superuser_exists:
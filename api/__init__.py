@@ -1,17 +1,61 @@
 # api/__init__.py
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.cookiejar import DefaultCookiePolicy
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .analysis_cache import AnalysisResultCache
+from .async_client import AsyncApiClient
 from .auth import AuthMixin
+from .cache import TaggedCache
 from .conversation import ConversationMixin
+from .image_transport import ImageTransportMixin
 from .persona import PersonaMixin
 from .phishing import PhishingMixin
-from .storage import StorageMixin
+from .storage import PresignedUrlCache, StorageMixin, build_upload_session
 from .user import UserMixin
 
 
+def _build_session() -> requests.Session:
+    """
+    커넥션 풀과 재시도 정책이 적용된 requests.Session을 생성합니다.
+    풀 크기와 재시도 횟수는 환경 변수로 조정할 수 있습니다.
+    """
+    pool_size = int(os.getenv("API_POOL_SIZE", "10"))
+    retry = Retry(
+        total=int(os.getenv("API_MAX_RETRIES", "3")),
+        backoff_factor=float(os.getenv("API_BACKOFF_FACTOR", "0.3")),
+        status_forcelist=(502, 503, 504),
+        # 기본값(GET, PUT, DELETE 등 멱등 메서드)만 재시도하여 POST 중복 생성을 방지합니다.
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+    )
+
+    session = requests.Session()
+    # 모든 관리자와 스레드가 공유하는 세션이므로 쿠키 저장소를 쓰지 않습니다.
+    # (인증은 요청마다 Authorization 헤더로 전달하며, 응답 쿠키는 모두 버립니다.)
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update(
+        {
+            "Accept": "application/json",
+            "User-Agent": "meongtamjeong-admin",
+        }
+    )
+    return session
+
+
 class ApiClient(
     AuthMixin,
     ConversationMixin,
+    ImageTransportMixin,
     PersonaMixin,
     PhishingMixin,
     StorageMixin,
@@ -20,7 +64,51 @@ class ApiClient(
     """
     FastAPI 백엔드와 통신하기 위한 클라이언트.
     각 기능별 Mixin 클래스를 상속받아 구성됩니다.
+    모든 요청은 하나의 Session(커넥션 풀)을 공유하여 Keep-Alive 연결을 재사용합니다.
     """
 
     def __init__(self):
         self.base_url = os.getenv("FASTAPI_API_BASE_URL", "http://app:80/api/v1")
+        self.session = _build_session()
+        # S3 Presigned URL 업로드 전용 세션 (재시도는 업로드 메서드에서 처리)
+        self.upload_session = build_upload_session()
+        # 여러 조회를 동시에 실행해야 할 때 사용하는 HTTP/2 비동기 클라이언트
+        self.aio = AsyncApiClient(self.base_url)
+        # 모든 세션이 공유하는 조회 캐시 (태그 단위로 무효화)
+        self.cache = TaggedCache()
+        # 모든 세션이 공유하는 Presigned URL 캐시 (object_key 기준)
+        self.url_cache = PresignedUrlCache()
+        # "urls:<object_key>" 태그가 무효화되면 해당 URL만 캐시에서 제거합니다.
+        self.cache.subscribe(
+            "urls:", lambda tag: self.url_cache.invalidate(tag[len("urls:") :])
+        )
+        # 이미지 분석 결과 캐시 (이미지 내용 해시 기준, 디스크에 보관)
+        self.analysis_cache = AnalysisResultCache()
+        # 일괄 Presigned URL API가 없다고 판단한 시각 (BATCH_DOWNLOAD_REPROBE_SEC 후 다시 시도)
+        self._batch_download_unsupported_at = None
+        # 스트리밍 API가 없다고 판단한 시각 (MESSAGE_STREAMING_REPROBE_SEC 후 다시 시도)
+        self._message_streaming_unsupported_at = None
+        # 멀티파트 업로드 API가 없다고 판단한 시각 (S3_MULTIPART_REPROBE_SEC 후 다시 시도)
+        self._multipart_upload_unsupported_at = None
+        # 이미지 전송 방식별로 백엔드가 지원하지 않는 것으로 확인된 시각
+        self._image_transport_unsupported_at = {}
+        # 백엔드 OpenAPI 스키마 (조회 시각, 스키마). object_key 방식 지원 여부 확인에 사용
+        self._api_schema = None
+        # 이웃 페이지 미리 불러오기 등 백그라운드 요청용 스레드 풀
+        self._executor = ThreadPoolExecutor(
+            max_workers=int(os.getenv("API_BACKGROUND_WORKERS", "4")),
+            thread_name_prefix="api-background",
+        )
+        # (token, skip, limit, q, sort) -> (요청 시각, Future)
+        self._users_prefetch = {}
+        # 페이지네이션 미지원 백엔드용 전체 사용자 목록 (조회 시각, {id: 사용자})
+        self._users_full_list = (0.0, None)
+        self._users_index = None
+        # 정렬 기준별로 정렬해 둔 전체 사용자 목록
+        self._users_sorted = {}
+        # 백엔드가 페이지네이션을 지원하지 않는 것으로 확인된 시각 (확인 전이면 None)
+        self._users_paging_unsupported_at = None
+        # 미리 불러오기 스레드와 함께 쓰는 위 상태를 보호하는 잠금
+        self._users_lock = threading.Lock()
+        # 전체 사용자 목록을 한 번만 내려받도록 하는 잠금
+        self._users_full_list_lock = threading.Lock()
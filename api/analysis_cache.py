@@ -0,0 +1,121 @@
+# api/analysis_cache.py
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Any, Dict
+
+# 분석 결과 캐시 파일 위치와 보관할 최대 항목 수
+ANALYSIS_CACHE_PATH = os.getenv(
+    "ANALYSIS_CACHE_PATH",
+    os.path.join(tempfile.gettempdir(), "mung_analysis_cache.sqlite3"),
+)
+ANALYSIS_CACHE_MAX_ENTRIES = int(os.getenv("ANALYSIS_CACHE_MAX_ENTRIES", "5000"))
+# 분석기(프롬프트/모델)가 바뀌면 이 값을 올려 이전 결과를 재사용하지 않도록 합니다.
+IMAGE_ANALYZER_VERSION = os.getenv("IMAGE_ANALYZER_VERSION", "v1")
+
+
+class AnalysisResultCache:
+    """
+    이미지 내용의 SHA-256과 분석기 버전을 키로 분석 결과를 보관하는 SQLite 캐시.
+    프로세스를 다시 시작해도 유지되며, 항목 수가 상한을 넘으면
+    가장 오래 사용되지 않은 항목부터 제거합니다(LRU).
+    """
+
+    def __init__(
+        self,
+        path: str = ANALYSIS_CACHE_PATH,
+        max_entries: int = ANALYSIS_CACHE_MAX_ENTRIES,
+        version: str = IMAGE_ANALYZER_VERSION,
+    ):
+        self.path = path
+        self.max_entries = max_entries
+        self.version = version
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS analysis_results (
+                    image_hash TEXT NOT NULL,
+                    version TEXT NOT NULL,
+                    phishing_score INTEGER NOT NULL,
+                    reason TEXT,
+                    created_at REAL NOT NULL,
+                    last_used_at REAL NOT NULL,
+                    PRIMARY KEY (image_hash, version)
+                )
+                """)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_analysis_results_last_used "
+                "ON analysis_results (last_used_at)"
+            )
+
+    def get(self, image_hash: str) -> Dict[str, Any] | None:
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT phishing_score, reason, created_at FROM analysis_results "
+                "WHERE image_hash = ? AND version = ?",
+                (image_hash, self.version),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE analysis_results SET last_used_at = ? "
+                "WHERE image_hash = ? AND version = ?",
+                (time.time(), image_hash, self.version),
+            )
+            self.hits += 1
+        score, reason, created_at = row
+        return {"phishing_score": score, "reason": reason, "analyzed_at": created_at}
+
+    def set(self, image_hash: str, result: Dict[str, Any]) -> None:
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO analysis_results VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    image_hash,
+                    self.version,
+                    result["phishing_score"],
+                    result.get("reason"),
+                    now,
+                    now,
+                ),
+            )
+            (count,) = self._conn.execute(
+                "SELECT COUNT(*) FROM analysis_results"
+            ).fetchone()
+            excess = count - self.max_entries
+            if excess > 0:
+                self._conn.execute(
+                    "DELETE FROM analysis_results WHERE rowid IN ("
+                    "SELECT rowid FROM analysis_results "
+                    "ORDER BY last_used_at LIMIT ?)",
+                    (excess,),
+                )
+                self.evictions += excess
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM analysis_results")
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            (entries,) = self._conn.execute(
+                "SELECT COUNT(*) FROM analysis_results"
+            ).fetchone()
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": entries,
+                "max_entries": self.max_entries,
+            }
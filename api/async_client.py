@@ -0,0 +1,188 @@
+# api/async_client.py
+import asyncio
+import os
+import threading
+from typing import Any, Awaitable, Dict, List
+
+import httpx
+
+
+class AsyncApiClient:
+    """
+    HTTP/2 멀티플렉싱을 사용하는 비동기 API 클라이언트.
+    동기 ApiClient의 조회용 메서드를 비동기로 제공하며,
+    gather()를 통해 동기 코드(Streamlit 뷰)에서 여러 요청을 동시에 실행할 수 있습니다.
+    이벤트 루프는 전용 스레드 하나에서 계속 돌고, httpx.AsyncClient 하나를 모든 gather()가
+    공유하므로 연결이 호출 사이에 재사용됩니다.
+    HTTP/2는 TLS(https://) 연결에서만 협상됩니다. httpx는 평문 h2c를 지원하지 않으므로
+    http:// 주소에서는 HTTP/1.1 연결 풀로 동작합니다.
+
+    사용 예:
+        aio = api_client.aio
+        users, personas = aio.gather(
+            aio.get_all_users(token), aio.get_personas(token)
+        )
+    """
+
+    def __init__(self, base_url: str):
+        self.base_url = base_url
+        self.max_connections = int(os.getenv("API_POOL_SIZE", "10"))
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._client: httpx.AsyncClient | None = None
+        self._lock = threading.Lock()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """전용 이벤트 루프 스레드와 공유 AsyncClient를 처음 사용할 때 만듭니다."""
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name="api-async-loop", daemon=True
+                ).start()
+                self._client = asyncio.run_coroutine_threadsafe(
+                    self._create_client(), loop
+                ).result()
+                self._loop = loop
+            return self._loop
+
+    async def _create_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=self.max_connections),
+            headers={
+                "Accept": "application/json",
+                "User-Agent": "meongtamjeong-admin",
+            },
+        )
+
+    def gather(self, *calls: Awaitable[Any]) -> List[Any]:
+        """
+        전달된 코루틴들을 공유 연결 풀 위에서 동시에 실행하고,
+        입력 순서대로 결과 리스트를 반환합니다.
+        """
+        if not calls:
+            return []
+        loop = self._ensure_loop()
+        return asyncio.run_coroutine_threadsafe(self._gather(calls), loop).result()
+
+    async def _gather(self, calls) -> List[Any]:
+        return await asyncio.gather(*calls)
+
+    def close(self) -> None:
+        """공유 AsyncClient를 닫고 이벤트 루프 스레드를 멈춥니다."""
+        with self._lock:
+            loop, client = self._loop, self._client
+            self._loop = self._client = None
+        if loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+
+    def _http(self) -> httpx.AsyncClient:
+        if self._client is None:
+            raise RuntimeError(
+                "AsyncApiClient의 메서드는 gather() 안에서만 실행할 수 있습니다."
+            )
+        return self._client
+
+    async def _get_json(
+        self,
+        path: str,
+        error_message: str,
+        token: str | None = None,
+        params: Dict[str, Any] | None = None,
+        timeout: float = 10,
+    ) -> Any | None:
+        headers = {"Authorization": f"Bearer {token}"} if token else None
+        url = f"{self.base_url}{path}"
+        try:
+            response = await self._http().get(
+                url, headers=headers, params=params, timeout=timeout
+            )
+            response.raise_for_status()
+            return response.json()
+        except (httpx.HTTPError, ValueError) as e:
+            # 본문이 JSON이 아닌 응답(ValueError)도 동기 메서드처럼 None으로 처리합니다.
+            print(f"{error_message}: {e}")
+            return None
+
+    # --- AuthMixin ---
+    async def get_server_version(self) -> Dict[str, Any] | None:
+        url = f"{self.base_url.replace('/api/v1', '')}/version"
+        try:
+            response = await self._http().get(url, timeout=3)
+            response.raise_for_status()
+            return response.json()
+        except (httpx.HTTPError, ValueError) as e:
+            print(f"서버 버전 조회 실패: {e}")
+            return None
+
+    # --- UserMixin ---
+    async def get_all_users(self, token: str) -> List[Dict[str, Any]] | None:
+        return await self._get_json(
+            "/admin/users", "사용자 목록 조회 실패", token=token, timeout=5
+        )
+
+    # --- PersonaMixin ---
+    async def get_personas(self, token: str) -> List[Dict[str, Any]] | None:
+        return await self._get_json(
+            "/personas/", "페르소나 목록 조회 실패", token=token, timeout=5
+        )
+
+    # --- PhishingMixin ---
+    async def get_phishing_categories(self) -> List[Dict[str, Any]] | None:
+        return await self._get_json(
+            "/phishing/categories", "피싱 유형 목록 조회 실패", timeout=5
+        )
+
+    async def get_phishing_cases_page(
+        self, token: str, skip: int = 0, limit: int = 100
+    ) -> List[Dict[str, Any]] | None:
+        return await self._get_json(
+            "/phishing/cases",
+            f"피싱 사례 목록 페이지 조회 실패 (skip={skip})",
+            token=token,
+            params={"skip": skip, "limit": limit},
+        )
+
+    async def get_phishing_case_by_id(
+        self, token: str, case_id: int
+    ) -> Dict[str, Any] | None:
+        return await self._get_json(
+            f"/phishing/cases/{case_id}",
+            f"피싱 사례 상세 조회 실패 (ID: {case_id})",
+            token=token,
+            timeout=5,
+        )
+
+    # --- ConversationMixin ---
+    async def get_all_conversations_admin(
+        self, token: str, skip: int = 0, limit: int = 100
+    ) -> List[Dict[str, Any]] | None:
+        return await self._get_json(
+            "/admin/conversations",
+            "관리자용 대화방 목록 조회 실패",
+            token=token,
+            params={"skip": skip, "limit": limit},
+        )
+
+    async def get_messages_for_conversation_admin(
+        self, token: str, conversation_id: int
+    ) -> List[Dict[str, Any]] | None:
+        return await self._get_json(
+            f"/admin/conversations/{conversation_id}/messages",
+            "관리자용 메시지 목록 조회 실패",
+            token=token,
+        )
+
+    # --- StorageMixin ---
+    async def get_presigned_url_for_download(
+        self, token: str, object_key: str
+    ) -> str | None:
+        data = await self._get_json(
+            "/storage/presigned-url/download",
+            "다운로드용 Presigned URL 요청 실패",
+            token=token,
+            params={"object_key": object_key},
+        )
+        return data.get("url") if data else None
@@ -3,6 +3,8 @@ from typing import Any, Dict
 
 import requests
 
+from .cache import cached, invalidates
+
 
 class AuthMixin:
     """인증 및 초기 설정 관련 API 메서드"""
@@ -11,24 +13,26 @@ class AuthMixin:
         login_data = {"username": email, "password": password}
         url = f"{self.base_url}/auth/token"
         try:
-            response = requests.post(url, data=login_data, timeout=5)
+            response = self.session.post(url, data=login_data, timeout=5)
             response.raise_for_status()
             return response.json().get("access_token")
         except requests.exceptions.RequestException as e:
             print(f"API 로그인 요청 실패: {e}")
             return None
 
+    @cached("server", ttl=300)
     def get_server_version(self) -> Dict[str, Any] | None:
         """백엔드 서버의 버전 정보를 조회합니다."""
         url = f"{self.base_url.replace('/api/v1', '')}/version"
         try:
-            response = requests.get(url, timeout=3)
+            response = self.session.get(url, timeout=3)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
             print(f"서버 버전 조회 실패: {e}")
             return None
         
+    @cached("superuser", ttl=10)
     def check_superuser_exists(self) -> bool:
         """
         슈퍼유저 존재 여부를 확인합니다.
@@ -36,7 +40,7 @@ class AuthMixin:
         """
         url = f"{self.base_url}/admin/superuser-exists"
         try:
-            response = requests.get(url, timeout=5)
+            response = self.session.get(url, timeout=5)
             # HTTP 상태 코드가 2xx가 아니면 예외 발생
             response.raise_for_status()
             
@@ -50,13 +54,14 @@ class AuthMixin:
             print(f"API 통신 실패 (check_superuser_exists): {e}")
             raise e
 
+    @invalidates("superuser")
     def create_initial_superuser(
         self, email: str, password: str
     ) -> Dict[str, Any] | None:
         url = f"{self.base_url}/admin/initial-superuser"
         payload = {"email": email, "password": password}
         try:
-            response = requests.post(url, json=payload, timeout=5)
+            response = self.session.post(url, json=payload, timeout=5)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
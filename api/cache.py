@@ -0,0 +1,315 @@
+# api/cache.py
+import functools
+import inspect
+import os
+import threading
+import time
+from collections import Counter, OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Tuple
+
+# 캐시 키에서 제외할 인자 (관리자 세션마다 달라도 응답은 같으므로 세션 간에 공유합니다)
+_UNKEYED_ARGS = {"self", "token"}
+
+# 캐시에 보관할 최대 항목 수 (넘으면 가장 오래 쓰이지 않은 항목부터 제거)
+API_CACHE_MAX_ENTRIES = int(os.getenv("API_CACHE_MAX_ENTRIES", "2048"))
+
+
+class TaggedCache:
+    """
+    태그 단위로 무효화할 수 있는 프로세스 공용 조회 캐시.
+    각 항목은 하나 이상의 태그(users, personas, urls:<key> 등)를 가지며,
+    변경 작업은 자신이 영향을 주는 태그만 무효화합니다.
+    항목 수가 max_entries를 넘으면 가장 오래 쓰이지 않은 항목부터 제거하고,
+    만료된 항목은 저장할 때 default_ttl 간격으로 한꺼번에 정리합니다.
+    반환된 값은 모든 세션이 공유하므로 읽기 전용으로 다뤄야 합니다.
+    (목록 항목은 write_through가 복사하지 않고 제자리에서 갱신합니다.)
+    """
+
+    def __init__(
+        self, default_ttl: float = 60, max_entries: int = API_CACHE_MAX_ENTRIES
+    ):
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        # 최근에 쓰인 항목일수록 뒤에 있습니다.
+        self._entries: OrderedDict[Hashable, Tuple[Any, float, frozenset]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._last_sweep = time.time()
+        self._listeners: List[Tuple[str, Callable[[str], None]]] = []
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations: Counter = Counter()
+        self.write_throughs: Counter = Counter()
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] <= time.time():
+                self._entries.pop(key, None)
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[0]
+
+    def _store(self, key: Hashable, entry: Tuple[Any, float, frozenset]) -> None:
+        """잠금을 쥔 상태에서 항목을 저장하고, 만료/초과 항목을 정리합니다."""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        now = time.time()
+        if now - self._last_sweep >= self.default_ttl:
+            self._last_sweep = now
+            for expired_key in [
+                k
+                for k, (_, expires_at, _) in self._entries.items()
+                if expires_at <= now
+            ]:
+                del self._entries[expired_key]
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        tags: Iterable[str],
+        ttl: float | None = None,
+    ) -> None:
+        expires_at = time.time() + (self.default_ttl if ttl is None else ttl)
+        with self._lock:
+            self._store(key, (value, expires_at, frozenset(tags)))
+
+    def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Any],
+        tags: Iterable[str],
+        ttl: float | None = None,
+    ) -> Any:
+        """캐시에 값이 없으면 loader로 불러와 저장합니다. None은 저장하지 않습니다."""
+        hit, value = self.get(key)
+        if hit:
+            return value
+        value = loader()
+        if value is not None:
+            self.set(key, value, tags, ttl)
+        return value
+
+    def invalidate(self, *tags: str) -> int:
+        """주어진 태그가 붙은 항목을 제거하고, 제거한 항목 수를 반환합니다."""
+        tag_set = set(tags)
+        with self._lock:
+            keys = [k for k, (_, _, t) in self._entries.items() if t & tag_set]
+            for key in keys:
+                del self._entries[key]
+            for tag in tag_set:
+                self.invalidations[tag] += 1
+            listeners = list(self._listeners)
+        for tag in tag_set:
+            for prefix, callback in listeners:
+                if tag.startswith(prefix):
+                    callback(tag)
+        return len(keys)
+
+    def write_through(
+        self,
+        tag: str,
+        record: Dict[str, Any] | None = None,
+        deleted_id: Any = None,
+    ) -> None:
+        """
+        변경 결과를 태그가 붙은 캐시 항목에 직접 반영합니다.
+        record가 있으면 id 기준으로 교체(없으면 추가)하고, deleted_id가 있으면 제거합니다.
+        전체 목록(list)과 해당 단일 객체(dict)만 갱신하며,
+        빈 목록이나 페이지((items, total)) 등 그 밖의 형태는 무효화합니다.
+        목록은 대량 생성 시에도 항목마다 전체를 복사하지 않도록 제자리에서 고치고,
+        목록 안의 객체와 단일 객체는 새 dict로 바꿔 넣습니다.
+        """
+        target_id = record["id"] if record is not None else deleted_id
+        with self._lock:
+            for key, (value, expires_at, tags) in list(self._entries.items()):
+                if tag not in tags:
+                    continue
+                patched = _patch_value(value, target_id, record)
+                if patched is _UNPATCHABLE:
+                    del self._entries[key]
+                else:
+                    self._entries[key] = (patched, expires_at, tags)
+            self.write_throughs[tag] += 1
+
+    def subscribe(self, prefix: str, callback: Callable[[str], None]) -> None:
+        """prefix로 시작하는 태그가 무효화될 때 callback(tag)을 호출합니다."""
+        with self._lock:
+            self._listeners.append((prefix, callback))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "evictions": self.evictions,
+                "invalidations": dict(self.invalidations),
+                "write_throughs": dict(self.write_throughs),
+            }
+
+
+def _is_error_payload(result: Any) -> bool:
+    """API 메서드가 실패 시 돌려주는 서버 오류 응답({"detail": ...})인지 확인합니다."""
+    return isinstance(result, dict) and "detail" in result and "id" not in result
+
+
+# 캐시 항목에 변경 내용을 반영할 수 없음을 나타내는 표식
+_UNPATCHABLE = object()
+
+
+def _is_record_list(value: Any) -> bool:
+    """
+    id를 가진 객체의 목록인지 확인합니다. (첫 항목으로 판단)
+    빈 목록은 어떤 목록인지 알 수 없으므로 해당하지 않습니다.
+    """
+    return (
+        isinstance(value, list)
+        and bool(value)
+        and isinstance(value[0], dict)
+        and "id" in value[0]
+    )
+
+
+def _patch_records(
+    records: list, target_id: Any, record: Dict[str, Any] | None
+) -> bool:
+    """id가 같은 항목을 제자리에서 교체/제거하고, 대상이 있었는지 여부를 반환합니다."""
+    for position, item in enumerate(records):
+        if isinstance(item, dict) and item.get("id") == target_id:
+            if record is None:
+                del records[position]
+            else:
+                # 서버 응답에 없는 필드는 기존 값을 유지합니다.
+                records[position] = {**item, **record}
+            return True
+    return False
+
+
+def _patch_value(value: Any, target_id: Any, record: Dict[str, Any] | None) -> Any:
+    """
+    전체 목록과 대상 객체에만 변경 내용을 반영합니다.
+    검색/정렬 조건이 있는 (items, total) 페이지는 수정으로 조건 충족 여부나 순서가,
+    삭제로 페이지 경계가 바뀔 수 있으므로 고치지 않고 무효화합니다.
+    """
+    if _is_record_list(value):
+        if not _patch_records(value, target_id, record) and record is not None:
+            value.append(record)
+        return value
+    if isinstance(value, dict) and "id" in value:
+        if value["id"] != target_id:
+            return value
+        return {**value, **record} if record is not None else _UNPATCHABLE
+    return _UNPATCHABLE
+
+
+def method_cache_key(method_name: str, **arguments: Any) -> Tuple:
+    """@cached 메서드가 사용하는 캐시 키를 만듭니다. (인자는 선언 순서대로 전달)"""
+    return (method_name,) + tuple(arguments.items())
+
+
+def _bound_arguments(signature, self, args, kwargs) -> Dict[str, Any]:
+    bound = signature.bind(self, *args, **kwargs)
+    bound.apply_defaults()
+    return dict(bound.arguments)
+
+
+def cached(*tags: str, ttl: float | None = None):
+    """
+    ApiClient의 조회 메서드 결과를 self.cache에 태그와 함께 저장하는 데코레이터.
+    태그에는 "urls:{object_key}"처럼 메서드 인자를 넣을 수 있습니다.
+    """
+
+    def decorator(method):
+        signature = inspect.signature(method)
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            arguments = _bound_arguments(signature, self, args, kwargs)
+            key = method_cache_key(
+                method.__name__,
+                **{
+                    name: value
+                    for name, value in arguments.items()
+                    if name not in _UNKEYED_ARGS
+                },
+            )
+            try:
+                hash(key)
+            except TypeError:
+                return method(self, *args, **kwargs)
+            return self.cache.get_or_load(
+                key,
+                lambda: method(self, *args, **kwargs),
+                tags=[tag.format(**arguments) for tag in tags],
+                ttl=ttl,
+            )
+
+        return wrapper
+
+    return decorator
+
+
+def invalidates(*tags: str):
+    """
+    변경 메서드가 성공(오류 응답이 아닌 참인 값을 반환)하면
+    해당 태그의 캐시만 무효화하는 데코레이터.
+    태그에는 "urls:{object_key}"처럼 메서드 인자를 넣을 수 있습니다.
+    """
+
+    def decorator(method):
+        signature = inspect.signature(method)
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            result = method(self, *args, **kwargs)
+            if result and not _is_error_payload(result):
+                arguments = _bound_arguments(signature, self, args, kwargs)
+                self.cache.invalidate(*(tag.format(**arguments) for tag in tags))
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def writes_through(tag: str, deleted_id_arg: str | None = None):
+    """
+    변경 메서드의 결과를 캐시된 목록에 바로 반영하는 데코레이터. (전체 재조회 방지)
+    생성/수정 메서드는 서버가 돌려준 객체(id 포함)로 항목을 교체하거나 추가하고,
+    삭제 메서드는 deleted_id_arg로 지정한 인자의 id를 목록에서 제거합니다.
+    결과로 객체를 받지 못하면 해당 태그를 무효화하고, 실패(오류 응답)하면 캐시를 그대로 둡니다.
+    """
+
+    def decorator(method):
+        signature = inspect.signature(method)
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            result = method(self, *args, **kwargs)
+            if not result or _is_error_payload(result):
+                return result
+            if deleted_id_arg is not None:
+                arguments = _bound_arguments(signature, self, args, kwargs)
+                self.cache.write_through(tag, deleted_id=arguments[deleted_id_arg])
+            elif isinstance(result, dict) and "id" in result:
+                self.cache.write_through(tag, record=result)
+            else:
+                self.cache.invalidate(tag)
+            return result
+
+        return wrapper
+
+    return decorator
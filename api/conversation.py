@@ -1,13 +1,23 @@
 # api/conversation.py
-from typing import Any, Dict, List
+import os
+import time
+from typing import Any, Dict, Iterator, List
 
 import requests
 
+from .cache import cached, invalidates
+from .paging import PageGuard
+from .streaming import MessageStream, iter_stream_events
+
+# 스트리밍 API가 없다고 판단한 뒤 다시 확인하기까지의 시간(초)
+MESSAGE_STREAMING_REPROBE_SEC = int(os.getenv("MESSAGE_STREAMING_REPROBE_SEC", "300"))
+
 
 class ConversationMixin:
     """대화방 및 메시지 관련 API 메서드"""
 
     # ✅ [추가] 특정 카테고리(DB 우선)로 대화방을 생성하는 관리자용 API 함수
+    @invalidates("conversations")
     def create_conversation_with_category_admin(
         self,
         token: str,
@@ -25,7 +35,7 @@ class ConversationMixin:
             "title": title,
         }
         try:
-            response = requests.post(
+            response = self.session.post(
                 url, headers=headers, json=payload, timeout=20
             )  # AI 생성 가능성으로 타임아웃 증가
             response.raise_for_status()
@@ -35,6 +45,7 @@ class ConversationMixin:
             return self._handle_error_response(e)
 
     # ✅ [추가] 특정 카테고리(AI 생성)로 대화방을 생성하는 관리자용 API 함수
+    @invalidates("conversations")
     def create_conversation_with_ai_case_admin(
         self,
         token: str,
@@ -52,7 +63,7 @@ class ConversationMixin:
             "title": title,
         }
         try:
-            response = requests.post(
+            response = self.session.post(
                 url, headers=headers, json=payload, timeout=20
             )  # AI 생성 타임아웃 증가
             response.raise_for_status()
@@ -61,6 +72,7 @@ class ConversationMixin:
             print(f"관리자용 대화방(AI 생성) 생성 실패: {e}")
             return self._handle_error_response(e)
 
+    @invalidates("conversations")
     def create_conversation(
         self, token: str, persona_id: int, title: str | None
     ) -> Dict[str, Any] | None:
@@ -70,13 +82,14 @@ class ConversationMixin:
         if title:
             payload["title"] = title
         try:
-            response = requests.post(url, headers=headers, json=payload, timeout=5)
+            response = self.session.post(url, headers=headers, json=payload, timeout=5)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
             print(f"대화방 생성 실패: {e}")
             return None
 
+    @invalidates("conversations")
     def create_conversation_admin(
         self, token: str, user_id: int, persona_id: int, title: str | None
     ) -> Dict[str, Any] | None:
@@ -84,7 +97,7 @@ class ConversationMixin:
         url = f"{self.base_url}/admin/conversations"
         payload = {"user_id": user_id, "persona_id": persona_id, "title": title}
         try:
-            response = requests.post(url, headers=headers, json=payload, timeout=10)
+            response = self.session.post(url, headers=headers, json=payload, timeout=10)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -96,6 +109,7 @@ class ConversationMixin:
                     return {"detail": e.response.text}
             return None
 
+    @cached("conversations", ttl=30)
     def get_all_conversations_admin(
         self, token: str, skip: int = 0, limit: int = 100
     ) -> List[Dict[str, Any]] | None:
@@ -103,31 +117,86 @@ class ConversationMixin:
         url = f"{self.base_url}/admin/conversations"
         params = {"skip": skip, "limit": limit}
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=10)
+            response = self.session.get(url, headers=headers, params=params, timeout=10)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
             print(f"관리자용 대화방 목록 조회 실패: {e}")
             return None
 
+    def iter_conversations_admin(
+        self, token: str, page_size: int = 100, start: int = 0
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        관리자용 대화방 목록을 skip/limit 페이지 단위로 순차 조회하는 제너레이터입니다.
+        페이지(리스트)를 받는 즉시 반환하며, 빈 페이지를 받으면 종료합니다.
+        (백엔드가 limit을 page_size보다 작게 제한할 수 있으므로 짧은 페이지에서 멈추지 않습니다.)
+        skip을 무시해 같은 페이지가 반복되면 PageGuard가 순회를 멈춥니다.
+        통신 실패 시 RequestException을 발생시킵니다.
+        """
+        headers = {"Authorization": f"Bearer {token}"}
+        url = f"{self.base_url}/admin/conversations"
+        guard = PageGuard("관리자용 대화방 목록")
+        skip = start
+        while True:
+            params = {"skip": skip, "limit": page_size}
+            try:
+                response = self.session.get(
+                    url, headers=headers, params=params, timeout=10
+                )
+                response.raise_for_status()
+            except requests.exceptions.RequestException as e:
+                print(f"관리자용 대화방 목록 페이지 조회 실패 (skip={skip}): {e}")
+                raise
+            page = response.json()
+            if not page or not guard.accept(page):
+                return
+            yield page
+            skip += len(page)
+
     def get_messages_for_conversation_admin(
         self, token: str, conversation_id: int
     ) -> List[Dict[str, Any]] | None:
         headers = {"Authorization": f"Bearer {token}"}
         url = f"{self.base_url}/admin/conversations/{conversation_id}/messages"
         try:
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self.session.get(url, headers=headers, timeout=10)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
             print(f"관리자용 메시지 목록 조회 실패: {e}")
             return None
 
+    def get_messages_since(
+        self, token: str, conversation_id: int, after_id: int | None
+    ) -> List[Dict[str, Any]] | None:
+        """
+        after_id 이후에 추가된 메시지만 조회합니다. (after_id가 None이면 전체 기록)
+        백엔드가 after_id 파라미터를 지원하지 않아 전체 기록을 돌려주면,
+        ID를 비교하여 새 메시지만 골라 반환합니다.
+        """
+        headers = {"Authorization": f"Bearer {token}"}
+        url = f"{self.base_url}/admin/conversations/{conversation_id}/messages"
+        params = {"after_id": after_id} if after_id is not None else None
+        try:
+            response = self.session.get(
+                url, headers=headers, params=params, timeout=10
+            )
+            response.raise_for_status()
+            messages = response.json()
+        except requests.exceptions.RequestException as e:
+            print(f"관리자용 새 메시지 조회 실패: {e}")
+            return None
+        if after_id is None:
+            return messages
+        return [msg for msg in messages if msg["id"] > after_id]
+
+    @invalidates("conversations")
     def delete_conversation_admin(self, token: str, conversation_id: int) -> bool:
         headers = {"Authorization": f"Bearer {token}"}
         url = f"{self.base_url}/admin/conversations/{conversation_id}"
         try:
-            response = requests.delete(url, headers=headers, timeout=10)
+            response = self.session.delete(url, headers=headers, timeout=10)
             response.raise_for_status()
             return True
         except requests.exceptions.RequestException as e:
@@ -140,7 +209,15 @@ class ConversationMixin:
         conversation_id: int,
         content: str,
         image_base64: str | None = None,
+        image: bytes | None = None,
+        image_content_type: str = "image/webp",
+        image_uploads: Dict[str, str] | None = None,
     ) -> Dict[str, Any] | None:
+        """
+        메시지를 전송하고 AI 응답을 반환합니다.
+        image(바이트)를 주면 IMAGE_TRANSPORT 설정에 따라 object_key/multipart로 전송합니다.
+        image_uploads는 이미 업로드한 object_key를 재사용하기 위한 것입니다. (_post_with_image 참고)
+        """
         headers = {"Authorization": f"Bearer {token}"}
         url = f"{self.base_url}/conversations/{conversation_id}/messages/"
 
@@ -151,13 +228,111 @@ class ConversationMixin:
 
         try:
             # 이미지 데이터는 클 수 있으므로 timeout을 60초로 늘립니다.
-            response = requests.post(url, headers=headers, json=payload, timeout=60)
+            if image is not None:
+                response = self._post_with_image(
+                    token,
+                    url,
+                    payload,
+                    image,
+                    image_content_type,
+                    "messages",
+                    uploads=image_uploads,
+                    timeout=60,
+                )
+            else:
+                response = self.session.post(
+                    url, headers=headers, json=payload, timeout=60
+                )
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
             print(f"메시지 전송 실패: {e}")
             return None
 
+    def stream_message(
+        self,
+        token: str,
+        conversation_id: int,
+        content: str,
+        image_base64: str | None = None,
+        image: bytes | None = None,
+        image_content_type: str = "image/webp",
+    ) -> MessageStream | None:
+        """
+        메시지를 전송하고 AI 응답을 토큰 단위로 받는 MessageStream을 반환합니다.
+        백엔드에 스트리밍 API가 없으면 send_message의 일반 응답을 MessageStream으로 감싸 반환합니다.
+        image는 send_message와 같은 방식으로 전송하며, 일반 전송으로 대체할 때는
+        스트리밍 요청에서 업로드한 이미지를 다시 올리지 않습니다.
+        """
+        started_at = time.perf_counter()
+        image_uploads: Dict[str, str] = {}
+        if self._message_streaming_available():
+            headers = {
+                "Authorization": f"Bearer {token}",
+                "Accept": "text/event-stream",
+            }
+            url = f"{self.base_url}/conversations/{conversation_id}/messages/stream"
+            payload = {"content": content}
+            if image_base64:
+                payload["image_base64"] = image_base64
+            try:
+                # 연결은 10초, 토큰 사이의 대기는 최대 60초까지 기다립니다.
+                if image is not None:
+                    response = self._post_with_image(
+                        token,
+                        url,
+                        payload,
+                        image,
+                        image_content_type,
+                        "messages",
+                        headers={"Accept": "text/event-stream"},
+                        uploads=image_uploads,
+                        stream=True,
+                        timeout=(10, 60),
+                    )
+                else:
+                    response = self.session.post(
+                        url,
+                        headers=headers,
+                        json=payload,
+                        stream=True,
+                        timeout=(10, 60),
+                    )
+                if response.status_code in (404, 405):
+                    response.close()
+                    print("스트리밍 API가 없어 일반 메시지 전송으로 대체합니다.")
+                    self._message_streaming_unsupported_at = time.time()
+                else:
+                    response.raise_for_status()
+                    self._message_streaming_unsupported_at = None
+                    return MessageStream(iter_stream_events(response), started_at)
+            except requests.exceptions.RequestException as e:
+                print(f"메시지 전송(스트리밍) 실패: {e}")
+                return None
+
+        response_data = self.send_message(
+            token,
+            conversation_id,
+            content,
+            image_base64,
+            image,
+            image_content_type,
+            image_uploads=image_uploads,
+        )
+        if response_data is None:
+            return None
+        return MessageStream(
+            iter([("done", response_data)]), started_at, streamed=False
+        )
+
+    def _message_streaming_available(self) -> bool:
+        """스트리밍 API가 없다고 판단한 지 MESSAGE_STREAMING_REPROBE_SEC가 지나면 다시 시도합니다."""
+        unsupported_at = self._message_streaming_unsupported_at
+        return (
+            unsupported_at is None
+            or time.time() - unsupported_at >= MESSAGE_STREAMING_REPROBE_SEC
+        )
+
     # 헬퍼 함수 추가 (에러 응답 공통 처리)
     def _handle_error_response(self, e: requests.exceptions.RequestException):
         if e.response:
@@ -0,0 +1,204 @@
+# api/image_transport.py
+import base64
+import mimetypes
+import os
+import re
+import time
+import uuid
+from typing import Any, Dict, List
+from urllib.parse import urlparse
+
+import requests
+
+# 메시지/분석 요청에 이미지를 싣는 방식
+# - object_key: Presigned URL로 S3에 먼저 올리고 object_key만 전송
+# - multipart: multipart/form-data로 이미지 바이트를 그대로 전송
+# - base64: JSON 본문에 Base64 문자열로 포함 (기존 방식)
+IMAGE_TRANSPORT = os.getenv("IMAGE_TRANSPORT", "base64")
+IMAGE_TRANSPORT_MODES = ["object_key", "multipart", "base64"]
+
+# 지원하지 않는 것으로 확인된 방식을 다시 시도하기까지의 시간(초)
+IMAGE_TRANSPORT_RETRY_SEC = int(os.getenv("IMAGE_TRANSPORT_RETRY_SEC", "600"))
+
+# 방식별로 백엔드가 알아야 하는 요청 필드
+_TRANSPORT_FIELDS = {"object_key": "image_key", "multipart": "image"}
+
+
+def _find_operation(schema: Dict[str, Any], url: str) -> Dict[str, Any] | None:
+    """OpenAPI 스키마에서 url 경로에 해당하는 POST 작업을 찾습니다."""
+    path = urlparse(url).path
+    for template, operations in (schema.get("paths") or {}).items():
+        # "/conversations/{conversation_id}/messages" 같은 경로 템플릿을 정규식으로 바꿉니다.
+        pattern = re.sub(r"\\\{[^/]+?\\\}", "[^/]+", re.escape(template))
+        if re.search(pattern + "$", path) and isinstance(operations, dict):
+            return operations.get("post")
+    return None
+
+
+def _declares_image_key(schema: Dict[str, Any], url: str) -> bool:
+    """url의 POST 요청 본문(JSON)에 image_key 필드가 선언되어 있는지 확인합니다."""
+    operation = _find_operation(schema, url)
+    if not operation:
+        return False
+    content = (operation.get("requestBody") or {}).get("content") or {}
+    body = (content.get("application/json") or {}).get("schema") or {}
+    ref = body.get("$ref", "")
+    if ref.startswith("#/components/schemas/"):
+        name = ref.rsplit("/", 1)[-1]
+        body = ((schema.get("components") or {}).get("schemas") or {}).get(name) or {}
+    return "image_key" in (body.get("properties") or {})
+
+
+def _is_transport_unsupported(response: requests.Response, mode: str) -> bool:
+    """
+    백엔드가 이 방식의 요청 본문을 처리하지 못한다고 응답했는지 확인합니다.
+    415는 항상 해당하며, 422(FastAPI 검증 오류)는 본문 전체가 잘못되었거나
+    이 방식의 필드(image_key/image) 또는 image_base64가 문제로 지목된 경우만 해당합니다.
+    (그 밖의 422는 요청 내용의 문제이므로 다른 방식으로 다시 보내지 않습니다.)
+    """
+    if response.status_code == 415:
+        return True
+    if response.status_code != 422:
+        return False
+    try:
+        errors = response.json().get("detail")
+    except (ValueError, AttributeError):
+        return False
+    if not isinstance(errors, list):
+        return False
+    fields = {_TRANSPORT_FIELDS[mode], "image_base64"}
+    for error in errors:
+        loc = error.get("loc") if isinstance(error, dict) else None
+        if not loc:
+            continue
+        if list(loc) == ["body"] or loc[-1] in fields:
+            return True
+    return False
+
+
+class ImageTransportMixin:
+    """이미지가 포함된 요청을 설정된 방식으로 보내는 메서드"""
+
+    def _image_transport_modes(self) -> List[str]:
+        """
+        설정된 방식부터 시도하되, 지원되지 않는 것으로 확인된 방식은
+        IMAGE_TRANSPORT_RETRY_SEC 동안 건너뜁니다. (백엔드가 배포되면 다시 시도)
+        """
+        if IMAGE_TRANSPORT not in IMAGE_TRANSPORT_MODES:
+            return ["base64"]
+        start = IMAGE_TRANSPORT_MODES.index(IMAGE_TRANSPORT)
+        now = time.time()
+        return [
+            mode
+            for mode in IMAGE_TRANSPORT_MODES[start:]
+            if mode == "base64"
+            or now - self._image_transport_unsupported_at.get(mode, 0)
+            >= IMAGE_TRANSPORT_RETRY_SEC
+        ]
+
+    def _get_api_schema(self) -> Dict[str, Any] | None:
+        """
+        백엔드의 OpenAPI 스키마(/openapi.json)를 조회합니다. 실패하면 None을 반환합니다.
+        결과(실패 포함)는 IMAGE_TRANSPORT_RETRY_SEC 동안 재사용합니다.
+        """
+        cached_schema = self._api_schema
+        if cached_schema and time.time() - cached_schema[0] < IMAGE_TRANSPORT_RETRY_SEC:
+            return cached_schema[1]
+        url = f"{self.base_url.replace('/api/v1', '')}/openapi.json"
+        try:
+            response = self.session.get(url, timeout=5)
+            response.raise_for_status()
+            schema = response.json()
+            if not isinstance(schema, dict):
+                schema = None
+        except requests.exceptions.RequestException as e:
+            print(f"API 스키마 조회 실패: {e}")
+            schema = None
+        self._api_schema = (time.time(), schema)
+        return schema
+
+    def _accepts_image_key(self, url: str) -> bool:
+        """
+        url이 object_key(image_key) 방식을 받는다고 스키마에 선언되어 있는지 확인합니다.
+        모르는 필드를 무시하는 백엔드는 image_key를 보내도 200을 돌려주고 이미지 없이
+        저장하므로, 선언이 확인된 경우에만 object_key 방식을 사용합니다.
+        """
+        schema = self._get_api_schema()
+        return schema is not None and _declares_image_key(schema, url)
+
+    def upload_image_object(
+        self, token: str, image: bytes, content_type: str, category: str
+    ) -> str | None:
+        """이미지를 Presigned URL로 S3에 올리고 object_key를 반환합니다."""
+        extension = mimetypes.guess_extension(content_type) or ".bin"
+        return self.upload_file(
+            token, image, f"{uuid.uuid4().hex}{extension}", category, content_type
+        )
+
+    def _post_with_image(
+        self,
+        token: str,
+        url: str,
+        payload: Dict[str, Any],
+        image: bytes,
+        content_type: str,
+        category: str,
+        headers: Dict[str, str] | None = None,
+        uploads: Dict[str, str] | None = None,
+        **kwargs,
+    ) -> requests.Response:
+        """
+        payload에 이미지를 실어 POST 요청을 보냅니다.
+        object_key 방식은 API 스키마에 image_key가 선언된 요청에만 사용합니다.
+        object_key 업로드에 실패하거나 백엔드가 object_key/multipart 요청을 처리하지 못하면
+        다음 방식(multipart → base64)으로 다시 보내며, 이때 올려 둔 S3 객체는 삭제합니다.
+        같은 이미지를 여러 요청에 보낼 때는 같은 uploads(dict)를 넘기면
+        처음 업로드한 object_key를 다시 사용합니다.
+        """
+        headers = {"Authorization": f"Bearer {token}", **(headers or {})}
+        uploads = {} if uploads is None else uploads
+        for mode in self._image_transport_modes():
+            if mode == "object_key":
+                if not self._accepts_image_key(url):
+                    continue
+                object_key = uploads.get("object_key") or self.upload_image_object(
+                    token, image, content_type, category
+                )
+                if object_key is None:
+                    continue
+                uploads["object_key"] = object_key
+                response = self.session.post(
+                    url,
+                    headers=headers,
+                    json={**payload, "image_key": object_key},
+                    **kwargs,
+                )
+            elif mode == "multipart":
+                extension = mimetypes.guess_extension(content_type) or ""
+                response = self.session.post(
+                    url,
+                    headers=headers,
+                    data=payload,
+                    files={"image": (f"image{extension}", image, content_type)},
+                    **kwargs,
+                )
+            else:
+                image_base64 = base64.b64encode(image).decode("utf-8")
+                return self.session.post(
+                    url,
+                    headers=headers,
+                    json={**payload, "image_base64": image_base64},
+                    **kwargs,
+                )
+
+            if _is_transport_unsupported(response, mode):
+                response.close()
+                print(
+                    f"이미지 전송 방식({mode})을 지원하지 않아 다른 방식으로 대체합니다."
+                )
+                self._image_transport_unsupported_at[mode] = time.time()
+                if mode == "object_key":
+                    # 사용되지 않을 객체가 남지 않도록 삭제합니다.
+                    self.delete_s3_object(token, uploads.pop("object_key"))
+                continue
+            return response
@@ -0,0 +1,42 @@
+# api/paging.py
+import os
+from typing import Any, Dict, List
+
+# skip/limit 페이지 순회에서 한 번에 받을 수 있는 최대 페이지 수
+API_MAX_PAGES = int(os.getenv("API_MAX_PAGES", "10000"))
+
+
+class PageGuard:
+    """
+    skip/limit 페이지 순회가 끝나지 않는 것을 막는 검사기.
+    skip을 무시하는 백엔드는 같은 페이지를 계속 돌려주므로, 첫 항목의 id가 직전 페이지와 같거나
+    새로운 id가 하나도 없는 페이지를 받으면 순회를 멈추고, 페이지 수도 max_pages로 제한합니다.
+    """
+
+    def __init__(self, label: str, max_pages: int = API_MAX_PAGES):
+        self.label = label
+        self.max_pages = max_pages
+        self.pages = 0
+        self._seen_ids: set = set()
+        self._last_first_id: Any = None
+
+    def accept(self, page: List[Dict[str, Any]]) -> bool:
+        """page를 내보내도 되면 True, 반복된 페이지이거나 상한을 넘었으면 False를 반환합니다."""
+        self.pages += 1
+        if self.pages > self.max_pages:
+            print(f"{self.label}: 최대 페이지 수({self.max_pages})에 도달하여 중단합니다.")
+            return False
+        ids = [
+            record["id"]
+            for record in page
+            if isinstance(record, dict) and record.get("id") is not None
+        ]
+        if not ids:
+            return True
+        new_ids = set(ids) - self._seen_ids
+        if ids[0] == self._last_first_id or not new_ids:
+            print(f"{self.label}: 같은 페이지가 반복되어 중단합니다. (skip 미지원 백엔드)")
+            return False
+        self._seen_ids |= new_ids
+        self._last_first_id = ids[0]
+        return True
@@ -1,23 +1,61 @@
 # api/persona.py
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List
 
 import requests
 
+from .cache import cached, writes_through
+from .paging import PageGuard
+
 
 class PersonaMixin:
     """페르소나 관리 관련 API 메서드"""
 
+    @cached("personas")
     def get_personas(self, token: str) -> List[Dict[str, Any]] | None:
         headers = {"Authorization": f"Bearer {token}"}
         url = f"{self.base_url}/personas/"
         try:
-            response = requests.get(url, headers=headers, timeout=5)
+            response = self.session.get(url, headers=headers, timeout=5)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
             print(f"페르소나 목록 조회 실패: {e}")
             return None
 
+    def iter_personas(
+        self, token: str, page_size: int = 100
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        페르소나 목록을 skip/limit 페이지 단위로 순차 조회하는 제너레이터입니다.
+        page_size보다 짧은 페이지를 받으면 종료하며,
+        limit을 무시하고 전체 목록을 돌려주는 백엔드라면 첫 페이지만 반환합니다.
+        skip을 무시해 같은 페이지가 반복되면 PageGuard가 순회를 멈춥니다.
+        통신 실패 시 RequestException을 발생시킵니다.
+        """
+        headers = {"Authorization": f"Bearer {token}"}
+        url = f"{self.base_url}/personas/"
+        guard = PageGuard("페르소나 목록")
+        skip = 0
+        while True:
+            params = {"skip": skip, "limit": page_size}
+            try:
+                response = self.session.get(
+                    url, headers=headers, params=params, timeout=10
+                )
+                response.raise_for_status()
+            except requests.exceptions.RequestException as e:
+                print(f"페르소나 목록 페이지 조회 실패 (skip={skip}): {e}")
+                raise
+            page = response.json()
+            if not guard.accept(page):
+                return
+            if page:
+                yield page
+            if len(page) != page_size:
+                return
+            skip += len(page)
+
+    @writes_through("personas")
     def create_persona(
         self,
         token: str,
@@ -40,33 +78,44 @@ class PersonaMixin:
             "conversation_starters": conversation_starters,
         }
         try:
-            response = requests.post(url, headers=headers, json=payload, timeout=5)
+            response = self.session.post(url, headers=headers, json=payload, timeout=5)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
             print(f"페르소나 생성 실패: {e}")
             return None
 
+    @writes_through("personas", deleted_id_arg="persona_id")
     def delete_persona(self, token: str, persona_id: int) -> bool:
         headers = {"Authorization": f"Bearer {token}"}
         url = f"{self.base_url}/personas/{persona_id}"
         try:
-            response = requests.delete(url, headers=headers, timeout=10)
+            response = self.session.delete(url, headers=headers, timeout=10)
             response.raise_for_status()
             return True
         except requests.exceptions.RequestException as e:
             print(f"페르소나 삭제 실패: {e}")
             return False
 
+    @writes_through("personas")
     def update_persona(
         self, token: str, persona_id: int, update_data: Dict[str, Any]
-    ) -> bool:
+    ) -> Dict[str, Any] | None:
+        """
+        페르소나를 수정하고, 서버가 돌려준 페르소나 객체를 반환합니다.
+        캐시된 페르소나 목록에는 이 객체가 바로 반영됩니다.
+        """
         headers = {"Authorization": f"Bearer {token}"}
         url = f"{self.base_url}/personas/{persona_id}"
         try:
-            response = requests.put(url, headers=headers, json=update_data, timeout=10)
+            response = self.session.put(
+                url, headers=headers, json=update_data, timeout=10
+            )
             response.raise_for_status()
-            return True
+            # 응답 본문이 없는 백엔드라면 보낸 값으로 갱신된 객체를 구성합니다.
+            if not response.content:
+                return {"id": persona_id, **update_data}
+            return response.json()
         except requests.exceptions.RequestException as e:
             print(f"페르소나 업데이트 실패: {e}")
-            return False
\ No newline at end of file
+            return None
\ No newline at end of file
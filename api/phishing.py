@@ -1,79 +1,187 @@
 # api/phishing.py
+import hashlib
 import json
-from typing import Any, Dict, List
+import os
+import sqlite3
+from typing import Any, Dict, Iterator, List
 
 import requests
 
+from .cache import cached, writes_through
+from .paging import PageGuard
+
+# 피싱 사례 목록을 나눠 받을 페이지 크기와 동시에 요청할 페이지 수
+PHISHING_PAGE_SIZE = int(os.getenv("PHISHING_PAGE_SIZE", "100"))
+PHISHING_FETCH_CONCURRENCY = int(os.getenv("PHISHING_FETCH_CONCURRENCY", "4"))
+# 사례 상세(ID별) 캐시 유지 시간(초)
+PHISHING_CASE_TTL = 300
+# 목록에서 받은 사례의 ID별 색인({id: 사례})을 보관하는 캐시 키
+# (사례마다 항목을 만들면 공용 캐시의 상한을 채워 다른 조회 결과를 밀어내므로 하나로 보관합니다)
+_PHISHING_CASE_INDEX_KEY = ("phishing_case_index",)
+
 
 class PhishingMixin:
     """피싱 정보 관련 API 메서드"""
 
+    @cached("categories", ttl=300)
     def get_phishing_categories(self) -> List[Dict[str, Any]] | None:
         url = f"{self.base_url}/phishing/categories"
         try:
-            response = requests.get(url, timeout=5)
+            response = self.session.get(url, timeout=5)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
             print(f"피싱 유형 목록 조회 실패: {e}")
             return None
 
+    @cached("phishing_cases")
     def get_all_phishing_cases(self, token: str) -> List[Dict[str, Any]] | None:
+        """
+        모든 피싱 사례를 페이지 단위로 동시에 받아 하나의 목록으로 반환합니다.
+        받은 사례는 ID별 색인에도 담겨 get_phishing_case_by_id가 바로 반환합니다.
+        """
+        try:
+            return [
+                case
+                for page in self.iter_phishing_cases(
+                    token, concurrency=PHISHING_FETCH_CONCURRENCY
+                )
+                for case in page
+            ]
+        except requests.exceptions.RequestException as e:
+            print(f"피싱 사례 목록 조회 실패: {e}")
+            return None
+
+    def iter_phishing_cases(
+        self,
+        token: str,
+        page_size: int = PHISHING_PAGE_SIZE,
+        concurrency: int = 1,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        피싱 사례 목록을 skip/limit 페이지 단위로 조회하는 제너레이터입니다.
+        concurrency가 2 이상이면 다음 페이지 여러 개를 HTTP/2로 동시에 요청하고,
+        순서대로 반환합니다. page_size보다 짧은 페이지를 받으면 종료합니다.
+        받은 사례는 ID별 색인(캐시 항목 하나)에도 저장합니다.
+        skip을 무시해 같은 페이지가 반복되면 PageGuard가 순회를 멈춥니다.
+        통신 실패 시 RequestException을 발생시킵니다.
+        """
+        guard = PageGuard("피싱 사례 목록")
+        index: Dict[int, Dict[str, Any]] = {}
+        skip = 0
+        while True:
+            if concurrency > 1:
+                aio = self.aio
+                skips = [skip + i * page_size for i in range(concurrency)]
+                pages = aio.gather(
+                    *(aio.get_phishing_cases_page(token, s, page_size) for s in skips)
+                )
+            else:
+                pages = [self._fetch_phishing_cases_page(token, skip, page_size)]
+
+            for page in pages:
+                if page is None:
+                    raise requests.exceptions.RequestException(
+                        f"피싱 사례 목록 페이지 조회 실패 (skip={skip})"
+                    )
+                if not guard.accept(page):
+                    return
+                self._index_phishing_cases(index, page)
+                if page:
+                    yield page
+                # limit을 무시하고 전체 목록을 돌려주는 백엔드도 여기서 끝납니다.
+                if len(page) != page_size:
+                    return
+                skip += len(page)
+
+    def _fetch_phishing_cases_page(
+        self, token: str, skip: int, limit: int
+    ) -> List[Dict[str, Any]] | None:
         headers = {"Authorization": f"Bearer {token}"}
-        url = f"{self.base_url}/phishing/cases?limit=200"
+        url = f"{self.base_url}/phishing/cases"
+        params = {"skip": skip, "limit": limit}
         try:
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self.session.get(url, headers=headers, params=params, timeout=10)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
-            print(f"피싱 사례 목록 조회 실패: {e}")
+            print(f"피싱 사례 목록 페이지 조회 실패 (skip={skip}): {e}")
             return None
 
+    def _index_phishing_cases(
+        self, index: Dict[int, Dict[str, Any]], cases: List[Dict[str, Any]]
+    ) -> None:
+        """
+        목록에서 받은 사례를 ID별 색인에 추가하고, 색인을 캐시 항목 하나로 저장합니다.
+        phishing_cases 태그가 붙어 있으므로 사례가 변경되면 목록과 함께 무효화됩니다.
+        """
+        index.update((case["id"], case) for case in cases)
+        self.cache.set(
+            _PHISHING_CASE_INDEX_KEY,
+            index,
+            tags=["phishing_cases"],
+            ttl=PHISHING_CASE_TTL,
+        )
+
+    @writes_through("phishing_cases")
     def create_phishing_case(
         self, token: str, case_data: Dict[str, Any]
     ) -> Dict[str, Any] | None:
         headers = {"Authorization": f"Bearer {token}"}
         url = f"{self.base_url}/admin/phishing-cases"
         try:
-            response = requests.post(url, headers=headers, json=case_data, timeout=10)
+            response = self.session.post(
+                url, headers=headers, json=case_data, timeout=10
+            )
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
             print(f"피싱 사례 생성 실패: {e}")
             return e.response.json() if e.response else None
 
+    @writes_through("phishing_cases")
     def update_phishing_case(
         self, token: str, case_id: int, case_data: Dict[str, Any]
     ) -> Dict[str, Any] | None:
         headers = {"Authorization": f"Bearer {token}"}
         url = f"{self.base_url}/admin/phishing-cases/{case_id}"
         try:
-            response = requests.put(url, headers=headers, json=case_data, timeout=10)
+            response = self.session.put(
+                url, headers=headers, json=case_data, timeout=10
+            )
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
             print(f"피싱 사례 수정 실패: {e}")
             return e.response.json() if e.response else None
 
+    @writes_through("phishing_cases", deleted_id_arg="case_id")
     def delete_phishing_case(self, token: str, case_id: int) -> bool:
         headers = {"Authorization": f"Bearer {token}"}
         url = f"{self.base_url}/admin/phishing-cases/{case_id}"
         try:
-            response = requests.delete(url, headers=headers, timeout=10)
+            response = self.session.delete(url, headers=headers, timeout=10)
             response.raise_for_status()
             return True
         except requests.exceptions.RequestException as e:
             print(f"피싱 사례 삭제 실패: {e}")
             return False
 
+    @cached("phishing_cases", ttl=PHISHING_CASE_TTL)
     def get_phishing_case_by_id(
         self, token: str, case_id: int
     ) -> Dict[str, Any] | None:
-        """ID를 사용하여 특정 피싱 사례의 상세 정보를 조회합니다."""
+        """
+        ID를 사용하여 특정 피싱 사례의 상세 정보를 조회합니다.
+        목록 조회로 이미 받은 사례는 요청 없이 ID별 색인에서 반환합니다.
+        """
+        hit, index = self.cache.get(_PHISHING_CASE_INDEX_KEY)
+        if hit and case_id in index:
+            return index[case_id]
         headers = {"Authorization": f"Bearer {token}"}
         url = f"{self.base_url}/phishing/cases/{case_id}"
         try:
-            response = requests.get(url, headers=headers, timeout=5)
+            response = self.session.get(url, headers=headers, timeout=5)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -81,15 +189,30 @@ class PhishingMixin:
             return None
 
     def analyze_image_for_phishing(
-        self, token: str, image_base64: str
+        self,
+        token: str,
+        image_base64: str | None = None,
+        image: bytes | None = None,
+        image_content_type: str = "image/webp",
     ) -> Dict[str, Any] | None:
-        """Base64로 인코딩된 이미지를 전송하여 피싱 위험도 분석을 요청합니다."""
+        """
+        이미지를 전송하여 피싱 위험도 분석을 요청합니다.
+        Base64 문자열 대신 image(바이트)를 주면 IMAGE_TRANSPORT 설정에 따라
+        object_key/multipart로 전송합니다.
+        """
         headers = {"Authorization": f"Bearer {token}"}
         url = f"{self.base_url}/phishing/analyze-image"
-        payload = {"image_base64": image_base64}
         try:
             # 이미지 분석은 시간이 걸릴 수 있으므로 timeout을 넉넉하게 설정
-            response = requests.post(url, headers=headers, json=payload, timeout=90)
+            if image is not None:
+                response = self._post_with_image(
+                    token, url, {}, image, image_content_type, "analysis", timeout=90
+                )
+            else:
+                payload = {"image_base64": image_base64}
+                response = self.session.post(
+                    url, headers=headers, json=payload, timeout=90
+                )
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -101,3 +224,45 @@ class PhishingMixin:
                 except json.JSONDecodeError:
                     return {"detail": e.response.text}
             return None
+
+    def analyze_image(
+        self,
+        token: str,
+        image_bytes: bytes,
+        content_type: str = "image/webp",
+        force: bool = False,
+    ) -> Dict[str, Any] | None:
+        """
+        이미지의 피싱 위험도를 분석합니다.
+        같은 이미지(내용 해시 기준)의 분석 결과가 캐시에 있으면 바로 반환하고,
+        force=True이면 캐시를 무시하고 다시 분석합니다.
+        캐시에서 반환한 결과에는 "cached": True가 포함됩니다.
+        점수(phishing_score)가 있는 결과만 캐시하며, 캐시 오류는 분석 결과에 영향을 주지 않습니다.
+        """
+        if not force:
+            cached_result = self.get_cached_image_analysis(image_bytes)
+            if cached_result is not None:
+                return cached_result
+
+        result = self.analyze_image_for_phishing(
+            token=token, image=image_bytes, image_content_type=content_type
+        )
+        if result and result.get("phishing_score") is not None:
+            try:
+                self.analysis_cache.set(hashlib.sha256(image_bytes).hexdigest(), result)
+            except sqlite3.Error as e:
+                print(f"이미지 분석 결과 캐시 저장 실패: {e}")
+        return result
+
+    def get_cached_image_analysis(self, image_bytes: bytes) -> Dict[str, Any] | None:
+        """캐시에 있는 같은 이미지의 분석 결과를 반환합니다. (요청은 보내지 않음)"""
+        try:
+            cached_result = self.analysis_cache.get(
+                hashlib.sha256(image_bytes).hexdigest()
+            )
+        except sqlite3.Error as e:
+            print(f"이미지 분석 결과 캐시 조회 실패: {e}")
+            return None
+        if cached_result is None:
+            return None
+        return {**cached_result, "cached": True}
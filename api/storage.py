@@ -1,11 +1,176 @@
 # api/storage.py
+import io
 import logging
-from typing import Any, Dict
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from http.cookiejar import DefaultCookiePolicy
+from typing import Any, BinaryIO, Dict, Iterable, List
+from urllib.parse import parse_qs, urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from .cache import invalidates
 
 logger = logging.getLogger(__name__)
 
+# 만료 시간을 알 수 없는 URL에 적용할 기본 유효 시간(초)
+DEFAULT_URL_TTL = 300
+# 만료 직전의 URL을 내려주지 않도록 두는 여유 시간(초)
+URL_EXPIRY_MARGIN = 30
+
+# 멀티파트 업로드로 전환할 파일 크기, 파트 크기(S3 최소 5MB), 동시 업로드 파트 수
+S3_MULTIPART_THRESHOLD = int(os.getenv("S3_MULTIPART_THRESHOLD", str(16 * 1024 * 1024)))
+S3_MULTIPART_PART_SIZE = int(os.getenv("S3_MULTIPART_PART_SIZE", str(8 * 1024 * 1024)))
+S3_MULTIPART_CONCURRENCY = int(os.getenv("S3_MULTIPART_CONCURRENCY", "4"))
+# 업로드 요청(단일 PUT 또는 파트 하나)의 최대 시도 횟수와 재시도 간격의 기준(초)
+S3_UPLOAD_MAX_ATTEMPTS = int(os.getenv("S3_UPLOAD_MAX_ATTEMPTS", "3"))
+S3_UPLOAD_BACKOFF = float(os.getenv("S3_UPLOAD_BACKOFF", "0.5"))
+# 일괄 Presigned URL API가 없다고 판단한 뒤 다시 확인하기까지의 시간(초)
+BATCH_DOWNLOAD_REPROBE_SEC = int(os.getenv("BATCH_DOWNLOAD_REPROBE_SEC", "300"))
+# 멀티파트 업로드 API가 없다고 판단한 뒤 다시 확인하기까지의 시간(초)
+S3_MULTIPART_REPROBE_SEC = int(os.getenv("S3_MULTIPART_REPROBE_SEC", "300"))
+
+
+def _reprobe_due(unsupported_at: float | None, interval: float) -> bool:
+    """API가 없다고 판단한 적이 없거나, 판단한 지 interval(초)이 지났는지 확인합니다."""
+    return unsupported_at is None or time.time() - unsupported_at >= interval
+
+
+def presigned_url_expires_at(url: str, now: float | None = None) -> float:
+    """
+    Presigned URL의 쿼리 파라미터(X-Amz-Date/X-Amz-Expires 또는 Expires)로부터
+    만료 시각(epoch 초)을 계산합니다. 여유 시간을 뺀 값을 반환합니다.
+    """
+    now = time.time() if now is None else now
+    query = parse_qs(urlparse(url).query)
+    expires_at = now + DEFAULT_URL_TTL
+    try:
+        if "X-Amz-Expires" in query:
+            signed_at = now
+            if "X-Amz-Date" in query:
+                signed_at = (
+                    datetime.strptime(query["X-Amz-Date"][0], "%Y%m%dT%H%M%SZ")
+                    .replace(tzinfo=timezone.utc)
+                    .timestamp()
+                )
+            expires_at = signed_at + int(query["X-Amz-Expires"][0])
+        elif "Expires" in query:
+            expires_at = float(query["Expires"][0])
+    except ValueError:
+        logger.warning(f"Presigned URL 만료 시간 파싱 실패: {url}")
+    lifetime = max(expires_at - now, 0)
+    return expires_at - max(URL_EXPIRY_MARGIN, lifetime * 0.1)
+
+
+class PresignedUrlCache:
+    """
+    object_key 단위로 Presigned URL을 보관하는 프로세스 공용 캐시.
+    항목별 만료 시각은 URL 자체의 만료 정보로 결정되며,
+    메모리 상한을 넘으면 가장 오래 사용되지 않은 항목부터 제거합니다(LRU).
+    """
+
+    def __init__(self, max_bytes: int | None = None):
+        self.max_bytes = max_bytes or int(
+            os.getenv("PRESIGNED_URL_CACHE_MAX_BYTES", str(4 * 1024 * 1024))
+        )
+        self._entries: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _entry_size(key: str, url: str) -> int:
+        return len(key) + len(url)
+
+    def get(self, object_key: str) -> str | None:
+        with self._lock:
+            entry = self._entries.get(object_key)
+            if entry is None:
+                self.misses += 1
+                return None
+            url, expires_at = entry
+            if expires_at <= time.time():
+                self._remove(object_key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(object_key)
+            self.hits += 1
+            return url
+
+    def set(self, object_key: str, url: str) -> None:
+        with self._lock:
+            if object_key in self._entries:
+                self._remove(object_key)
+            self._entries[object_key] = (url, presigned_url_expires_at(url))
+            self._size += self._entry_size(object_key, url)
+            while self._size > self.max_bytes and self._entries:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self.evictions += 1
+
+    def invalidate(self, object_key: str) -> None:
+        with self._lock:
+            if object_key in self._entries:
+                self._remove(object_key)
+
+    def _remove(self, object_key: str) -> None:
+        url, _ = self._entries.pop(object_key)
+        self._size -= self._entry_size(object_key, url)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._size,
+            }
+
+
+def build_upload_session(pool_size: int = S3_MULTIPART_CONCURRENCY) -> requests.Session:
+    """
+    S3 업로드 전용 Session을 생성합니다.
+    본문이 파일 객체이면 자동 재시도 시 처음부터 다시 보낼 수 없으므로,
+    재시도는 어댑터가 아니라 업로드 메서드에서 파일 위치를 되돌려 직접 처리합니다.
+    """
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session = requests.Session()
+    # API 세션과 마찬가지로 여러 스레드가 공유하므로 응답 쿠키는 모두 버립니다.
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _remaining_size(file_obj: bytes | BinaryIO) -> int | None:
+    """파일 객체의 현재 위치부터 끝까지의 크기. (탐색할 수 없는 스트림이면 None)"""
+    if isinstance(file_obj, (bytes, bytearray, memoryview)):
+        return len(file_obj)
+    try:
+        position = file_obj.tell()
+        end = file_obj.seek(0, io.SEEK_END)
+        file_obj.seek(position)
+        return end - position
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def _log_throughput(label: str, size: int, started_at: float, parts: int = 1):
+    elapsed = max(time.perf_counter() - started_at, 1e-6)
+    logger.info(
+        f"📤 {label} 완료: {size / 1024 / 1024:.2f} MB, {elapsed:.2f}초, "
+        f"{size / 1024 / 1024 / elapsed:.2f} MB/s (파트 {parts}개)"
+    )
+
 
 class StorageMixin:
     """S3 및 Presigned URL 관련 API 메서드"""
@@ -22,7 +187,7 @@ class StorageMixin:
             f"🚀 Presigned URL 요청 시작: URL={url}, Params={params}, Payload={payload}"
         )
         try:
-            response = requests.post(
+            response = self.session.post(
                 url, headers=headers, params=params, json=payload, timeout=10
             )
             response.raise_for_status()
@@ -43,32 +208,227 @@ class StorageMixin:
             return None
         except requests.exceptions.RequestException as e:
             logger.error(
-                f"🔥 Presigned URL 요청 실패 (RequestException): Error={e}", exc_info=True
+                f"🔥 Presigned URL 요청 실패 (RequestException): Error={e}",
+                exc_info=True,
             )
             return None
 
     def upload_file_to_s3(
-        self, presigned_url: str, file_data: bytes, content_type: str
+        self, presigned_url: str, file_data: bytes | BinaryIO, content_type: str
     ) -> bool:
-        """주어진 Presigned URL로 실제 파일 데이터를 PUT 요청으로 업로드합니다."""
-        headers = {"Content-Type": content_type}
+        """
+        주어진 Presigned URL로 실제 파일 데이터를 PUT 요청으로 업로드합니다.
+        file_data가 파일 객체이면 복사하지 않고 현재 위치부터 읽으면서 전송하며,
+        실패하면 같은 위치로 되돌려 다시 시도합니다.
+        """
+        if isinstance(file_data, (bytes, bytearray, memoryview)):
+            size, position = len(file_data), None
+        else:
+            size = _remaining_size(file_data)
+            if size is None:
+                # S3는 chunked 업로드를 받지 않으므로 크기를 알 수 없는 스트림은 읽어서 보냅니다.
+                file_data = file_data.read()
+                size, position = len(file_data), None
+            else:
+                position = file_data.tell()
+        headers = {"Content-Type": content_type, "Content-Length": str(size)}
+
+        started_at = time.perf_counter()
+        for attempt in range(1, S3_UPLOAD_MAX_ATTEMPTS + 1):
+            if position is not None:
+                file_data.seek(position)
+            try:
+                response = self.upload_session.put(
+                    presigned_url, data=file_data, headers=headers, timeout=(10, 60)
+                )
+                response.raise_for_status()
+                _log_throughput("S3 파일 업로드", size, started_at)
+                return True
+            except requests.exceptions.RequestException as e:
+                logger.warning(
+                    f"S3 파일 업로드 실패 ({attempt}/{S3_UPLOAD_MAX_ATTEMPTS}): {e}"
+                )
+                if attempt < S3_UPLOAD_MAX_ATTEMPTS:
+                    time.sleep(S3_UPLOAD_BACKOFF * 2 ** (attempt - 1))
+        return False
+
+    def upload_file(
+        self,
+        token: str,
+        file_obj: bytes | BinaryIO,
+        filename: str,
+        category: str,
+        content_type: str,
+    ) -> str | None:
+        """
+        파일 객체(또는 bytes)를 S3에 올리고 object_key를 반환합니다.
+        S3_MULTIPART_THRESHOLD 이상이고 백엔드가 멀티파트 URL을 발급하면
+        파트를 동시에 업로드하고, 그 밖에는 Presigned URL 하나로 스트리밍 업로드합니다.
+        멀티파트 업로드가 실패(취소)하면 처음 위치부터 단일 업로드로 다시 시도합니다.
+        """
+        size = _remaining_size(file_obj)
+        if (
+            size is not None
+            and size >= S3_MULTIPART_THRESHOLD
+            and _reprobe_due(
+                self._multipart_upload_unsupported_at, S3_MULTIPART_REPROBE_SEC
+            )
+        ):
+            in_memory = isinstance(file_obj, (bytes, bytearray, memoryview))
+            start = None if in_memory else file_obj.tell()
+            object_key = self._upload_multipart(
+                token, file_obj, size, filename, category, content_type
+            )
+            if object_key is not None:
+                return object_key
+            if start is not None:
+                file_obj.seek(start)
+
+        presigned_data = self.get_presigned_url_for_upload(
+            token=token, filename=filename, category=category
+        )
+        if not presigned_data:
+            return None
+        if not self.upload_file_to_s3(presigned_data["url"], file_obj, content_type):
+            return None
+        return presigned_data["object_key"]
+
+    def _upload_multipart(
+        self,
+        token: str,
+        file_obj: bytes | BinaryIO,
+        size: int,
+        filename: str,
+        category: str,
+        content_type: str,
+    ) -> str | None:
+        """
+        멀티파트 업로드를 시작하고, 파트를 동시에 올린 뒤 완료를 요청합니다.
+        백엔드가 멀티파트 API를 지원하지 않으면 그 시각을 기록하고 None을 반환합니다.
+        (S3_MULTIPART_REPROBE_SEC 동안은 멀티파트 업로드를 시도하지 않음)
+        """
+        headers = {"Authorization": f"Bearer {token}"}
+        base_url = f"{self.base_url}/storage/presigned-url/multipart"
+        part_count = math.ceil(size / S3_MULTIPART_PART_SIZE)
         try:
-            response = requests.put(
-                presigned_url, data=file_data, headers=headers, timeout=60
+            response = self.session.post(
+                f"{base_url}/initiate",
+                headers=headers,
+                params={"category": category},
+                json={
+                    "filename": filename,
+                    "content_type": content_type,
+                    "part_count": part_count,
+                },
+                timeout=10,
             )
+            if response.status_code in (404, 405):
+                logger.info("멀티파트 업로드 API가 없어 단일 업로드로 대체합니다.")
+                self._multipart_upload_unsupported_at = time.time()
+                return None
             response.raise_for_status()
-            return True
+            upload = response.json()
+            upload_ref = {
+                "object_key": upload["object_key"],
+                "upload_id": upload["upload_id"],
+            }
+            part_urls = upload["part_urls"]
+        except (requests.exceptions.RequestException, KeyError, TypeError) as e:
+            logger.error(f"🔥 멀티파트 업로드 시작 실패: {e!r}")
+            return None
+        self._multipart_upload_unsupported_at = None
+        if len(part_urls or []) != part_count:
+            logger.error("🔥 멀티파트 업로드 시작 실패: 파트 URL 수가 맞지 않습니다.")
+            self._abort_multipart(base_url, headers, upload_ref)
+            return None
+
+        in_memory = isinstance(file_obj, (bytes, bytearray, memoryview))
+        start = 0 if in_memory else file_obj.tell()
+        read_lock = threading.Lock()
+
+        def upload_part(part_number: int) -> Dict[str, Any]:
+            offset = start + (part_number - 1) * S3_MULTIPART_PART_SIZE
+            if in_memory:
+                chunk = bytes(file_obj[offset : offset + S3_MULTIPART_PART_SIZE])
+            else:
+                # 파일 객체는 스레드 간에 위치를 공유하므로 읽기만 잠금으로 보호합니다.
+                with read_lock:
+                    file_obj.seek(offset)
+                    chunk = file_obj.read(S3_MULTIPART_PART_SIZE)
+            etag = self._put_part(part_urls[part_number - 1], chunk)
+            return {"part_number": part_number, "etag": etag}
+
+        started_at = time.perf_counter()
+        try:
+            with ThreadPoolExecutor(
+                max_workers=min(S3_MULTIPART_CONCURRENCY, part_count),
+                thread_name_prefix="s3-multipart",
+            ) as executor:
+                parts: List[Dict[str, Any]] = list(
+                    executor.map(upload_part, range(1, part_count + 1))
+                )
+            response = self.session.post(
+                f"{base_url}/complete",
+                headers=headers,
+                json={**upload_ref, "parts": parts},
+                timeout=30,
+            )
+            response.raise_for_status()
+        except (requests.exceptions.RequestException, KeyError) as e:
+            logger.error(f"🔥 멀티파트 업로드 실패, 업로드를 취소합니다: {e}")
+            self._abort_multipart(base_url, headers, upload_ref)
+            return None
+        _log_throughput("S3 멀티파트 업로드", size, started_at, part_count)
+        return upload_ref["object_key"]
+
+    def _abort_multipart(
+        self, base_url: str, headers: Dict[str, str], upload_ref: Dict[str, str]
+    ) -> None:
+        """시작한 멀티파트 업로드를 취소하여 올라간 파트가 남지 않게 합니다."""
+        try:
+            self.session.post(
+                f"{base_url}/abort", headers=headers, json=upload_ref, timeout=10
+            )
         except requests.exceptions.RequestException as e:
-            print(f"S3 파일 업로드 실패: {e}")
-            return False
+            logger.error(f"🔥 멀티파트 업로드 취소 실패: {e}")
 
+    def _put_part(self, part_url: str, chunk: bytes) -> str:
+        """파트 하나를 업로드하고 ETag를 반환합니다. 실패하면 간격을 늘려가며 다시 시도합니다."""
+        for attempt in range(1, S3_UPLOAD_MAX_ATTEMPTS + 1):
+            try:
+                response = self.upload_session.put(
+                    part_url, data=chunk, timeout=(10, 120)
+                )
+                response.raise_for_status()
+                return response.headers["ETag"]
+            except requests.exceptions.RequestException as e:
+                if attempt == S3_UPLOAD_MAX_ATTEMPTS:
+                    raise
+                logger.warning(
+                    f"S3 파트 업로드 재시도 ({attempt}/{S3_UPLOAD_MAX_ATTEMPTS}): {e}"
+                )
+                time.sleep(S3_UPLOAD_BACKOFF * 2 ** (attempt - 1))
+
+    def download_file_from_s3(self, presigned_url: str) -> bytes | None:
+        """주어진 Presigned URL에서 파일 데이터를 내려받습니다."""
+        try:
+            response = self.session.get(presigned_url, timeout=60)
+            response.raise_for_status()
+            return response.content
+        except requests.exceptions.RequestException as e:
+            print(f"S3 파일 다운로드 실패: {e}")
+            return None
+
+    @invalidates("urls:{object_key}")
     def delete_s3_object(self, token: str, object_key: str) -> bool:
         """S3에 저장된 객체를 삭제합니다."""
         headers = {"Authorization": f"Bearer {token}"}
         url = f"{self.base_url}/storage/object"
         params = {"object_key": object_key}
         try:
-            response = requests.delete(url, headers=headers, params=params, timeout=10)
+            response = self.session.delete(
+                url, headers=headers, params=params, timeout=10
+            )
             response.raise_for_status()
             logger.info(f"✅ S3 객체 삭제 요청 성공: Key={object_key}")
             return True
@@ -77,14 +437,91 @@ class StorageMixin:
             return False
 
     def get_presigned_url_for_download(self, token: str, object_key: str) -> str | None:
-        """파일 조회를 위한 Presigned URL을 백엔드로부터 받아옵니다. (인증 필요)"""
+        """
+        파일 조회를 위한 Presigned URL을 백엔드로부터 받아옵니다. (인증 필요)
+        만료되지 않은 URL이 공용 캐시에 있으면 요청 없이 재사용합니다.
+        """
+        cached_url = self.url_cache.get(object_key)
+        if cached_url:
+            return cached_url
         headers = {"Authorization": f"Bearer {token}"}
         url = f"{self.base_url}/storage/presigned-url/download"
         params = {"object_key": object_key}
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=10)
+            response = self.session.get(url, headers=headers, params=params, timeout=10)
             response.raise_for_status()
-            return response.json().get("url")
+            download_url = response.json().get("url")
+            if download_url:
+                self.url_cache.set(object_key, download_url)
+            return download_url
         except requests.exceptions.RequestException as e:
             print(f"다운로드용 Presigned URL 요청 실패: {e}")
-            return None
\ No newline at end of file
+            return None
+
+    def get_presigned_urls_for_download(
+        self, token: str, object_keys: Iterable[str]
+    ) -> Dict[str, str | None]:
+        """
+        여러 객체의 다운로드용 Presigned URL을 한 번에 받아옵니다.
+        백엔드에 일괄 발급 API가 있으면 이를 사용하고, 없으면 단건 요청을 동시에 보냅니다.
+        발급된 URL은 만료 시각까지 공용 캐시에 보관됩니다.
+        """
+        keys = list(dict.fromkeys(key for key in object_keys if key))
+        urls: Dict[str, str | None] = {}
+        missing = []
+        for key in keys:
+            cached_url = self.url_cache.get(key)
+            if cached_url:
+                urls[key] = cached_url
+            else:
+                missing.append(key)
+
+        if missing:
+            fetched = self._fetch_download_urls_batch(token, missing)
+            if fetched is None:
+                aio = self.aio
+                results = aio.gather(
+                    *(aio.get_presigned_url_for_download(token, key) for key in missing)
+                )
+                fetched = dict(zip(missing, results))
+            for key in missing:
+                url = fetched.get(key)
+                if url:
+                    self.url_cache.set(key, url)
+                urls[key] = url
+        return urls
+
+    def _fetch_download_urls_batch(
+        self, token: str, object_keys: list
+    ) -> Dict[str, str | None] | None:
+        """
+        일괄 발급 API를 호출합니다. API가 없거나 실패하면 None을 반환합니다.
+        API가 없다고 판단하면 BATCH_DOWNLOAD_REPROBE_SEC 동안은 호출하지 않습니다.
+        """
+        if not _reprobe_due(
+            self._batch_download_unsupported_at, BATCH_DOWNLOAD_REPROBE_SEC
+        ):
+            return None
+        headers = {"Authorization": f"Bearer {token}"}
+        url = f"{self.base_url}/storage/presigned-url/download/batch"
+        try:
+            response = self.session.post(
+                url, headers=headers, json={"object_keys": object_keys}, timeout=10
+            )
+            if response.status_code in (404, 405):
+                logger.info("일괄 Presigned URL API가 없어 단건 요청으로 대체합니다.")
+                self._batch_download_unsupported_at = time.time()
+                return None
+            response.raise_for_status()
+            body = response.json()
+        except requests.exceptions.RequestException as e:
+            logger.error(f"🔥 일괄 Presigned URL 요청 실패: Error={e}")
+            return None
+        urls = body.get("urls") if isinstance(body, dict) else None
+        if not isinstance(urls, dict):
+            logger.error(
+                f"🔥 일괄 Presigned URL 응답 형식 오류: Response={body!r:.200}"
+            )
+            return None
+        self._batch_download_unsupported_at = None
+        return urls
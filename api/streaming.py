@@ -0,0 +1,132 @@
+# api/streaming.py
+import json
+import time
+from typing import Any, Dict, Iterator, Tuple
+
+import requests
+
+# 스트림 이벤트: ("token", 텍스트 조각) 또는 ("done", 최종 응답 dict)
+StreamEvent = Tuple[str, Any]
+
+
+class MessageStream:
+    """
+    AI 응답을 텍스트 조각 단위로 내보내는 이터레이터. st.write_stream에 그대로 전달할 수 있습니다.
+    끝까지 읽은 뒤에는 response에 최종 응답(dict)이, ttft/elapsed에 측정 시간(초)이 담깁니다.
+    streamed가 False이면 스트리밍을 지원하지 않는 백엔드의 일반 응답을 감싼 것입니다.
+    """
+
+    def __init__(
+        self, events: Iterator[StreamEvent], started_at: float, streamed: bool = True
+    ):
+        self._events = events
+        self.started_at = started_at
+        self.streamed = streamed
+        self.first_token_at: float | None = None
+        self.finished_at: float | None = None
+        self.text = ""
+        self.response: Dict[str, Any] | None = None
+        self.error: str | None = None
+
+    def __iter__(self) -> Iterator[str]:
+        parts = []
+        try:
+            for kind, value in self._events:
+                if kind == "token" and value:
+                    if self.first_token_at is None:
+                        self.first_token_at = time.perf_counter()
+                    parts.append(value)
+                    yield value
+                elif kind == "done":
+                    self.response = value
+        except requests.exceptions.RequestException as e:
+            print(f"AI 응답 스트림 수신 실패: {e}")
+            self.error = str(e)
+        finally:
+            self.finished_at = time.perf_counter()
+            self.text = "".join(parts)
+            if self.response is None:
+                self.response = {"content": self.text}
+
+    def consume(self) -> "MessageStream":
+        """화면에 그리지 않고 스트림을 끝까지 읽습니다."""
+        for _ in self:
+            pass
+        return self
+
+    @property
+    def ttft(self) -> float | None:
+        """첫 토큰까지 걸린 시간. 스트리밍이 아니면 전체 응답 시간과 같습니다."""
+        if self.first_token_at is not None:
+            return self.first_token_at - self.started_at
+        return self.elapsed
+
+    @property
+    def elapsed(self) -> float | None:
+        if self.finished_at is None:
+            return None
+        return self.finished_at - self.started_at
+
+
+def _parse_sse_data(event: str, data: str) -> StreamEvent | None:
+    if data == "[DONE]":
+        return None
+    try:
+        payload = json.loads(data)
+    except json.JSONDecodeError:
+        return "token", data
+    if not isinstance(payload, dict):
+        return "token", str(payload)
+    if (
+        event == "done"
+        or payload.get("type") == "done"
+        or "suggested_user_questions" in payload
+    ):
+        return "done", payload
+    text = payload.get("delta") or payload.get("token") or payload.get("content")
+    return "token", text or ""
+
+
+def iter_stream_events(response: requests.Response) -> Iterator[StreamEvent]:
+    """
+    스트리밍 응답을 이벤트로 변환합니다.
+    text/event-stream이면 SSE로 해석하고, 그 밖의 chunked 응답은 받은 텍스트를 그대로 내보냅니다.
+    """
+    content_type = response.headers.get("Content-Type", "")
+    is_event_stream = "text/event-stream" in content_type
+    # SSE는 항상 UTF-8입니다. charset이 없는 text/* 응답에 requests가 정하는
+    # ISO-8859-1로 디코딩하면 한글 토큰이 깨지므로, charset을 밝힌 경우만 따릅니다.
+    if is_event_stream or "charset=" not in content_type.lower():
+        response.encoding = "utf-8"
+    try:
+        if not is_event_stream:
+            for chunk in response.iter_content(chunk_size=None, decode_unicode=True):
+                if chunk:
+                    yield "token", chunk
+            return
+
+        event, data_lines = "message", []
+        for line in response.iter_lines(decode_unicode=True):
+            if line:
+                if line.startswith(":"):
+                    continue
+                field, _, value = line.partition(":")
+                value = value[1:] if value.startswith(" ") else value
+                if field == "event":
+                    event = value
+                elif field == "data":
+                    data_lines.append(value)
+                continue
+            # 빈 줄은 이벤트의 끝을 의미합니다.
+            if data_lines:
+                parsed = _parse_sse_data(event, "\n".join(data_lines))
+                if parsed is None:
+                    return
+                yield parsed
+            event, data_lines = "message", []
+        if data_lines:
+            parsed = _parse_sse_data(event, "\n".join(data_lines))
+            if parsed is not None:
+                yield parsed
+    finally:
+        response.close()
@@ -1,45 +1,236 @@
 # api/user.py
-from typing import Any, Dict, List
+import os
+import time
+from typing import Any, Dict, List, Tuple
 
 import requests
 
+from services.search_index import SearchIndex
+
+from .cache import cached, writes_through
+
+# 미리 받아 둔 이웃 페이지를 재사용할 수 있는 시간(초)
+USERS_PREFETCH_TTL = 60
+
+# 페이지네이션 미지원으로 판단한 뒤 다시 확인하기까지의 시간(초)
+USERS_PAGING_REPROBE_SEC = int(os.getenv("USERS_PAGING_REPROBE_SEC", "300"))
+
+# 백엔드가 페이지네이션 파라미터를 지원하지 않음을 나타내는 표식
+_PAGING_UNSUPPORTED = object()
+
 
 class UserMixin:
     """사용자 관리 관련 API 메서드"""
 
+    @cached("users")
     def get_all_users(self, token: str) -> List[Dict[str, Any]] | None:
         headers = {"Authorization": f"Bearer {token}"}
         url = f"{self.base_url}/admin/users"
         try:
-            response = requests.get(url, headers=headers, timeout=5)
+            response = self.session.get(url, headers=headers, timeout=5)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
             print(f"사용자 목록 조회 실패: {e}")
             return None
 
+    @cached("users")
+    def get_users_page(
+        self,
+        token: str,
+        skip: int = 0,
+        limit: int = 10,
+        q: str | None = None,
+        sort: str = "id",
+    ) -> Tuple[List[Dict[str, Any]], int] | None:
+        """
+        [Admin] 사용자 목록의 한 페이지와 (검색 조건에 맞는) 전체 사용자 수를 조회합니다.
+        sort는 필드명이며, '-'를 붙이면 내림차순입니다. (예: "-id")
+        백엔드가 skip/limit/q/sort를 지원하지 않으면 전체 목록을 받아 클라이언트에서 처리합니다.
+        """
+        key = (token, skip, limit, q or "", sort)
+        with self._users_lock:
+            prefetched = self._users_prefetch.pop(key, None)
+        if prefetched is not None:
+            requested_at, future = prefetched
+            if time.time() - requested_at < USERS_PREFETCH_TTL:
+                try:
+                    page = future.result()
+                except Exception as e:
+                    print(f"사용자 페이지 미리 불러오기 실패: {e}")
+                    page = None
+                if page is not None:
+                    return page
+
+        return self._fetch_or_fallback_users_page(token, skip, limit, q, sort)
+
+    def prefetch_users_pages(
+        self,
+        token: str,
+        skips: List[int],
+        limit: int = 10,
+        q: str | None = None,
+        sort: str = "id",
+    ) -> None:
+        """이웃 페이지를 백그라운드에서 미리 받아 두어, 페이지 이동 시 바로 표시합니다."""
+        now = time.time()
+        with self._users_lock:
+            for stale_key in [
+                k
+                for k, (requested_at, _) in self._users_prefetch.items()
+                if now - requested_at >= USERS_PREFETCH_TTL
+            ]:
+                del self._users_prefetch[stale_key]
+
+            for skip in skips:
+                key = (token, skip, limit, q or "", sort)
+                if key in self._users_prefetch:
+                    continue
+                future = self._executor.submit(
+                    self._fetch_or_fallback_users_page, token, skip, limit, q, sort
+                )
+                self._users_prefetch[key] = (now, future)
+
+    def _users_paging_available(self) -> bool:
+        """페이지네이션 미지원으로 판단한 지 USERS_PAGING_REPROBE_SEC가 지나면 다시 시도합니다."""
+        unsupported_at = self._users_paging_unsupported_at
+        return (
+            unsupported_at is None
+            or time.time() - unsupported_at >= USERS_PAGING_REPROBE_SEC
+        )
+
+    def _fetch_or_fallback_users_page(self, token, skip, limit, q, sort):
+        if self._users_paging_available():
+            page = self._fetch_users_page(token, skip, limit, q, sort)
+            if page is not _PAGING_UNSUPPORTED:
+                if page is not None:
+                    self._users_paging_unsupported_at = None
+                return page
+            self._users_paging_unsupported_at = time.time()
+        return self._get_users_page_from_full_list(token, skip, limit, q, sort)
+
+    def _fetch_users_page(self, token, skip, limit, q, sort):
+        headers = {"Authorization": f"Bearer {token}"}
+        url = f"{self.base_url}/admin/users"
+        params = {"skip": skip, "limit": limit, "sort": sort}
+        if q:
+            params["q"] = q
+        try:
+            response = self.session.get(
+                url, headers=headers, params=params, timeout=10
+            )
+            response.raise_for_status()
+            data = response.json()
+        except requests.exceptions.RequestException as e:
+            print(f"사용자 페이지 조회 실패: {e}")
+            return None
+
+        if isinstance(data, dict) and "items" in data:
+            return data["items"], int(data.get("total", len(data["items"])))
+        total_header = response.headers.get("X-Total-Count")
+        if isinstance(data, list) and total_header is not None:
+            return data, int(total_header)
+        # 전체 개수를 알려주지 않는 백엔드는 파라미터를 지원하지 않는 것으로 간주합니다.
+        return _PAGING_UNSUPPORTED
+
+    def _get_users_page_from_full_list(self, token, skip, limit, q, sort):
+        """
+        전체 사용자 목록으로 한 페이지를 만듭니다.
+        검색어가 있으면 색인이 찾은 사용자만 정렬하고, 없으면 정렬 기준별로 한 번만 정렬해 둔
+        목록을 잘라 쓰므로 재요청마다 전체 사용자를 훑지 않습니다.
+        """
+        with self._users_full_list_lock:
+            fetched_at, users_by_id = self._users_full_list
+            if users_by_id is None or time.time() - fetched_at >= USERS_PREFETCH_TTL:
+                all_users = self.get_all_users(token)
+                if all_users is None:
+                    return None
+                index = SearchIndex.build(all_users, ["email", "username"])
+                with self._users_lock:
+                    self._users_full_list = (
+                        time.time(),
+                        {u["id"]: u for u in all_users},
+                    )
+                    self._users_index = index
+                    self._users_sorted.clear()
+
+        field = sort.lstrip("-")
+
+        def sort_users(users):
+            return sorted(
+                users,
+                key=lambda u: (u.get(field) is None, u.get(field)),
+                reverse=sort.startswith("-"),
+            )
+
+        with self._users_lock:
+            _, users_by_id = self._users_full_list
+            if q:
+                users = [users_by_id[uid] for uid in self._users_index.search(q)]
+            else:
+                users = self._users_sorted.get(sort)
+                if users is None:
+                    users = sort_users(users_by_id.values())
+                    self._users_sorted[sort] = users
+                return users[skip : skip + limit], len(users)
+        users = sort_users(users)
+        return users[skip : skip + limit], len(users)
+
+    def _apply_user_change(
+        self, user_id: int, update_data: Dict[str, Any] | None = None
+    ) -> None:
+        """
+        사용자 정보가 바뀌면 미리 받아 둔 페이지와 정렬해 둔 목록을 버리고,
+        전체 목록과 검색 색인은 해당 사용자만 갱신합니다. (update_data가 없으면 삭제)
+        """
+        with self._users_lock:
+            self._users_prefetch.clear()
+            self._users_sorted.clear()
+            _, users_by_id = self._users_full_list
+            if users_by_id is None:
+                return
+            if update_data is None:
+                users_by_id.pop(user_id, None)
+                self._users_index.remove(user_id)
+            elif user_id in users_by_id:
+                users_by_id[user_id] = {**users_by_id[user_id], **update_data}
+                self._users_index.upsert(user_id, users_by_id[user_id])
+
+    @writes_through("users")
     def update_user(
         self, token: str, user_id: int, update_data: Dict[str, Any]
-    ) -> bool:
-        """[Admin] 사용자 정보를 업데이트합니다. (원본 코드에 따라 추가됨)"""
+    ) -> Dict[str, Any] | None:
+        """
+        [Admin] 사용자 정보를 업데이트하고, 서버가 돌려준 사용자 객체를 반환합니다.
+        캐시된 사용자 목록에는 이 객체가 바로 반영됩니다.
+        """
         headers = {"Authorization": f"Bearer {token}"}
         url = f"{self.base_url}/admin/users/{user_id}"
         try:
-            response = requests.put(url, headers=headers, json=update_data, timeout=10)
+            response = self.session.put(
+                url, headers=headers, json=update_data, timeout=10
+            )
             response.raise_for_status()
-            return True
+            # 응답 본문이 없는 백엔드라면 보낸 값으로 갱신된 객체를 구성합니다.
+            updated_user = (
+                response.json() if response.content else {"id": user_id, **update_data}
+            )
+            self._apply_user_change(user_id, updated_user)
+            return updated_user
         except requests.exceptions.RequestException as e:
             print(f"사용자 정보 업데이트 실패: {e}")
-            return False
+            return None
 
+    @writes_through("users", deleted_id_arg="user_id")
     def delete_user(self, token: str, user_id: int) -> bool:
         """[Admin] 사용자를 삭제합니다. (원본 코드에 따라 추가됨)"""
         headers = {"Authorization": f"Bearer {token}"}
         url = f"{self.base_url}/admin/users/{user_id}"
         try:
-            response = requests.delete(url, headers=headers, timeout=10)
+            response = self.session.delete(url, headers=headers, timeout=10)
             response.raise_for_status()
+            self._apply_user_change(user_id)
             return True
         except requests.exceptions.RequestException as e:
             print(f"사용자 삭제 실패: {e}")
-            return False
\ No newline at end of file
+            return False
@@ -0,0 +1,134 @@
+# benchmarks/conversation_table_bench.py
+"""
+대화방 테이블 생성 비용을 비교하는 벤치마크.
+기존 방식(재실행마다 DataFrame을 새로 만드는 방식)과 ConversationTable 모델
+(목록을 불러올 때 한 번 생성, 재실행 시 검색과 보이는 행의 변환만 수행)을 합성 데이터로 측정합니다.
+페이지 단위로 목록을 불러올 때 페이지마다 테이블을 다시 만드는 방식과
+ConversationTable.append로 새 페이지만 덧붙이는 방식도 비교합니다.
+
+실행: python -m benchmarks.conversation_table_bench [행 수]
+"""
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from services.conversation_table import ConversationTable
+
+
+def make_conversations(count: int) -> list:
+    base_time = datetime(2025, 1, 1)
+    return [
+        {
+            "id": i,
+            "title": f"테스트 대화방 {i}",
+            "user": {"id": i % 5000, "email": f"user{i % 5000}@example.com"},
+            "persona": {"id": i % 20, "name": f"페르소나{i % 20}"},
+            "applied_phishing_case_id": random.choice([None, i % 300]),
+            "last_message_at": (
+                None
+                if i % 50 == 0
+                else (base_time + timedelta(minutes=i)).isoformat()
+            ),
+        }
+        for i in range(count)
+    ]
+
+
+def rebuild_per_rerun(conversations: list, query: str) -> pd.DataFrame:
+    """기존 render_conversation_test_page의 재실행 당 처리 과정"""
+    df_original = pd.DataFrame(conversations)
+    df_normalized = pd.json_normalize(conversations, sep=".")
+    mask = df_normalized["user.email"].str.contains(
+        query, case=False, na=False
+    ) | df_normalized["persona.name"].str.contains(query, case=False, na=False)
+    filtered_df = df_original.loc[df_normalized[mask].index]
+    display_df = pd.DataFrame(
+        {
+            "ID": filtered_df["id"],
+            "사용자 ID": filtered_df["user"].apply(lambda u: u.get("id", "N/A")),
+            "사용자 이메일": filtered_df["user"].apply(lambda u: u.get("email", "N/A")),
+            "페르소나": filtered_df["persona"].apply(lambda p: p.get("name", "N/A")),
+            "시나리오 ID": filtered_df["applied_phishing_case_id"]
+            .fillna(0)
+            .astype(int),
+            "대화방 제목": filtered_df["title"],
+            "마지막 대화": filtered_df["last_message_at"],
+        }
+    )
+    dt_series = pd.to_datetime(display_df["마지막 대화"], errors="coerce")
+    display_df["마지막 대화"] = (
+        dt_series.dt.tz_localize("UTC")
+        .dt.tz_convert("Asia/Seoul")
+        .dt.strftime("%Y-%m-%d %H:%M:%S")
+        .fillna("N/A")
+    )
+    return display_df
+
+
+def rebuild_per_page(conversations: list, page_size: int) -> ConversationTable:
+    """새 페이지가 도착할 때마다 전체 행으로 테이블을 다시 만드는 방식"""
+    table = ConversationTable()
+    for end in range(page_size, len(conversations) + page_size, page_size):
+        table = ConversationTable(conversations[:end])
+        table.display(table.search("")[:page_size])
+    return table
+
+
+def append_per_page(conversations: list, page_size: int) -> ConversationTable:
+    """새 페이지만 기존 테이블에 덧붙이는 방식"""
+    table = ConversationTable()
+    for start in range(0, len(conversations), page_size):
+        table.append(conversations[start : start + page_size])
+        table.display(table.search("")[:page_size])
+    return table
+
+
+def measure(label: str, func, repeat: int = 5) -> None:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    print(f"{label:<40} 최소 {min(timings) * 1000:9.1f} ms")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    conversations = make_conversations(count)
+    query = "user42"
+    print(f"합성 대화방 {count}건, 검색어 '{query}'")
+
+    measure("기존 방식 (재실행마다 재구성)", lambda: rebuild_per_rerun(conversations, query))
+    measure("ConversationTable 생성 (목록당 1회)", lambda: ConversationTable(conversations))
+    measure(
+        "ConversationTable 첫 검색 (색인 생성)",
+        lambda: ConversationTable(conversations).search(query),
+    )
+
+    table = ConversationTable(conversations)
+    measure(
+        "ConversationTable 재실행 (검색+슬라이스)",
+        lambda: table.display(table.search(query)[:200]),
+    )
+
+    # 페이지마다 다시 만드는 방식은 행 수의 제곱에 비례하므로 일부 행으로만 비교합니다.
+    paged = conversations[:10_000]
+    page_size = 200
+    print(f"페이지 단위 로딩: {len(paged)}건, 페이지당 {page_size}건")
+    measure(
+        "페이지마다 테이블 재생성",
+        lambda: rebuild_per_page(paged, page_size),
+        repeat=1,
+    )
+    measure(
+        "페이지마다 append",
+        lambda: append_per_page(paged, page_size),
+        repeat=3,
+    )
+
+
+if __name__ == "__main__":
+    main()
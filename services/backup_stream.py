@@ -0,0 +1,108 @@
+# services/backup_stream.py
+import gzip
+import io
+import json
+import os
+import tempfile
+import weakref
+import zlib
+from typing import Any, Dict, Iterable, Iterator, List
+
+# gzip 파일의 첫 두 바이트
+_GZIP_MAGIC = b"\x1f\x8b"
+
+
+def iter_ndjson_gz(pages: Iterable[List[Dict[str, Any]]]) -> Iterator[bytes]:
+    """
+    페이지 단위로 받은 레코드를 한 줄에 하나씩(NDJSON) gzip으로 압축하며 내보냅니다.
+    압축된 조각을 바로 돌려주므로, 전체 데이터를 메모리에 올리지 않습니다.
+    """
+    # wbits=31: zlib 대신 gzip 헤더/트레일러를 사용합니다.
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for page in pages:
+        lines = "".join(
+            json.dumps(record, ensure_ascii=False) + "\n" for record in page
+        )
+        chunk = compressor.compress(lines.encode("utf-8"))
+        if chunk:
+            yield chunk
+    yield compressor.flush()
+
+
+class ExportFile:
+    """
+    내보내기로 만든 임시 파일과 레코드 수, 그리고 다운로드와 함께 보여줄 안내 문구(warning).
+    remove()로 지우거나, 객체가 사라질 때(세션 종료 등) 또는 프로세스가 끝날 때 자동으로 지워집니다.
+    """
+
+    def __init__(self, path: str, count: int, warning: str | None = None):
+        self.path = path
+        self.count = count
+        self.warning = warning
+        self._finalizer = weakref.finalize(self, remove_export_file, path)
+
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+
+    def remove(self) -> None:
+        self._finalizer()
+
+
+def export_ndjson_gz(pages: Iterable[List[Dict[str, Any]]], prefix: str) -> ExportFile:
+    """레코드를 gzip NDJSON 임시 파일로 내보냅니다."""
+    count = 0
+
+    def counted(pages):
+        nonlocal count
+        for page in pages:
+            count += len(page)
+            yield page
+
+    with tempfile.NamedTemporaryFile(
+        prefix=prefix, suffix=".ndjson.gz", delete=False
+    ) as f:
+        try:
+            for chunk in iter_ndjson_gz(counted(pages)):
+                f.write(chunk)
+        except BaseException:
+            f.close()
+            remove_export_file(f.name)
+            raise
+    return ExportFile(f.name, count)
+
+
+def remove_export_file(path: str | None) -> None:
+    if path and os.path.exists(path):
+        os.remove(path)
+
+
+def iter_backup_records(uploaded_file) -> Iterator[Dict[str, Any]]:
+    """
+    백업 파일의 레코드를 하나씩 읽는 제너레이터입니다.
+    gzip NDJSON(.ndjson.gz), NDJSON, 기존 JSON 배열 형식을 모두 지원합니다.
+    호출할 때마다 파일의 처음부터 다시 읽습니다.
+    """
+    uploaded_file.seek(0)
+    head = uploaded_file.read(2)
+    uploaded_file.seek(0)
+    if head == _GZIP_MAGIC:
+        stream = io.TextIOWrapper(gzip.GzipFile(fileobj=uploaded_file), "utf-8")
+    else:
+        stream = io.TextIOWrapper(uploaded_file, "utf-8")
+    try:
+        first_line = stream.readline()
+        if first_line.lstrip().startswith("["):
+            # 기존 JSON 배열 백업은 한 번에 읽을 수밖에 없습니다.
+            records = json.loads(first_line + stream.read())
+            if not isinstance(records, list):
+                raise ValueError("파일의 최상위 구조는 리스트(배열) 형태여야 합니다.")
+            yield from records
+            return
+        if first_line.strip():
+            yield json.loads(first_line)
+        for line in stream:
+            if line.strip():
+                yield json.loads(line)
+    finally:
+        # 업로드된 파일 객체가 함께 닫히지 않도록 분리합니다.
+        stream.detach()
@@ -0,0 +1,79 @@
+# services/bulk.py
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, List
+
+# 대량 작업(복원/가져오기)에 사용할 동시 작업 수와 초당 요청 수 상한
+BULK_MAX_WORKERS = int(os.getenv("BULK_MAX_WORKERS", "8"))
+BULK_RATE_PER_SEC = float(os.getenv("BULK_RATE_PER_SEC", "10"))
+# 스트리밍으로 읽은 레코드를 한 번에 처리할 묶음 크기
+BULK_BATCH_SIZE = int(os.getenv("BULK_BATCH_SIZE", "500"))
+
+
+class TokenBucket:
+    """
+    초당 rate개의 토큰이 채워지고 최대 burst개까지 쌓이는 토큰 버킷.
+    acquire()는 토큰을 얻을 때까지 대기하므로, 여러 스레드가 공유해도
+    전체 요청 속도가 rate를 넘지 않습니다.
+    """
+
+    def __init__(self, rate: float, burst: int | None = None):
+        self.rate = rate
+        self.capacity = burst if burst is not None else max(1, int(rate))
+        self._tokens = float(self.capacity)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated_at) * self.rate
+                )
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+def run_concurrently(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_workers: int = BULK_MAX_WORKERS,
+    on_progress: Callable[[int, int], None] | None = None,
+) -> List[Any]:
+    """
+    items의 각 항목에 func를 스레드 풀에서 실행하고, 입력 순서대로 결과를 반환합니다.
+    func에서 발생한 예외는 해당 항목의 결과로 담깁니다.
+    on_progress(완료 수, 전체 수)는 호출한 스레드에서 불리므로 Streamlit 요소를 갱신해도 됩니다.
+    """
+    items = list(items)
+    results: List[Any] = [None] * len(items)
+    if not items:
+        return results
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(max_workers, len(items))),
+        thread_name_prefix="bulk",
+    ) as executor:
+        futures = {executor.submit(func, item): i for i, item in enumerate(items)}
+        for done, future in enumerate(as_completed(futures), start=1):
+            try:
+                results[futures[future]] = future.result()
+            except Exception as e:
+                results[futures[future]] = e
+            if on_progress is not None:
+                on_progress(done, len(items))
+    return results
+
+
+def batched(items: Iterable[Any], size: int = BULK_BATCH_SIZE) -> Iterator[List[Any]]:
+    """items를 size개씩 묶어 차례로 반환합니다. (마지막 묶음은 더 짧을 수 있음)"""
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
@@ -0,0 +1,128 @@
+# services/conversation_table.py
+import numpy as np
+import pandas as pd
+
+from services.search_index import SearchIndex
+
+# 대화방 검색 대상 필드
+CONVERSATION_SEARCH_FIELDS = ["user.email", "user.username", "persona.name", "title"]
+
+
+def _build_display_df(conversations: list) -> pd.DataFrame:
+    """대화방 목록을 화면 표시용 컬럼의 DataFrame으로 변환합니다."""
+    raw = pd.DataFrame.from_records(conversations)
+
+    def column(name: str) -> pd.Series:
+        if name in raw:
+            return raw[name]
+        return pd.Series([None] * len(raw), dtype=object)
+
+    users = column("user")
+    personas = column("persona")
+    # 원본 시간은 UTC 기준이므로 UTC로 해석한 뒤 KST 문자열로 미리 변환해 둡니다.
+    # 변환에 실패한 값(None 등)은 'N/A'로 표시합니다.
+    last_message_at = pd.to_datetime(
+        column("last_message_at"), errors="coerce", utc=True
+    )
+
+    return pd.DataFrame(
+        {
+            "ID": column("id"),
+            "사용자 ID": users.str.get("id").fillna("N/A"),
+            "사용자 이메일": users.str.get("email").fillna("N/A"),
+            "페르소나": personas.str.get("name").fillna("N/A"),
+            "시나리오 ID": pd.to_numeric(
+                column("applied_phishing_case_id"), errors="coerce"
+            )
+            .fillna(0)
+            .astype(int),
+            "대화방 제목": column("title"),
+            "마지막 대화": last_message_at.dt.tz_convert("Asia/Seoul")
+            .dt.strftime("%Y-%m-%d %H:%M:%S")
+            .fillna("N/A"),
+        }
+    )
+
+
+class ConversationTable:
+    """
+    불러온 대화방 목록과 검색 색인을 보관하는 테이블 모델.
+    새 페이지는 append로 기존 행 뒤에 덧붙이며(이미 처리한 행은 다시 처리하지 않음),
+    재실행 시에는 검색(search)과 화면에 보일 행의 변환(display)만 수행합니다.
+    검색 색인은 처음 검색어로 검색할 때 만들고, 이후에는 변경된 행만 반영합니다.
+    """
+
+    def __init__(self, conversations: list = ()):
+        self.rows: list = []
+        self._position_by_id: dict = {}
+        self._removed_positions: set = set()
+        self._index: SearchIndex | None = None
+        self.append(conversations)
+
+    @property
+    def index(self) -> SearchIndex:
+        if self._index is None:
+            self._index = SearchIndex(CONVERSATION_SEARCH_FIELDS)
+            for conversation_id, position in self._position_by_id.items():
+                self._index.upsert(conversation_id, self.rows[position])
+        return self._index
+
+    def append(self, conversations: list) -> None:
+        """
+        새로 불러온 대화방을 기존 행 뒤에 덧붙이고, 색인이 있으면 해당 행만 색인합니다.
+        이미 있는 대화방은 건너뜁니다. (목록이 바뀌어 페이지 경계가 밀린 경우)
+        """
+        for conversation in conversations:
+            conversation_id = conversation.get("id")
+            if conversation_id in self._position_by_id:
+                continue
+            self._position_by_id[conversation_id] = len(self.rows)
+            self.rows.append(conversation)
+            if self._index is not None:
+                self._index.upsert(conversation_id, conversation)
+
+    def upsert(self, conversation: dict) -> None:
+        """대화방 하나를 수정하거나, 없으면 목록 끝에 추가합니다."""
+        position = self._position_by_id.get(conversation.get("id"))
+        if position is None:
+            self.append([conversation])
+            return
+        self.rows[position] = conversation
+        if self._index is not None:
+            self._index.upsert(conversation.get("id"), conversation)
+
+    def __len__(self) -> int:
+        return len(self.rows) - len(self._removed_positions)
+
+    def search(self, query: str) -> np.ndarray:
+        """
+        사용자 이메일/이름, 페르소나 이름, 대화방 제목에 검색어가 포함된
+        행의 위치를 원래 순서대로 반환합니다.
+        """
+        if not query:
+            positions = np.arange(len(self.rows))
+            if self._removed_positions:
+                positions = np.setdiff1d(positions, list(self._removed_positions))
+            return positions
+        matched_ids = self.index.search(query)
+        return np.array(
+            sorted(self._position_by_id[rid] for rid in matched_ids), dtype=int
+        )
+
+    def display(self, positions) -> pd.DataFrame:
+        """주어진 행 위치의 표시용 DataFrame을 반환합니다. (해당 행만 변환)"""
+        positions = list(positions)
+        display_df = _build_display_df([self.rows[p] for p in positions])
+        display_df.index = pd.Index(positions)
+        return display_df
+
+    def position_of(self, conversation_id: int) -> int | None:
+        return self._position_by_id.get(conversation_id)
+
+    def remove(self, conversation_id: int) -> None:
+        """삭제된 대화방을 테이블을 다시 만들지 않고 검색 결과에서 제외합니다."""
+        position = self._position_by_id.pop(conversation_id, None)
+        if position is not None:
+            self._removed_positions.add(position)
+            if self._index is not None:
+                self._index.remove(conversation_id)
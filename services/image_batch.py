@@ -0,0 +1,115 @@
+# services/image_batch.py
+import mimetypes
+import os
+import threading
+import time
+import zipfile
+from typing import Any, Callable, Dict, List, Tuple
+
+from .bulk import TokenBucket, run_concurrently
+from .image_preprocess import preprocess_image
+
+# 일괄 이미지 분석의 기본 동시 작업 수와 초당 요청 수 상한
+IMAGE_BATCH_MAX_WORKERS = int(os.getenv("IMAGE_BATCH_MAX_WORKERS", "4"))
+IMAGE_BATCH_RATE_PER_SEC = float(os.getenv("IMAGE_BATCH_RATE_PER_SEC", "2"))
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".webp")
+
+# 분석할 이미지: (파일 이름, 이미지 바이트를 읽는 함수)
+BatchImage = Tuple[str, Callable[[], bytes]]
+
+
+def _is_image_name(name: str) -> bool:
+    base = os.path.basename(name)
+    return (
+        name.lower().endswith(IMAGE_EXTENSIONS)
+        and not base.startswith(".")
+        and not name.startswith("__MACOSX/")
+    )
+
+
+def collect_batch_images(uploaded_files) -> List[BatchImage]:
+    """
+    업로드된 이미지 파일과 zip 파일에서 분석할 이미지 목록을 만듭니다.
+    zip 안의 이미지는 분석할 때 하나씩 압축을 풀어 읽습니다.
+    """
+    images: List[BatchImage] = []
+    for uploaded_file in uploaded_files:
+        if uploaded_file.name.lower().endswith(".zip"):
+            archive = zipfile.ZipFile(uploaded_file)
+            for info in archive.infolist():
+                if not info.is_dir() and _is_image_name(info.filename):
+                    name = f"{uploaded_file.name}/{info.filename}"
+                    images.append((name, lambda info=info: archive.read(info)))
+        elif _is_image_name(uploaded_file.name):
+            images.append((uploaded_file.name, uploaded_file.getvalue))
+    return images
+
+
+def analyze_image_batch(
+    api_client,
+    token: str,
+    images: List[BatchImage],
+    rows: List[Dict[str, Any]],
+    max_workers: int = IMAGE_BATCH_MAX_WORKERS,
+    rate_per_sec: float = IMAGE_BATCH_RATE_PER_SEC,
+    force: bool = False,
+    preprocess: Dict[str, Any] | None = None,
+    on_progress: Callable[[int, int], None] | None = None,
+) -> List[Dict[str, Any]]:
+    """
+    이미지를 동시에 분석하고, 끝나는 순서대로 결과 행을 rows에 덧붙입니다.
+    rows를 화면에서 주기적으로 읽으면 분석이 끝나기 전에도 결과를 표시할 수 있습니다.
+    캐시에 결과가 있는 이미지는 요청하지 않으며(force=True이면 모두 다시 분석),
+    preprocess가 주어지면 각 이미지를 preprocess_image(**preprocess)로 줄여서 보냅니다.
+    각 행은 file, phishing_score, reason, latency_sec, cached, original_kb, sent_kb,
+    error 키를 가집니다. 캐시에서 가져온 행의 latency_sec는 None입니다.
+    """
+    bucket = TokenBucket(rate_per_sec)
+    lock = threading.Lock()
+
+    def analyze(image: BatchImage) -> Dict[str, Any]:
+        name, read = image
+        row = {
+            "file": name,
+            "phishing_score": None,
+            "reason": None,
+            "latency_sec": None,
+            "cached": False,
+            "original_kb": None,
+            "sent_kb": None,
+            "error": None,
+        }
+        try:
+            image_bytes = read()
+            content_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+            row["original_kb"] = round(len(image_bytes) / 1024, 1)
+            if preprocess is not None:
+                prepared = preprocess_image(image_bytes, content_type, **preprocess)
+                image_bytes, content_type = prepared.data, prepared.content_type
+            row["sent_kb"] = round(len(image_bytes) / 1024, 1)
+            result = (
+                None if force else api_client.get_cached_image_analysis(image_bytes)
+            )
+            if result is None:
+                # 캐시에 없는 이미지만 요청 속도 제한을 받고, 응답 시간을 기록합니다.
+                bucket.acquire()
+                started_at = time.perf_counter()
+                result = api_client.analyze_image(
+                    token, image_bytes, content_type, force=True
+                )
+                row["latency_sec"] = round(time.perf_counter() - started_at, 2)
+            if result and "phishing_score" in result:
+                row["phishing_score"] = result["phishing_score"]
+                row["reason"] = result.get("reason")
+                row["cached"] = bool(result.get("cached"))
+            else:
+                row["error"] = str((result or {}).get("detail", "알 수 없는 오류"))
+        except Exception as e:
+            row["error"] = str(e)
+        with lock:
+            rows.append(row)
+        return row
+
+    run_concurrently(analyze, images, max_workers=max_workers, on_progress=on_progress)
+    return rows
@@ -0,0 +1,148 @@
+# services/image_preprocess.py
+import io
+import os
+
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+# 업로드/분석 전에 적용할 최대 가로·세로 크기(px), 출력 형식, 압축 품질
+IMAGE_MAX_DIMENSION = int(os.getenv("IMAGE_MAX_DIMENSION", "1600"))
+IMAGE_OUTPUT_FORMAT = os.getenv("IMAGE_OUTPUT_FORMAT", "WEBP").upper()
+IMAGE_QUALITY = int(os.getenv("IMAGE_QUALITY", "80"))
+
+OUTPUT_FORMATS = {
+    "WEBP": ("image/webp", ".webp"),
+    "JPEG": ("image/jpeg", ".jpg"),
+}
+
+
+class PreparedImage:
+    """전처리를 마친 이미지와, 원본 대비 크기 정보"""
+
+    def __init__(
+        self,
+        data: bytes,
+        content_type: str,
+        extension: str | None,
+        original_size: int,
+        original_dimensions: tuple | None = None,
+        dimensions: tuple | None = None,
+    ):
+        self.data = data
+        self.content_type = content_type
+        self.extension = extension
+        self.original_size = original_size
+        self.original_dimensions = original_dimensions
+        self.dimensions = dimensions
+
+    @property
+    def size(self) -> int:
+        return len(self.data)
+
+    @property
+    def saved_bytes(self) -> int:
+        return self.original_size - self.size
+
+    @property
+    def saved_ratio(self) -> float:
+        return self.saved_bytes / self.original_size if self.original_size else 0.0
+
+    def file_name(self, original_name: str) -> str:
+        """원본 파일 이름의 확장자를 전처리된 형식에 맞게 바꿉니다."""
+        if self.extension is None:
+            return original_name
+        return os.path.splitext(original_name)[0] + self.extension
+
+    def summary(self) -> str:
+        text = (
+            f"{self.original_size / 1024:,.0f} KB → {self.size / 1024:,.0f} KB "
+            f"({self.saved_ratio:.0%} 절감)"
+        )
+        if self.dimensions and self.dimensions != self.original_dimensions:
+            width, height = self.dimensions
+            text += f", {width}×{height}px로 축소"
+        return text
+
+
+def _flatten_alpha(image: Image.Image) -> Image.Image:
+    """투명 배경을 흰색으로 채워 RGB 이미지로 만듭니다. (JPEG는 투명도를 지원하지 않음)"""
+    if image.mode in ("RGBA", "LA", "PA") or "transparency" in image.info:
+        image = image.convert("RGBA")
+        background = Image.new("RGB", image.size, (255, 255, 255))
+        background.paste(image, mask=image.getchannel("A"))
+        return background
+    return image.convert("RGB")
+
+
+def preprocess_image(
+    data: bytes,
+    content_type: str = "application/octet-stream",
+    max_dimension: int = IMAGE_MAX_DIMENSION,
+    output_format: str = IMAGE_OUTPUT_FORMAT,
+    quality: int = IMAGE_QUALITY,
+) -> PreparedImage:
+    """
+    이미지를 회전 정보(EXIF)대로 바로 세우고, 긴 변을 max_dimension 이하로 줄인 뒤
+    output_format(WEBP/JPEG)으로 다시 압축합니다. EXIF 등 메타데이터는 제거됩니다.
+    메타데이터가 없는 이미지는 다시 압축한 결과가 원본보다 작을 때만 사용하며,
+    읽지 못한 이미지나 픽셀 수가 지나치게 많은 이미지(압축 폭탄)는 원본을 그대로 반환합니다.
+    """
+    output_format = output_format.upper()
+    mime, extension = OUTPUT_FORMATS[output_format]
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            original_dimensions = image.size
+            has_metadata = bool(image.getexif()) or "xmp" in image.info
+            image = ImageOps.exif_transpose(image)
+            image.thumbnail((max_dimension, max_dimension), Image.Resampling.LANCZOS)
+            if output_format == "JPEG":
+                image = _flatten_alpha(image)
+            elif image.mode not in ("RGB", "RGBA"):
+                has_alpha = image.mode in ("LA", "PA") or "transparency" in image.info
+                image = image.convert("RGBA" if has_alpha else "RGB")
+            # 색 프로필만 남기고 EXIF/XMP 등 메타데이터는 저장하지 않습니다.
+            icc_profile = image.info.get("icc_profile")
+            image.info = {}
+            buffer = io.BytesIO()
+            # method는 WebP, optimize는 JPEG에만 적용되는 옵션입니다.
+            image.save(
+                buffer,
+                format=output_format,
+                quality=quality,
+                method=4,
+                optimize=True,
+                icc_profile=icc_profile,
+            )
+            if buffer.tell() >= len(data) and not has_metadata:
+                # 다시 압축해도(크기를 줄여도) 작아지지 않으면 원본이 더 작으므로 원본을 사용합니다.
+                # 메타데이터가 있으면 제거해야 하므로 커지더라도 다시 압축한 이미지를 사용합니다.
+                return PreparedImage(
+                    data,
+                    content_type,
+                    None,
+                    len(data),
+                    original_dimensions,
+                    original_dimensions,
+                )
+            return PreparedImage(
+                buffer.getvalue(),
+                mime,
+                extension,
+                len(data),
+                original_dimensions,
+                image.size,
+            )
+    except (
+        UnidentifiedImageError,
+        Image.DecompressionBombError,
+        OSError,
+        ValueError,
+    ) as e:
+        print(f"이미지 전처리 실패, 원본을 사용합니다: {e}")
+        return PreparedImage(data, content_type, None, len(data))
+
+
+def prepare_uploaded_image(uploaded_file, **options) -> PreparedImage:
+    """Streamlit 업로드 파일을 전처리합니다. options는 preprocess_image로 전달됩니다."""
+    return preprocess_image(
+        uploaded_file.getvalue(), uploaded_file.type or "image/png", **options
+    )
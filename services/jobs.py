@@ -0,0 +1,149 @@
+# services/jobs.py
+import base64
+import hashlib
+import itertools
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List
+
+# 동시에 실행할 수 있는 백그라운드 작업 수와, 보관할 완료 작업 수
+JOB_MAX_WORKERS = int(os.getenv("JOB_MAX_WORKERS", "4"))
+JOB_HISTORY_LIMIT = int(os.getenv("JOB_HISTORY_LIMIT", "100"))
+
+QUEUED, RUNNING, DONE, FAILED = "queued", "running", "done", "failed"
+
+
+def _token_subject(token: str) -> str | None:
+    """JWT 페이로드의 sub(사용자 식별자) 클레임을 읽습니다. (서명은 백엔드가 검증)"""
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(
+            base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4))
+        )
+    except (IndexError, ValueError):
+        return None
+    subject = claims.get("sub") if isinstance(claims, dict) else None
+    return str(subject) if subject is not None else None
+
+
+def job_owner(token: str) -> str:
+    """
+    로그인한 관리자(JWT의 sub)로 작업 소유자 식별자를 만듭니다.
+    다시 로그인해 토큰이 바뀌어도 같은 관리자의 작업이 그대로 보입니다.
+    sub를 읽을 수 없는 토큰이면 토큰으로 만들며, 토큰 자체는 보관하지 않습니다.
+    """
+    subject = _token_subject(token)
+    source = f"sub:{subject}" if subject is not None else token
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()[:16]
+
+
+class Job:
+    """
+    백그라운드 작업 하나의 상태.
+    작업 함수는 Job을 인자로 받아 set_progress()로 진행률을 알리고, 결과를 반환합니다.
+    """
+
+    def __init__(self, job_id: int, owner: str, kind: str, label: str):
+        self.id = job_id
+        self.owner = owner
+        self.kind = kind
+        self.label = label
+        self.state = QUEUED
+        self.progress = 0.0
+        self.message = ""
+        self.result: Any = None
+        self.error: str | None = None
+        self.created_at = time.time()
+        self.started_at: float | None = None
+        self.finished_at: float | None = None
+
+    def set_progress(self, done: int, total: int, message: str | None = None) -> None:
+        """run_concurrently 등의 on_progress(완료 수, 전체 수)로 그대로 넘길 수 있습니다."""
+        self.progress = done / total if total else 0.0
+        self.message = message or f"{done}/{total}"
+
+    @property
+    def is_finished(self) -> bool:
+        return self.state in (DONE, FAILED)
+
+    @property
+    def elapsed(self) -> float:
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.time()) - self.started_at
+
+
+class JobRunner:
+    """
+    스레드 풀에서 관리자 작업을 실행하고 상태를 작업 테이블에 보관하는 프로세스 공용 실행기.
+    Streamlit 스크립트와 별개의 스레드에서 실행되므로, 재실행되어도 작업이 중단되지 않습니다.
+    작업 함수에서는 st.* 를 호출하지 말고, 결과는 반환값으로 전달해야 합니다.
+    """
+
+    def __init__(self, max_workers: int = JOB_MAX_WORKERS):
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="admin-job"
+        )
+        self._jobs: Dict[int, Job] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def submit(
+        self, owner: str, kind: str, label: str, func: Callable[[Job], Any]
+    ) -> Job:
+        with self._lock:
+            job = Job(next(self._ids), owner, kind, label)
+            self._jobs[job.id] = job
+            self._prune()
+        self._executor.submit(self._run, job, func)
+        return job
+
+    def _run(self, job: Job, func: Callable[[Job], Any]) -> None:
+        job.state = RUNNING
+        job.started_at = time.time()
+        try:
+            job.result = func(job)
+            job.progress = 1.0
+            job.state = DONE
+        except Exception as e:
+            print(f"백그라운드 작업 실패 ({job.label}): {e}")
+            job.error = str(e)
+            job.state = FAILED
+        finally:
+            job.finished_at = time.time()
+
+    def _prune(self) -> None:
+        finished = [job for job in self._jobs.values() if job.is_finished]
+        for job in finished[: max(0, len(finished) - JOB_HISTORY_LIMIT)]:
+            del self._jobs[job.id]
+
+    def get(self, job_id: int) -> Job | None:
+        return self._jobs.get(job_id)
+
+    def list_jobs(self, owner: str) -> List[Job]:
+        """소유자의 작업을 최신순으로 반환합니다."""
+        with self._lock:
+            jobs = [job for job in self._jobs.values() if job.owner == owner]
+        return sorted(jobs, key=lambda job: job.id, reverse=True)
+
+    def clear_finished(self, owner: str) -> None:
+        with self._lock:
+            for job in list(self._jobs.values()):
+                if job.owner == owner and job.is_finished:
+                    del self._jobs[job.id]
+
+
+_runner: JobRunner | None = None
+_runner_lock = threading.Lock()
+
+
+def get_job_runner() -> JobRunner:
+    """프로세스 전체에서 공유하는 JobRunner를 반환합니다."""
+    global _runner
+    with _runner_lock:
+        if _runner is None:
+            _runner = JobRunner()
+        return _runner
@@ -0,0 +1,191 @@
+# services/persona_backup.py
+import json
+import mimetypes
+import posixpath
+import tempfile
+import zipfile
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Tuple
+
+from .backup_stream import ExportFile, iter_backup_records, remove_export_file
+from .bulk import (
+    BULK_MAX_WORKERS,
+    BULK_RATE_PER_SEC,
+    TokenBucket,
+    batched,
+    run_concurrently,
+)
+
+# zip 백업 안의 페르소나 목록 파일과 프로필 이미지 폴더
+MANIFEST_NAME = "personas.ndjson"
+LEGACY_MANIFEST_NAME = "personas.json"
+IMAGES_DIR = "images/"
+
+# 백업 안의 이미지 하나를 여는 함수 (업로드할 때 zip에서 바로 읽습니다)
+OpenImage = Callable[[], BinaryIO]
+
+
+def export_persona_backup_zip(
+    api_client, token: str, personas: List[Dict[str, Any]]
+) -> ExportFile:
+    """
+    페르소나 목록과 프로필 이미지를 하나의 zip 임시 파일로 묶습니다.
+    이미지는 원래 object_key 경로 그대로 images/ 아래에 저장되며,
+    묶음(BULK_BATCH_SIZE) 단위로 동시에 내려받아 바로 파일에 쓰므로 메모리에 모아 두지 않습니다.
+    내려받지 못한 이미지가 있으면 ExportFile.warning에 안내 문구를 담습니다.
+    """
+    keys = list(
+        dict.fromkeys(
+            p["profile_image_key"] for p in personas if p.get("profile_image_key")
+        )
+    )
+    urls = api_client.get_presigned_urls_for_download(token, keys)
+
+    def download(key: str) -> bytes | None:
+        url = urls.get(key)
+        return api_client.download_file_from_s3(url) if url else None
+
+    missing = 0
+    with tempfile.NamedTemporaryFile(
+        prefix="mung_personas_", suffix=".zip", delete=False
+    ) as f:
+        try:
+            with zipfile.ZipFile(f, "w", zipfile.ZIP_DEFLATED) as archive:
+                archive.writestr(
+                    MANIFEST_NAME,
+                    "".join(json.dumps(p, ensure_ascii=False) + "\n" for p in personas),
+                )
+                for batch in batched(keys):
+                    for key, data in zip(batch, run_concurrently(download, batch)):
+                        if not isinstance(data, bytes):
+                            missing += 1
+                            continue
+                        # 이미지는 이미 압축된 형식이므로 다시 압축하지 않습니다.
+                        archive.writestr(
+                            IMAGES_DIR + key, data, compress_type=zipfile.ZIP_STORED
+                        )
+        except BaseException:
+            f.close()
+            remove_export_file(f.name)
+            raise
+    warning = (
+        f"이미지 {missing}개를 내려받지 못해 백업에서 제외했습니다."
+        if missing
+        else None
+    )
+    return ExportFile(f.name, len(personas), warning)
+
+
+def read_persona_backup(
+    uploaded_file,
+) -> Tuple[Iterator[Dict[str, Any]], Dict[str, OpenImage]]:
+    """
+    백업 파일을 열어 (페르소나 레코드 제너레이터, object_key별 이미지를 여는 함수)를 반환합니다.
+    zip 백업과 gzip NDJSON/JSON 백업을 지원하며, 이미지가 없는 백업은 빈 dict를 반환합니다.
+    이미지는 미리 읽지 않고, 업로드할 때 zip에서 하나씩 열어 스트리밍합니다.
+    """
+    images: Dict[str, OpenImage] = {}
+    if not getattr(uploaded_file, "name", "").lower().endswith(".zip"):
+        return iter_backup_records(uploaded_file), images
+
+    archive = zipfile.ZipFile(uploaded_file)
+    names = archive.namelist()
+    if MANIFEST_NAME not in names:
+        manifest_name = LEGACY_MANIFEST_NAME
+    else:
+        manifest_name = MANIFEST_NAME
+    manifest = archive.open(manifest_name)
+    for name in names:
+        if name.startswith(IMAGES_DIR) and not name.endswith("/"):
+            images[name[len(IMAGES_DIR) :]] = lambda name=name: archive.open(name)
+    return iter_backup_records(manifest), images
+
+
+def _upload_image(
+    api_client,
+    token: str,
+    original_key: str,
+    open_image: OpenImage,
+    bucket: TokenBucket,
+) -> str | None:
+    """백업의 이미지를 새 object_key로 업로드하고, 그 키를 반환합니다."""
+    bucket.acquire()
+    content_type = mimetypes.guess_type(original_key)[0] or "application/octet-stream"
+    with open_image() as image_file:
+        return api_client.upload_file(
+            token,
+            image_file,
+            posixpath.basename(original_key),
+            "personas",
+            content_type,
+        )
+
+
+def restore_personas(
+    api_client,
+    token: str,
+    records: Iterable[Dict[str, Any]],
+    images: Dict[str, OpenImage],
+    total: int | None = None,
+    max_workers: int = BULK_MAX_WORKERS,
+    rate_per_sec: float = BULK_RATE_PER_SEC,
+    on_progress: Callable[[int, int], None] | None = None,
+) -> Dict[str, int]:
+    """
+    백업의 페르소나를 동시에 생성합니다. 백엔드 요청은 토큰 버킷으로 속도를 제한합니다.
+    백업에 이미지가 있으면 먼저 업로드하고, 새 object_key를 생성할 페르소나에 연결합니다.
+    (JSON 백업처럼 이미지가 없으면, 다른 페르소나의 이미지를 공유하지 않도록 연결하지 않습니다.)
+    records는 스트리밍으로 읽어도 되며, 묶음 단위로 처리합니다.
+    """
+    bucket = TokenBucket(rate_per_sec)
+
+    def restore(record: Dict[str, Any]) -> str:
+        original_key = record.get("profile_image_key")
+        image_key = None
+        if original_key and original_key in images:
+            image_key = _upload_image(
+                api_client, token, original_key, images[original_key], bucket
+            )
+        bucket.acquire()
+        result = api_client.create_persona(
+            token=token,
+            name=record.get("name", "이름 없음"),
+            system_prompt=record.get("system_prompt", ""),
+            description=record.get("description"),
+            profile_image_key=image_key,
+            starting_message=record.get("starting_message"),
+            conversation_starters=record.get("conversation_starters"),
+        )
+        if not (result and "id" in result):
+            if image_key:
+                # 페르소나 생성에 실패하면 연결되지 않은 이미지를 남기지 않습니다.
+                api_client.delete_s3_object(token, image_key)
+            return "failed"
+        if original_key in images and image_key is None:
+            return "image_failed"
+        return "relinked" if image_key else "created"
+
+    def report(count: int) -> None:
+        if on_progress is not None:
+            on_progress(count, max(total or 0, count))
+
+    summary = {"success": 0, "failed": 0, "images_relinked": 0, "images_failed": 0}
+    processed = 0
+    for batch in batched(records):
+        base = processed
+        outcomes = run_concurrently(
+            restore,
+            batch,
+            max_workers=max_workers,
+            on_progress=lambda count, _: report(base + count),
+        )
+        for outcome in outcomes:
+            if isinstance(outcome, Exception) or outcome == "failed":
+                summary["failed"] += 1
+                continue
+            summary["success"] += 1
+            if outcome == "relinked":
+                summary["images_relinked"] += 1
+            elif outcome == "image_failed":
+                summary["images_failed"] += 1
+        processed += len(batch)
+    return summary
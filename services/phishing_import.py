@@ -0,0 +1,150 @@
+# services/phishing_import.py
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from typing import Any, Callable, Dict, Iterable
+
+from .bulk import (
+    BULK_MAX_WORKERS,
+    BULK_RATE_PER_SEC,
+    TokenBucket,
+    batched,
+    run_concurrently,
+)
+
+# 가져오기 진행 상황을 기록하는 체크포인트 파일 위치
+IMPORT_CHECKPOINT_DIR = os.getenv(
+    "IMPORT_CHECKPOINT_DIR",
+    os.path.join(tempfile.gettempdir(), "mung_import_checkpoints"),
+)
+
+# 같은 사례인지 판단하는 데 사용하는 필드
+FINGERPRINT_FIELDS = ["category_code", "title", "content"]
+
+
+def case_fingerprint(case: Dict[str, Any]) -> str:
+    """유형 코드, 제목, 내용으로 사례의 내용 해시를 계산합니다. (앞뒤 공백 무시)"""
+    parts = [str(case.get(field) or "").strip() for field in FINGERPRINT_FIELDS]
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+def import_id_for(data: bytes) -> str:
+    """가져올 파일의 내용으로 체크포인트 식별자를 만듭니다."""
+    return hashlib.sha256(data).hexdigest()[:16]
+
+
+class ImportCheckpoint:
+    """
+    가져오기에서 생성이 끝난 사례를 한 줄씩 덧붙여 기록하는 체크포인트 파일.
+    중단된 가져오기를 다시 실행하면 기록된 사례는 건너뜁니다.
+    """
+
+    def __init__(self, import_id: str, directory: str = IMPORT_CHECKPOINT_DIR):
+        self.path = os.path.join(directory, f"phishing_import_{import_id}.ndjson")
+        self._lock = threading.Lock()
+
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+
+    def load(self) -> Dict[str, Any]:
+        """기록된 {fingerprint: 생성된 사례 id}를 반환합니다."""
+        done: Dict[str, Any] = {}
+        if not self.exists():
+            return done
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # 기록 도중 중단되어 잘린 마지막 줄은 무시합니다.
+                    continue
+                done[entry["fingerprint"]] = entry.get("id")
+        return done
+
+    def record(self, fingerprint: str, case_id: Any) -> None:
+        line = json.dumps({"fingerprint": fingerprint, "id": case_id}) + "\n"
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def clear(self) -> None:
+        if self.exists():
+            os.remove(self.path)
+
+
+def import_phishing_cases(
+    api_client,
+    token: str,
+    cases: Iterable[Dict[str, Any]],
+    import_id: str,
+    total: int | None = None,
+    max_workers: int = BULK_MAX_WORKERS,
+    rate_per_sec: float = BULK_RATE_PER_SEC,
+    on_progress: Callable[[int, int], None] | None = None,
+) -> Dict[str, int]:
+    """
+    피싱 사례를 중복 없이 동시에 생성합니다.
+    - 체크포인트에 기록된 사례(이전 실행에서 생성됨)는 건너뜁니다.
+    - 서버에 같은 내용의 사례가 있거나 파일 안에서 중복된 사례는 건너뜁니다.
+    - 생성에 성공할 때마다 체크포인트에 기록하며, 모두 성공하면 체크포인트를 지웁니다.
+    cases는 스트리밍으로 읽어도 되며, 묶음 단위로 처리하므로 메모리 사용량이 일정합니다.
+    on_progress(처리한 사례 수, total)는 건너뛴 사례를 포함해 호출됩니다.
+    """
+    checkpoint = ImportCheckpoint(import_id)
+    done = checkpoint.load()
+    existing_cases = api_client.get_all_phishing_cases(token)
+    if existing_cases is None:
+        # 서버 목록을 모르면 중복 여부를 판단할 수 없으므로 가져오기를 시작하지 않습니다.
+        raise RuntimeError("서버의 피싱 사례 목록을 불러오지 못했습니다.")
+    existing = {case_fingerprint(case) for case in existing_cases}
+
+    bucket = TokenBucket(rate_per_sec)
+
+    def create(item) -> bool:
+        fingerprint, case = item
+        bucket.acquire()
+        result = api_client.create_phishing_case(token, case)
+        if result and "id" in result:
+            checkpoint.record(fingerprint, result["id"])
+            return True
+        return False
+
+    def report(count: int) -> None:
+        if on_progress is not None:
+            on_progress(count, max(total or 0, count))
+
+    summary = {"created": 0, "resumed": 0, "duplicates": 0, "failed": 0}
+    seen = set()
+    processed = 0
+    for batch in batched(cases):
+        pending = []
+        for case in batch:
+            fingerprint = case_fingerprint(case)
+            if fingerprint in done:
+                summary["resumed"] += 1
+            elif fingerprint in existing or fingerprint in seen:
+                summary["duplicates"] += 1
+            else:
+                seen.add(fingerprint)
+                pending.append((fingerprint, case))
+
+        base = processed + len(batch) - len(pending)
+        outcomes = run_concurrently(
+            create,
+            pending,
+            max_workers=max_workers,
+            on_progress=lambda count, _: report(base + count),
+        )
+        for outcome in outcomes:
+            summary["created" if outcome is True else "failed"] += 1
+        processed += len(batch)
+        report(processed)
+
+    if summary["failed"] == 0:
+        checkpoint.clear()
+    return summary
@@ -0,0 +1,113 @@
+# services/search_index.py
+from collections import defaultdict
+from typing import Any, Dict, Hashable, Iterable, Set
+
+
+class SearchIndex:
+    """
+    대소문자를 구분하지 않는 부분 문자열 검색용 n-gram(1~3글자) 역색인.
+    n-gram은 항목이 아니라 서로 다른 필드 값마다 한 번만 색인하고(같은 이메일/페르소나 이름을
+    가진 항목이 많아도 색인 비용이 늘지 않음), 값별로 그 값을 가진 항목 id를 보관합니다.
+    3글자 이하의 검색어는 색인에서 바로 찾고, 더 긴 검색어는 트라이그램 목록을 교집합하여
+    후보 값을 좁힌 뒤 실제 포함 여부를 확인하므로, 결과는 str.contains(case=False)와 같습니다.
+    (필드 경계를 넘는 부분 문자열은 일치하지 않습니다.)
+    데이터 로드 시 한 번 생성하고, 이후에는 항목 단위로 추가/수정/삭제할 수 있습니다.
+    """
+
+    def __init__(self, fields: Iterable[str]):
+        # "user.email"처럼 점(.)으로 중첩 필드를 지정할 수 있습니다.
+        self.fields = [field.split(".") for field in fields]
+        self._values: Dict[Hashable, Set[str]] = {}
+        self._ids_by_value: Dict[str, Set[Hashable]] = {}
+        self._postings: Dict[str, Set[str]] = defaultdict(set)
+
+    @classmethod
+    def build(
+        cls, records: Iterable[Dict[str, Any]], fields: Iterable[str], id_key="id"
+    ) -> "SearchIndex":
+        index = cls(fields)
+        for record in records:
+            index.upsert(record[id_key], record)
+        return index
+
+    @staticmethod
+    def _trigrams(text: str) -> Set[str]:
+        return {text[i : i + 3] for i in range(len(text) - 2)}
+
+    @staticmethod
+    def _grams(text: str) -> Set[str]:
+        """색인할 1~3글자 부분 문자열 (짧은 검색어도 전체 항목을 훑지 않도록)"""
+        return {
+            text[i : i + size]
+            for size in (1, 2, 3)
+            for i in range(len(text) - size + 1)
+        }
+
+    def _extract_values(self, record: Dict[str, Any]) -> Set[str]:
+        values = set()
+        for path in self.fields:
+            value: Any = record
+            for part in path:
+                value = value.get(part) if isinstance(value, dict) else None
+            if value is not None:
+                values.add(str(value).lower())
+        return values
+
+    def upsert(self, record_id: Hashable, record: Dict[str, Any]) -> None:
+        """항목을 추가하거나, 이미 있으면 색인을 갱신합니다."""
+        if record_id in self._values:
+            self.remove(record_id)
+        values = self._extract_values(record)
+        self._values[record_id] = values
+        postings = self._postings
+        for value in values:
+            ids = self._ids_by_value.get(value)
+            if ids is None:
+                ids = self._ids_by_value[value] = set()
+                for gram in self._grams(value):
+                    postings[gram].add(value)
+            ids.add(record_id)
+
+    def remove(self, record_id: Hashable) -> None:
+        values = self._values.pop(record_id, None)
+        if values is None:
+            return
+        for value in values:
+            ids = self._ids_by_value[value]
+            ids.discard(record_id)
+            if ids:
+                continue
+            # 더 이상 이 값을 가진 항목이 없으면 값의 n-gram도 색인에서 뺍니다.
+            del self._ids_by_value[value]
+            for gram in self._grams(value):
+                posting = self._postings.get(gram)
+                if posting is not None:
+                    posting.discard(value)
+                    if not posting:
+                        del self._postings[gram]
+
+    def search(self, query: str) -> Set[Hashable]:
+        """검색어를 포함하는 항목의 id 집합을 반환합니다."""
+        query = query.lower()
+        if not query:
+            return set(self._values)
+        if len(query) <= 3:
+            # 3글자 이하의 검색어는 그 자체가 색인된 n-gram입니다.
+            values = self._postings.get(query, ())
+        else:
+            grams = sorted(
+                self._trigrams(query), key=lambda g: len(self._postings.get(g, ()))
+            )
+            candidates = set(self._postings.get(grams[0], ()))
+            for gram in grams[1:]:
+                if not candidates:
+                    break
+                candidates &= self._postings.get(gram, set())
+            values = [value for value in candidates if query in value]
+        matched: Set[Hashable] = set()
+        for value in values:
+            matched |= self._ids_by_value[value]
+        return matched
+
+    def __len__(self) -> int:
+        return len(self._values)
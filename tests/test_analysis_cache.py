@@ -0,0 +1,98 @@
+# tests/test_analysis_cache.py
+import time
+
+import pytest
+
+from api.analysis_cache import AnalysisResultCache
+from api.phishing import PhishingMixin
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+
+    def tick():
+        now[0] += 1
+        return now[0]
+
+    monkeypatch.setattr(time, "time", tick)
+    return now
+
+
+def make_cache(tmp_path, **options):
+    return AnalysisResultCache(str(tmp_path / "cache.sqlite3"), **options)
+
+
+def result(score):
+    return {"phishing_score": score, "reason": f"점수 {score}"}
+
+
+def test_get_returns_stored_result(tmp_path, clock):
+    cache = make_cache(tmp_path)
+    assert cache.get("a") is None
+    cache.set("a", result(80))
+    cached = cache.get("a")
+    assert cached["phishing_score"] == 80
+    assert cached["reason"] == "점수 80"
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+def test_evicts_least_recently_used(tmp_path, clock):
+    cache = make_cache(tmp_path, max_entries=2)
+    cache.set("a", result(1))
+    cache.set("b", result(2))
+    # a를 읽으면 가장 최근에 사용한 항목이 되어 b가 먼저 제거됩니다.
+    assert cache.get("a") is not None
+    cache.set("c", result(3))
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["entries"] == 2
+
+
+def test_set_replaces_existing_entry(tmp_path, clock):
+    cache = make_cache(tmp_path, max_entries=2)
+    cache.set("a", result(1))
+    cache.set("a", result(9))
+    assert cache.get("a")["phishing_score"] == 9
+    assert cache.stats()["entries"] == 1
+
+
+def test_analyzer_version_separates_results(tmp_path, clock):
+    make_cache(tmp_path, version="v1").set("a", result(10))
+    assert make_cache(tmp_path, version="v2").get("a") is None
+    assert make_cache(tmp_path, version="v1").get("a")["phishing_score"] == 10
+
+
+def test_results_survive_reopen_and_clear(tmp_path, clock):
+    make_cache(tmp_path).set("a", result(10))
+    cache = make_cache(tmp_path)
+    assert cache.get("a") is not None
+    cache.clear()
+    assert cache.get("a") is None
+
+
+class AnalyzingClient(PhishingMixin):
+    """분석 요청 대신 정해 둔 결과를 돌려주는 ApiClient 대역"""
+
+    def __init__(self, analysis_cache, response):
+        self.analysis_cache = analysis_cache
+        self.response = response
+
+    def analyze_image_for_phishing(self, token, image, image_content_type):
+        return self.response
+
+
+def test_analyze_image_does_not_cache_missing_score(tmp_path, clock):
+    cache = make_cache(tmp_path)
+    client = AnalyzingClient(cache, {"phishing_score": None, "reason": "판단 불가"})
+    assert client.analyze_image("token", b"image")["phishing_score"] is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_analyze_image_survives_cache_errors(tmp_path, clock):
+    cache = make_cache(tmp_path)
+    cache._conn.close()
+    client = AnalyzingClient(cache, result(70))
+    assert client.analyze_image("token", b"image") == result(70)
@@ -0,0 +1,83 @@
+# tests/test_backup_stream.py
+import gc
+import gzip
+import io
+import json
+import os
+import tempfile
+
+import pytest
+
+from services.backup_stream import (
+    export_ndjson_gz,
+    iter_backup_records,
+    iter_ndjson_gz,
+)
+
+PAGES = [[{"id": 1, "name": "가"}, {"id": 2, "name": "나"}], [], [{"id": 3}]]
+RECORDS = [record for page in PAGES for record in page]
+
+
+def test_iter_ndjson_gz_round_trip():
+    data = b"".join(iter_ndjson_gz(PAGES))
+    lines = gzip.decompress(data).decode("utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == RECORDS
+    # 한글은 이스케이프하지 않고 그대로 기록합니다.
+    assert "가" in lines[0]
+
+
+def test_export_ndjson_gz_counts_records_and_removes_file():
+    export = export_ndjson_gz(iter(PAGES), prefix="test_export_")
+    try:
+        assert export.count == 3
+        with gzip.open(export.path, "rt", encoding="utf-8") as f:
+            assert [json.loads(line) for line in f] == RECORDS
+    finally:
+        export.remove()
+    assert not export.exists()
+    # 두 번 지워도 오류가 나지 않습니다.
+    export.remove()
+
+
+def test_export_file_is_removed_when_released():
+    export = export_ndjson_gz(iter(PAGES), prefix="test_export_")
+    path = export.path
+    del export
+    gc.collect()
+    assert not os.path.exists(path)
+
+
+def test_export_failure_leaves_no_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+
+    def failing_pages():
+        yield PAGES[0]
+        raise ConnectionError("끊김")
+
+    with pytest.raises(ConnectionError):
+        export_ndjson_gz(failing_pages(), prefix="test_export_")
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        gzip.compress(
+            "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in RECORDS).encode()
+        ),
+        "".join(json.dumps(r) + "\n\n" for r in RECORDS).encode(),
+        json.dumps(RECORDS, ensure_ascii=False, indent=2).encode(),
+    ],
+    ids=["ndjson.gz", "ndjson", "json-array"],
+)
+def test_iter_backup_records_reads_all_formats(payload):
+    uploaded = io.BytesIO(payload)
+    assert list(iter_backup_records(uploaded)) == RECORDS
+    # 다시 호출하면 처음부터 읽고, 업로드 파일은 닫히지 않습니다.
+    assert list(iter_backup_records(uploaded)) == RECORDS
+    assert not uploaded.closed
+
+
+def test_iter_backup_records_rejects_non_list_json():
+    with pytest.raises(ValueError):
+        list(iter_backup_records(io.BytesIO(b'[1]\n{"a": 1}')))
@@ -0,0 +1,103 @@
+# tests/test_bulk.py
+import threading
+import time
+
+import pytest
+
+from services.bulk import TokenBucket, batched, run_concurrently
+
+
+class FakeClock:
+    """
+    time.monotonic/time.sleep 대역. sleep하면 시각만 앞으로 옮깁니다.
+    부동소수점 오차로 대기가 끝나지 않는 일이 없도록 rate는 2의 거듭제곱을 사용합니다.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(time, "monotonic", fake.monotonic)
+    monkeypatch.setattr(time, "sleep", fake.sleep)
+    return fake
+
+
+def test_token_bucket_allows_burst_then_waits(clock):
+    bucket = TokenBucket(rate=2, burst=2)
+    bucket.acquire()
+    bucket.acquire()
+    assert clock.now == 0
+    bucket.acquire()
+    assert clock.now == pytest.approx(0.5)
+
+
+def test_token_bucket_limits_rate(clock):
+    bucket = TokenBucket(rate=4)
+    for _ in range(12):
+        bucket.acquire()
+    # 처음 burst(4개) 이후에는 초당 4개씩만 통과합니다.
+    assert clock.now == pytest.approx(2.0)
+
+
+def test_token_bucket_does_not_accumulate_beyond_burst(clock):
+    bucket = TokenBucket(rate=1, burst=1)
+    clock.now = 100
+    bucket.acquire()
+    bucket.acquire()
+    assert clock.now == pytest.approx(101)
+
+
+def test_run_concurrently_keeps_input_order_and_captures_errors():
+    def work(x):
+        if x == 3:
+            raise ValueError("boom")
+        time.sleep(0.01 * (5 - x))
+        return x * 10
+
+    results = run_concurrently(work, range(5), max_workers=5)
+    assert results[:3] == [0, 10, 20]
+    assert isinstance(results[3], ValueError)
+    assert results[4] == 40
+
+
+def test_run_concurrently_limits_workers_and_reports_progress():
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+    progress = []
+
+    def work(_):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.01)
+        with lock:
+            active -= 1
+
+    run_concurrently(
+        work,
+        range(10),
+        max_workers=3,
+        on_progress=lambda done, total: progress.append((done, total)),
+    )
+    assert peak <= 3
+    assert progress == [(i, 10) for i in range(1, 11)]
+
+
+def test_run_concurrently_with_no_items():
+    assert run_concurrently(lambda x: x, []) == []
+
+
+def test_batched():
+    assert list(batched(range(5), 2)) == [[0, 1], [2, 3], [4]]
+    assert list(batched([], 2)) == []
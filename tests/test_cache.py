@@ -0,0 +1,152 @@
+# tests/test_cache.py
+import time
+
+from api.cache import TaggedCache, cached, invalidates, writes_through
+
+
+class FakeClient:
+    """데코레이터가 사용하는 self.cache만 가진 ApiClient 대역"""
+
+    def __init__(self):
+        self.cache = TaggedCache()
+        self.calls = 0
+        self.next_result = None
+
+    @cached("items")
+    def get_items(self, token):
+        self.calls += 1
+        return [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}]
+
+    @invalidates("items")
+    def create_item(self, token):
+        return self.next_result
+
+    @writes_through("items")
+    def update_item(self, token):
+        return self.next_result
+
+
+def test_get_or_load_caches_until_ttl_expires(monkeypatch):
+    cache = TaggedCache(default_ttl=10)
+    now = [1000.0]
+    monkeypatch.setattr(time, "time", lambda: now[0])
+    loads = []
+
+    def loader():
+        loads.append(1)
+        return "value"
+
+    assert cache.get_or_load("k", loader, tags=["t"]) == "value"
+    assert cache.get_or_load("k", loader, tags=["t"]) == "value"
+    assert len(loads) == 1
+    now[0] += 11
+    assert cache.get_or_load("k", loader, tags=["t"]) == "value"
+    assert len(loads) == 2
+
+
+def test_none_is_not_cached():
+    cache = TaggedCache()
+    assert cache.get_or_load("k", lambda: None, tags=["t"]) is None
+    assert cache.get("k") == (False, None)
+
+
+def test_invalidate_removes_only_matching_tags():
+    cache = TaggedCache()
+    cache.set("a", 1, tags=["users"])
+    cache.set("b", 2, tags=["personas"])
+    cache.set("c", 3, tags=["users", "personas"])
+    assert cache.invalidate("users") == 2
+    assert cache.get("a")[0] is False
+    assert cache.get("b") == (True, 2)
+
+
+def test_max_entries_evicts_least_recently_used():
+    cache = TaggedCache(max_entries=2)
+    cache.set("a", 1, tags=["t"])
+    cache.set("b", 2, tags=["t"])
+    cache.get("a")
+    cache.set("c", 3, tags=["t"])
+    assert cache.get("b")[0] is False
+    assert cache.get("a") == (True, 1)
+    assert cache.get("c") == (True, 3)
+    assert cache.stats()["evictions"] == 1
+
+
+def test_expired_entries_are_swept_on_write(monkeypatch):
+    cache = TaggedCache(default_ttl=10)
+    now = [1000.0]
+    monkeypatch.setattr(time, "time", lambda: now[0])
+    cache._last_sweep = now[0]
+    cache.set("old", 1, tags=["t"], ttl=1)
+    now[0] += 11
+    cache.set("new", 2, tags=["t"])
+    assert cache.stats()["entries"] == 1
+
+
+def test_subscribe_notifies_on_invalidate():
+    cache = TaggedCache()
+    seen = []
+    cache.subscribe("urls:", seen.append)
+    cache.invalidate("urls:a", "users")
+    assert seen == ["urls:a"]
+
+
+def test_invalidates_skips_error_payload():
+    client = FakeClient()
+    client.get_items("token")
+    client.next_result = {"detail": "잘못된 요청"}
+    client.create_item("token")
+    client.get_items("token")
+    assert client.calls == 1
+
+    client.next_result = {"id": 3}
+    client.create_item("token")
+    client.get_items("token")
+    assert client.calls == 2
+
+
+def test_writes_through_patches_cached_list():
+    client = FakeClient()
+    client.get_items("other-token")
+    client.next_result = {"id": 2, "name": "changed"}
+    client.update_item("token")
+    # token은 캐시 키에 포함되지 않으므로 다른 세션에도 바로 반영됩니다.
+    assert client.get_items("token")[1] == {"id": 2, "name": "changed"}
+    assert client.calls == 1
+
+
+def test_writes_through_ignores_error_payload():
+    client = FakeClient()
+    items = client.get_items("token")
+    client.next_result = {"detail": "권한이 없습니다."}
+    client.update_item("token")
+    assert client.get_items("token") == items
+    assert client.cache.stats()["write_throughs"] == {}
+
+
+def test_write_through_invalidates_pages_and_patches_exact_records():
+    cache = TaggedCache()
+    cache.set("list", [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}], ["users"])
+    cache.set("page", ([{"id": 1, "name": "a"}], 2), ["users"])
+    cache.set("one", {"id": 1, "name": "a"}, ["users"])
+    cache.set("other", {"id": 2, "name": "b"}, ["users"])
+
+    cache.write_through("users", record={"id": 1, "name": "changed"})
+    assert cache.get("list")[1][0] == {"id": 1, "name": "changed"}
+    assert cache.get("one") == (True, {"id": 1, "name": "changed"})
+    assert cache.get("other") == (True, {"id": 2, "name": "b"})
+    assert cache.get("page")[0] is False
+
+    cache.write_through("users", deleted_id=2)
+    assert cache.get("list")[1] == [{"id": 1, "name": "changed"}]
+    assert cache.get("other")[0] is False
+
+
+def test_write_through_invalidates_empty_lists():
+    cache = TaggedCache()
+    cache.set("empty", [], ["users"])
+    cache.set("list", [{"id": 1, "name": "a"}], ["users"])
+
+    cache.write_through("users", record={"id": 2, "name": "b"})
+    assert cache.get("empty")[0] is False
+    assert cache.get("list")[1] == [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}]
@@ -0,0 +1,48 @@
+# tests/test_conversation_table.py
+import pytest
+
+pytest.importorskip("pandas")
+
+from services.conversation_table import ConversationTable  # noqa: E402
+
+
+def conversation(conversation_id, email="user@example.com", title="대화"):
+    return {
+        "id": conversation_id,
+        "title": title,
+        "user": {"id": 1, "email": email},
+        "persona": {"id": 1, "name": "페르소나"},
+        "last_message_at": "2025-01-01T00:00:00",
+    }
+
+
+def test_append_skips_existing_ids():
+    table = ConversationTable([conversation(1), conversation(2)])
+    table.append([conversation(2), conversation(3)])
+    assert len(table) == 3
+    assert table.search("").tolist() == [0, 1, 2]
+
+
+def test_index_is_built_on_first_search_and_kept_up_to_date():
+    table = ConversationTable([conversation(1, email="kim@example.com")])
+    assert table._index is None
+    assert table.search("kim").tolist() == [0]
+
+    table.append([conversation(2, email="lee@example.com")])
+    table.upsert(conversation(1, email="park@example.com"))
+    assert table.search("lee").tolist() == [1]
+    assert table.search("kim").tolist() == []
+    assert table.search("park").tolist() == [0]
+
+    table.remove(2)
+    assert table.search("lee").tolist() == []
+    assert table.search("").tolist() == [0]
+    assert len(table) == 1
+
+
+def test_display_converts_only_requested_rows():
+    table = ConversationTable([conversation(i, title=f"대화 {i}") for i in range(5)])
+    display_df = table.display([1, 3])
+    assert display_df.index.tolist() == [1, 3]
+    assert display_df["대화방 제목"].tolist() == ["대화 1", "대화 3"]
+    assert display_df["마지막 대화"].tolist() == ["2025-01-01 09:00:00"] * 2
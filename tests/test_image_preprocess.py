@@ -0,0 +1,79 @@
+# tests/test_image_preprocess.py
+import io
+
+import pytest
+
+Image = pytest.importorskip("PIL.Image")
+
+from services.image_preprocess import preprocess_image  # noqa: E402
+
+
+def encode(image, format, **options) -> bytes:
+    buffer = io.BytesIO()
+    image.save(buffer, format=format, **options)
+    return buffer.getvalue()
+
+
+def noisy_image(size, mode="RGB"):
+    """압축이 잘 되지 않는 사진 같은 이미지"""
+    return Image.effect_noise(size, 64).convert(mode)
+
+
+def test_downscales_large_photo():
+    data = encode(noisy_image((3000, 2000)), "PNG")
+    prepared = preprocess_image(data, "image/png", max_dimension=1600)
+    assert prepared.dimensions == (1600, 1067)
+    assert prepared.content_type == "image/webp"
+    assert prepared.size < len(data)
+    assert prepared.file_name("photo.png") == "photo.webp"
+
+
+def test_keeps_original_when_downscaled_image_is_larger():
+    # 흑백 체크무늬 PNG는 매우 작지만, 줄여서 다시 압축하면 오히려 커집니다.
+    pixels = bytes(((x + y) % 2) * 255 for y in range(60) for x in range(2000))
+    image = Image.frombytes("L", (2000, 60), pixels).convert("1")
+    data = encode(image, "PNG")
+    prepared = preprocess_image(data, "image/png", max_dimension=1600)
+    assert prepared.data == data
+    assert prepared.content_type == "image/png"
+    assert prepared.dimensions == (2000, 60)
+    assert prepared.saved_bytes == 0
+
+
+def test_strips_exif_and_applies_orientation():
+    image = noisy_image((40, 20))
+    exif = Image.Exif()
+    exif[0x0112] = 6  # 시계 방향 90도 회전
+    exif[0x010F] = "카메라 제조사"
+    data = encode(image, "JPEG", exif=exif, quality=95)
+    prepared = preprocess_image(data, "image/jpeg", output_format="JPEG", quality=95)
+    with Image.open(io.BytesIO(prepared.data)) as result:
+        assert result.size == (20, 40)
+        assert not result.getexif()
+
+
+def test_jpeg_output_flattens_transparency():
+    image = noisy_image((200, 200), "RGBA")
+    # 왼쪽 절반을 완전히 투명하게 만듭니다.
+    alpha = Image.new("L", (200, 200), 255)
+    alpha.paste(0, (0, 0, 100, 200))
+    image.putalpha(alpha)
+    data = encode(image, "PNG")
+    prepared = preprocess_image(data, "image/png", output_format="JPEG")
+    assert prepared.content_type == "image/jpeg"
+    with Image.open(io.BytesIO(prepared.data)) as result:
+        assert result.mode == "RGB"
+        assert all(channel > 240 for channel in result.getpixel((10, 10)))
+
+
+def test_unreadable_image_returns_original():
+    prepared = preprocess_image(b"not an image", "image/png")
+    assert prepared.data == b"not an image"
+    assert prepared.content_type == "image/png"
+
+
+def test_decompression_bomb_returns_original(monkeypatch):
+    data = encode(Image.new("RGB", (100, 100)), "PNG")
+    monkeypatch.setattr(Image, "MAX_IMAGE_PIXELS", 10)
+    prepared = preprocess_image(data, "image/png")
+    assert prepared.data == data
@@ -0,0 +1,152 @@
+# tests/test_image_transport.py
+import io
+from unittest import mock
+
+import requests
+
+from api import image_transport
+from api.image_transport import ImageTransportMixin, _declares_image_key
+
+# object_key(image_key) 방식을 선언한 백엔드의 OpenAPI 스키마
+SCHEMA = {
+    "paths": {
+        "/api/v1/conversations/{conversation_id}/messages": {
+            "post": {
+                "requestBody": {
+                    "content": {
+                        "application/json": {
+                            "schema": {"$ref": "#/components/schemas/MessageCreate"}
+                        }
+                    }
+                }
+            }
+        }
+    },
+    "components": {
+        "schemas": {
+            "MessageCreate": {
+                "properties": {"content": {}, "image_key": {}, "image_base64": {}}
+            }
+        }
+    },
+}
+MESSAGES_URL = "http://api/api/v1/conversations/7/messages"
+
+
+def _response(status_code, body=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response.raw = io.BytesIO()
+    response._content = (
+        b"" if body is None else requests.compat.json.dumps(body).encode()
+    )
+    return response
+
+
+class FakeSession:
+    """미리 정해 둔 응답을 차례로 돌려주고, 보낸 요청을 기록하는 세션"""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.posts = []
+
+    def post(self, url, **kwargs):
+        self.posts.append(kwargs)
+        return self.responses.pop(0)
+
+
+class FakeClient(ImageTransportMixin):
+    def __init__(self, responses, schema=SCHEMA):
+        self.session = FakeSession(responses)
+        self._image_transport_unsupported_at = {}
+        self.schema = schema
+        self.uploaded = []
+        self.deleted = []
+
+    def _get_api_schema(self):
+        return self.schema
+
+    def upload_image_object(self, token, image, content_type, category):
+        self.uploaded.append(image)
+        return f"key-{len(self.uploaded)}"
+
+    def delete_s3_object(self, token, object_key):
+        self.deleted.append(object_key)
+        return True
+
+
+def _post(client, uploads=None):
+    return client._post_with_image(
+        "token",
+        MESSAGES_URL,
+        {"content": "hi"},
+        b"img",
+        "image/png",
+        "messages",
+        uploads=uploads,
+    )
+
+
+def test_generic_validation_error_is_returned_without_fallback():
+    error = {"detail": [{"loc": ["body", "content"], "msg": "too long"}]}
+    client = FakeClient([_response(422, error)])
+    with mock.patch.object(image_transport, "IMAGE_TRANSPORT", "object_key"):
+        response = _post(client)
+    assert response.status_code == 422
+    assert len(client.session.posts) == 1
+    assert client._image_transport_unsupported_at == {}
+    assert client.deleted == []
+
+
+def test_unsupported_object_key_falls_back_and_deletes_object():
+    client = FakeClient([_response(415), _response(200, {"id": 1})])
+    with mock.patch.object(image_transport, "IMAGE_TRANSPORT", "object_key"):
+        response = _post(client)
+    assert response.status_code == 200
+    assert "files" in client.session.posts[1]
+    assert client.deleted == ["key-1"]
+    assert "object_key" in client._image_transport_unsupported_at
+
+
+def test_missing_transport_field_counts_as_unsupported():
+    error = {"detail": [{"loc": ["body", "image_base64"], "msg": "field required"}]}
+    client = FakeClient([_response(422, error), _response(200, {"id": 1})])
+    with mock.patch.object(image_transport, "IMAGE_TRANSPORT", "multipart"):
+        response = _post(client)
+    assert response.status_code == 200
+    assert "image_base64" in client.session.posts[1]["json"]
+
+
+def test_unsupported_mode_is_retried_after_retry_interval():
+    client = FakeClient([])
+    with mock.patch.object(image_transport, "IMAGE_TRANSPORT", "object_key"):
+        with mock.patch.object(image_transport.time, "time", return_value=1000.0):
+            client._image_transport_unsupported_at["object_key"] = 1000.0
+            assert client._image_transport_modes() == ["multipart", "base64"]
+        later = 1000.0 + image_transport.IMAGE_TRANSPORT_RETRY_SEC
+        with mock.patch.object(image_transport.time, "time", return_value=later):
+            assert client._image_transport_modes()[0] == "object_key"
+
+
+def test_shared_uploads_reuse_object_key():
+    client = FakeClient([_response(404), _response(200, {"id": 1})])
+    uploads = {}
+    with mock.patch.object(image_transport, "IMAGE_TRANSPORT", "object_key"):
+        assert _post(client, uploads).status_code == 404
+        assert _post(client, uploads).status_code == 200
+    assert client.uploaded == [b"img"]
+    assert client.session.posts[1]["json"]["image_key"] == "key-1"
+
+
+def test_declares_image_key_resolves_path_templates_and_refs():
+    assert _declares_image_key(SCHEMA, MESSAGES_URL)
+    assert not _declares_image_key(SCHEMA, "http://api/api/v1/phishing/analyze-image")
+    assert not _declares_image_key({}, MESSAGES_URL)
+
+
+def test_object_key_is_skipped_unless_declared_in_schema():
+    client = FakeClient([_response(200, {"id": 1})], schema=None)
+    with mock.patch.object(image_transport, "IMAGE_TRANSPORT", "object_key"):
+        assert _post(client).status_code == 200
+    assert client.uploaded == []
+    assert "files" in client.session.posts[0]
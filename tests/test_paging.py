@@ -0,0 +1,46 @@
+# tests/test_paging.py
+from api.paging import PageGuard
+
+
+def page(*ids):
+    return [{"id": i} for i in ids]
+
+
+def test_accepts_consecutive_pages():
+    guard = PageGuard("test")
+    assert guard.accept(page(1, 2))
+    assert guard.accept(page(3, 4))
+    assert guard.accept([])
+
+
+def test_stops_when_backend_repeats_the_same_page():
+    guard = PageGuard("test")
+    assert guard.accept(page(1, 2))
+    assert not guard.accept(page(1, 2))
+
+
+def test_stops_when_page_has_no_new_ids():
+    guard = PageGuard("test")
+    assert guard.accept(page(1, 2))
+    assert guard.accept(page(3, 4))
+    assert not guard.accept(page(2, 3))
+
+
+def test_allows_partially_overlapping_page():
+    # 조회 중 항목이 추가되어 페이지 경계가 밀린 경우
+    guard = PageGuard("test")
+    assert guard.accept(page(1, 2))
+    assert guard.accept(page(2, 3))
+
+
+def test_stops_after_max_pages():
+    guard = PageGuard("test", max_pages=2)
+    assert guard.accept(page(1))
+    assert guard.accept(page(2))
+    assert not guard.accept(page(3))
+
+
+def test_records_without_id_are_not_compared():
+    guard = PageGuard("test")
+    assert guard.accept([{"name": "a"}])
+    assert guard.accept([{"name": "a"}])
@@ -0,0 +1,69 @@
+# tests/test_persona_backup.py
+import io
+import json
+import zipfile
+
+from services.persona_backup import (
+    export_persona_backup_zip,
+    read_persona_backup,
+    restore_personas,
+)
+
+
+def test_persona_backup_images_are_streamed_from_zip():
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr(
+            "personas.ndjson",
+            json.dumps({"name": "p", "profile_image_key": "personas/a.png"}) + "\n",
+        )
+        archive.writestr("images/personas/a.png", b"png-bytes")
+    buffer.name = "backup.zip"
+    records, images = read_persona_backup(buffer)
+    assert list(images) == ["personas/a.png"]
+
+    uploaded = []
+
+    class Api:
+        def upload_file(self, token, file_obj, filename, category, content_type):
+            assert not isinstance(file_obj, bytes)
+            uploaded.append(file_obj.read())
+            return "new-key"
+
+        def create_persona(self, token, **fields):
+            assert fields["profile_image_key"] == "new-key"
+            return {"id": 1}
+
+    summary = restore_personas(Api(), "t", records, images, rate_per_sec=1024)
+    assert summary["images_relinked"] == 1
+    assert uploaded == [b"png-bytes"]
+
+
+def test_export_zip_is_written_to_a_temp_file_and_round_trips():
+    personas = [
+        {"name": "a", "profile_image_key": "personas/a.png"},
+        {"name": "b", "profile_image_key": "personas/missing.png"},
+        {"name": "c"},
+    ]
+
+    class Api:
+        def get_presigned_urls_for_download(self, token, keys):
+            return {key: f"url:{key}" for key in keys}
+
+        def download_file_from_s3(self, url):
+            return b"png-bytes" if url.endswith("a.png") else None
+
+    export = export_persona_backup_zip(Api(), "t", personas)
+    try:
+        assert export.count == 3
+        assert "1개" in export.warning
+        with open(export.path, "rb") as f:
+            backup = io.BytesIO(f.read())
+        backup.name = "backup.zip"
+        records, images = read_persona_backup(backup)
+        assert [r["name"] for r in records] == ["a", "b", "c"]
+        with images["personas/a.png"]() as image_file:
+            assert image_file.read() == b"png-bytes"
+    finally:
+        export.remove()
+    assert not export.exists()
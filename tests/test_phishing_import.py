@@ -0,0 +1,107 @@
+# tests/test_phishing_import.py
+import threading
+
+import pytest
+
+from services.phishing_import import (
+    ImportCheckpoint,
+    case_fingerprint,
+    import_phishing_cases,
+)
+
+
+class FakeApiClient:
+    """피싱 사례 생성 요청을 기록하고, 지정한 제목은 실패시키는 ApiClient 대역"""
+
+    def __init__(self, existing=(), fail_titles=()):
+        self.existing = list(existing)
+        self.fail_titles = set(fail_titles)
+        self.created = []
+        self._lock = threading.Lock()
+
+    def get_all_phishing_cases(self, token):
+        return self.existing
+
+    def create_phishing_case(self, token, case):
+        if case["title"] in self.fail_titles:
+            return {"detail": "서버 오류"}
+        with self._lock:
+            self.created.append(case["title"])
+            return {"id": len(self.created), **case}
+
+
+def make_case(title, content="내용"):
+    return {"category_code": "SMS", "title": title, "content": content}
+
+
+@pytest.fixture(autouse=True)
+def checkpoint_dir(tmp_path, monkeypatch):
+    # 체크포인트 위치(IMPORT_CHECKPOINT_DIR)는 생성자 기본 인자로 정해지므로 기본값을 바꿉니다.
+    monkeypatch.setattr(ImportCheckpoint.__init__, "__defaults__", (str(tmp_path),))
+    return tmp_path
+
+
+def run_import(client, cases, import_id="test"):
+    return import_phishing_cases(
+        client, "token", cases, import_id, max_workers=4, rate_per_sec=1000
+    )
+
+
+def test_fingerprint_ignores_surrounding_whitespace():
+    assert case_fingerprint(make_case(" 제목 ")) == case_fingerprint(make_case("제목"))
+    assert case_fingerprint(make_case("제목")) != case_fingerprint(make_case("다른"))
+
+
+def test_skips_existing_and_in_file_duplicates():
+    client = FakeApiClient(existing=[make_case("a")])
+    cases = [make_case("a"), make_case("b"), make_case("b"), make_case("c")]
+    summary = run_import(client, cases)
+    assert sorted(client.created) == ["b", "c"]
+    assert summary == {"created": 2, "resumed": 0, "duplicates": 2, "failed": 0}
+
+
+def test_failed_import_keeps_checkpoint_and_resumes():
+    cases = [make_case(title) for title in "abcd"]
+    client = FakeApiClient(fail_titles={"c"})
+    summary = run_import(client, cases)
+    assert summary["created"] == 3 and summary["failed"] == 1
+    checkpoint = ImportCheckpoint("test")
+    assert checkpoint.exists()
+    assert len(checkpoint.load()) == 3
+
+    # 다시 실행하면 체크포인트에 기록된 사례는 요청하지 않습니다.
+    retry_client = FakeApiClient()
+    summary = run_import(retry_client, cases)
+    assert retry_client.created == ["c"]
+    assert summary == {"created": 1, "resumed": 3, "duplicates": 0, "failed": 0}
+    assert not checkpoint.exists()
+
+
+def test_checkpoint_ignores_truncated_last_line():
+    checkpoint = ImportCheckpoint("truncated")
+    checkpoint.record("fp1", 1)
+    with open(checkpoint.path, "a", encoding="utf-8") as f:
+        f.write('{"fingerprint": "fp2", "i')
+    assert checkpoint.load() == {"fp1": 1}
+
+
+def test_refuses_to_start_without_server_list():
+    client = FakeApiClient()
+    client.get_all_phishing_cases = lambda token: None
+    with pytest.raises(RuntimeError):
+        run_import(client, [make_case("a")])
+
+
+def test_reports_progress_including_skipped_cases():
+    client = FakeApiClient(existing=[make_case("a")])
+    progress = []
+    import_phishing_cases(
+        client,
+        "token",
+        [make_case(title) for title in "abc"],
+        "progress",
+        total=3,
+        rate_per_sec=1000,
+        on_progress=lambda done, total: progress.append((done, total)),
+    )
+    assert progress[-1] == (3, 3)
@@ -0,0 +1,66 @@
+# tests/test_search_index.py
+import random
+
+import pytest
+
+from services.search_index import SearchIndex
+
+FIELDS = ["email", "profile.name"]
+
+
+def brute_force(records, query):
+    query = query.lower()
+    matched = set()
+    for record in records:
+        values = [record.get("email"), (record.get("profile") or {}).get("name")]
+        if any(query in str(v).lower() for v in values if v is not None):
+            matched.add(record["id"])
+    return matched
+
+
+@pytest.fixture
+def records():
+    rng = random.Random(42)
+    alphabet = "abcxyz가나다.@ "
+    return [
+        {
+            "id": i,
+            "email": "".join(rng.choices(alphabet, k=12)),
+            "profile": rng.choice([None, {"name": "Kim"}, {"name": "이 영희"}]),
+        }
+        for i in range(500)
+    ]
+
+
+@pytest.mark.parametrize(
+    "query", ["", "a", "가", "AB", "kim", "이 영", "xyz.", "가나다@", "없는검색어"]
+)
+def test_search_matches_case_insensitive_contains(records, query):
+    index = SearchIndex.build(records, FIELDS)
+    assert index.search(query) == brute_force(records, query)
+
+
+def test_does_not_match_across_field_boundary():
+    index = SearchIndex.build(
+        [{"id": 1, "email": "abc", "profile": {"name": "def"}}], FIELDS
+    )
+    assert index.search("cd") == set()
+    assert index.search("abcdef") == set()
+
+
+def test_upsert_replaces_previous_text():
+    index = SearchIndex.build([{"id": 1, "email": "old@example.com"}], FIELDS)
+    index.upsert(1, {"id": 1, "email": "new@example.com"})
+    assert index.search("new@") == {1}
+    assert index.search("old") == set()
+    assert len(index) == 1
+
+
+def test_remove_drops_record_and_empty_postings(records):
+    index = SearchIndex.build(records[:1], FIELDS)
+    index.remove(records[0]["id"])
+    assert len(index) == 0
+    assert index.search("a") == set()
+    assert not index._postings
+    # 없는 항목을 지워도 오류가 나지 않습니다.
+    index.remove(12345)
@@ -0,0 +1,93 @@
+# tests/test_storage.py
+import io
+
+import requests
+
+from api import storage
+from api.storage import StorageMixin
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, body=None):
+        self.status_code = status_code
+        self._body = body or {}
+        self.headers = {"ETag": '"etag"'}
+
+    def json(self):
+        return self._body
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code}")
+
+
+class FakeSession:
+    def __init__(self, responses=()):
+        self.responses = list(responses)
+        self.posts = []
+        self.puts = []
+
+    def post(self, url, **kwargs):
+        self.posts.append(url)
+        return self.responses.pop(0)
+
+    def put(self, url, data=None, **kwargs):
+        # 파일 객체는 요청을 보낼 때처럼 끝까지 읽습니다.
+        self.puts.append(data if isinstance(data, bytes) else data.read())
+        return FakeResponse()
+
+
+class FakeStorageClient(StorageMixin):
+    base_url = "http://api"
+
+    def __init__(self, responses=()):
+        self.session = FakeSession(responses)
+        self.upload_session = self.session
+        self._multipart_upload_unsupported_at = None
+
+
+def test_malformed_multipart_initiate_response_returns_none(monkeypatch):
+    monkeypatch.setattr(storage, "S3_MULTIPART_THRESHOLD", 4)
+    monkeypatch.setattr(storage, "S3_MULTIPART_PART_SIZE", 4)
+    client = FakeStorageClient([FakeResponse(body={"part_urls": ["a", "b"]})])
+    assert client._upload_multipart("t", b"12345678", 8, "f", "c", "x/y") is None
+
+
+def test_multipart_upload_from_bytes_uploads_every_part(monkeypatch):
+    monkeypatch.setattr(storage, "S3_MULTIPART_THRESHOLD", 4)
+    monkeypatch.setattr(storage, "S3_MULTIPART_PART_SIZE", 4)
+    initiate = {"object_key": "k", "upload_id": "u", "part_urls": ["a", "b", "c"]}
+    client = FakeStorageClient([FakeResponse(body=initiate), FakeResponse()])
+    assert client.upload_file("t", b"0123456789", "f", "c", "x/y") == "k"
+    assert sorted(client.session.puts) == [b"0123", b"4567", b"89"]
+
+
+def test_failed_multipart_upload_falls_back_to_single_upload(monkeypatch):
+    monkeypatch.setattr(storage, "S3_MULTIPART_THRESHOLD", 4)
+    monkeypatch.setattr(storage, "S3_MULTIPART_PART_SIZE", 4)
+    client = FakeStorageClient([FakeResponse(500)])
+    client.get_presigned_url_for_upload = lambda **kwargs: {
+        "url": "single",
+        "object_key": "single-key",
+    }
+    file_obj = io.BytesIO(b"xx0123456789")
+    file_obj.seek(2)
+    assert client.upload_file("t", file_obj, "f", "c", "x/y") == "single-key"
+    assert client.session.puts == [b"0123456789"]
+
+
+def test_missing_multipart_api_is_reprobed_after_interval(monkeypatch):
+    monkeypatch.setattr(storage, "S3_MULTIPART_THRESHOLD", 4)
+    client = FakeStorageClient([FakeResponse(404)])
+    client.get_presigned_url_for_upload = lambda **kwargs: {
+        "url": "single",
+        "object_key": "single-key",
+    }
+    assert client.upload_file("t", b"0123456789", "f", "c", "x/y") == "single-key"
+    assert client.upload_file("t", b"0123456789", "f", "c", "x/y") == "single-key"
+    assert len(client.session.posts) == 1
+
+    client._multipart_upload_unsupported_at -= storage.S3_MULTIPART_REPROBE_SEC
+    client.session.responses = [FakeResponse(404)]
+    client.upload_file("t", b"0123456789", "f", "c", "x/y")
+    assert len(client.session.posts) == 2
@@ -0,0 +1,98 @@
+# tests/test_streaming.py
+import json
+
+import pytest
+import requests
+
+from api.streaming import MessageStream, iter_stream_events
+
+
+def make_response(body: bytes, content_type: str, chunk_size: int = 3):
+    """body를 chunk_size 바이트씩 나눠 보내는 스트리밍 응답"""
+    response = requests.Response()
+    response.status_code = 200
+    response.headers["Content-Type"] = content_type
+    # requests의 HTTPAdapter처럼 헤더로 인코딩을 정합니다. (charset 없는 text/*는 ISO-8859-1)
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    response.raw = ChunkedRaw(body, chunk_size)
+    return response
+
+
+class ChunkedRaw:
+    def __init__(self, body: bytes, chunk_size: int):
+        self._chunks = [
+            body[i : i + chunk_size] for i in range(0, len(body), chunk_size)
+        ]
+        self.closed = False
+
+    def stream(self, chunk_size, decode_content=True):
+        yield from self._chunks
+
+    def close(self):
+        self.closed = True
+
+    def release_conn(self):
+        pass
+
+
+def sse(*events: str) -> bytes:
+    return "".join(events).encode("utf-8")
+
+
+def test_sse_tokens_and_done_event_without_charset():
+    body = sse(
+        ": keep-alive\n\n",
+        'data: {"delta": "안녕"}\n\n',
+        'data: {"delta": "하세요"}\n\n',
+        'event: done\ndata: {"content": "안녕하세요", "id": 7}\n\n',
+        "data: [DONE]\n\n",
+    )
+    response = make_response(body, "text/event-stream")
+    events = list(iter_stream_events(response))
+    assert events == [
+        ("token", "안녕"),
+        ("token", "하세요"),
+        ("done", {"content": "안녕하세요", "id": 7}),
+    ]
+    assert response.raw.closed
+
+
+def test_sse_multiline_data_and_plain_text_payload():
+    body = sse("data: 첫 줄\ndata: 둘째 줄\n\n", "data: 마지막")
+    events = list(iter_stream_events(make_response(body, "text/event-stream")))
+    assert events == [("token", "첫 줄\n둘째 줄"), ("token", "마지막")]
+
+
+def test_done_detected_from_payload_fields():
+    payload = {"content": "끝", "suggested_user_questions": ["다음?"]}
+    body = sse(f"data: {json.dumps(payload, ensure_ascii=False)}\n\n")
+    events = list(iter_stream_events(make_response(body, "text/event-stream")))
+    assert events == [("done", payload)]
+
+
+@pytest.mark.parametrize(
+    "content_type", ["text/plain", "text/plain; charset=utf-8", ""]
+)
+def test_chunked_text_is_decoded_as_utf8(content_type):
+    body = "한글 응답입니다".encode("utf-8")
+    events = list(iter_stream_events(make_response(body, content_type)))
+    assert "".join(value for _, value in events) == "한글 응답입니다"
+
+
+def test_message_stream_collects_text_and_timing():
+    events = iter([("token", "안녕"), ("token", "하세요"), ("done", {"id": 1})])
+    stream = MessageStream(events, started_at=0.0).consume()
+    assert stream.text == "안녕하세요"
+    assert stream.response == {"id": 1}
+    assert stream.ttft is not None and stream.elapsed >= stream.ttft
+
+
+def test_message_stream_keeps_partial_text_on_error():
+    def events():
+        yield "token", "부분"
+        raise requests.exceptions.ChunkedEncodingError("끊김")
+
+    stream = MessageStream(events(), started_at=0.0).consume()
+    assert stream.text == "부분"
+    assert stream.response == {"content": "부분"}
+    assert "끊김" in stream.error
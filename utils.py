@@ -1,4 +1,6 @@
 # utils.py
+import os
+
 import streamlit as st
 
 
@@ -20,4 +22,52 @@ def section_title(title):
     페이지 내에서 섹션을 구분하기 위한 공통 스타일의 제목을 생성합니다.
     """
     st.markdown(f"### {title}")
-    st.divider()
\ No newline at end of file
+    st.divider()
+
+
+def render_lazy_download(
+    key, build_label, download_label, build_file, file_name, mime
+):
+    """
+    버튼을 누를 때만 파일을 생성하고, 생성된 파일의 다운로드 버튼을 표시합니다.
+    build_file()은 ExportFile(services.backup_stream)을 반환해야 하며,
+    다시 생성하면 이전 파일은 삭제됩니다. (세션이 끝나면 남은 파일도 삭제됨)
+    """
+    state_key = f"{key}_export"
+    if st.button(build_label, key=f"{key}_build", use_container_width=True):
+        previous = st.session_state.pop(state_key, None)
+        if previous is not None:
+            previous.remove()
+        with st.spinner("백업 파일을 만드는 중..."):
+            try:
+                st.session_state[state_key] = build_file()
+            except Exception as e:
+                st.error(f"백업 파일 생성 중 오류가 발생했습니다: {e}")
+
+    export = st.session_state.get(state_key)
+    if export is not None and export.exists():
+        if export.warning:
+            st.warning(export.warning)
+        size_kb = os.path.getsize(export.path) / 1024
+        with open(export.path, "rb") as f:
+            st.download_button(
+                label=f"{download_label} ({export.count}건, {size_kb:,.1f} KB)",
+                data=f,
+                file_name=file_name,
+                mime=mime,
+                key=f"{key}_download",
+                use_container_width=True,
+            )
+
+
+def count_uploaded_records(key, uploaded_file, count_records):
+    """
+    업로드된 파일의 레코드 수를 파일마다 한 번만 세어 session_state에 저장합니다.
+    count_records()의 결과를 그대로 반환하며, 재실행 시에는 저장된 값을 사용합니다.
+    """
+    state_key = f"{key}_record_count"
+    counted = st.session_state.get(state_key)
+    if counted is None or counted[0] != uploaded_file.file_id:
+        counted = (uploaded_file.file_id, count_records())
+        st.session_state[state_key] = counted
+    return counted[1]
@@ -68,7 +68,6 @@ def render_initial_setup_page(api_client: ApiClient):
                         f"관리자 계정 '{result['email']}'이(가) 성공적으로 생성되었습니다."
                     )
                     st.info("이제 로그인 페이지로 이동합니다.")
-                    st.cache_data.clear()
                     time.sleep(1)
                     st.rerun()
                 else:
@@ -1,13 +1,432 @@
 # views/conversation_view.py
-import base64
 import time
 
-import pandas as pd
+import requests
 import streamlit as st
 from streamlit.components.v1 import html
 
 from api import ApiClient
+from services.conversation_table import ConversationTable
+from services.image_preprocess import PreparedImage, prepare_uploaded_image
+from services.jobs import get_job_runner, job_owner
 from utils import display_api_result, section_title
+from views.job_view import track_job
+
+
+# 대화방 목록을 불러오는 페이지 크기와, 한 번에 표시할 행 수의 증가 단위
+CONVERSATION_PAGE_SIZE = 200
+CONVERSATION_WINDOW_STEP = 200
+# 검색 결과를 채우기 위해 한 번의 재실행에서 불러오는 최대 페이지 수
+CONVERSATION_MAX_PAGES_PER_RERUN = 5
+# 불러온 대화방 목록을 재사용하는 시간(초)
+CONVERSATION_LIST_TTL = 30
+# 채팅 영역에 한 번에 그리는 최신 메시지 수와, '이전 메시지 더 보기'의 증가 단위
+MESSAGE_WINDOW_SIZE = 30
+
+
+def _reset_conversation_list():
+    """불러온 대화방 목록과 표시 범위를 초기화합니다."""
+    for key in [
+        "conv_table",
+        "conv_offset",
+        "conv_exhausted",
+        "conv_loaded_at",
+        "conv_window",
+        "conv_query",
+    ]:
+        st.session_state.pop(key, None)
+
+
+def _upsert_conversation_in_list(conversation: dict):
+    """생성/수정된 대화방을 목록을 다시 불러오지 않고 테이블 모델에 반영합니다."""
+    table = st.session_state.get("conv_table")
+    if table is not None:
+        table.upsert(conversation)
+
+
+def _remove_conversation_from_list(conversation_id: int):
+    """삭제된 대화방을 불러온 테이블 모델(검색 색인)에서 제거합니다."""
+    table = st.session_state.get("conv_table")
+    if table is not None:
+        table.remove(conversation_id)
+
+
+def _load_conversation_window(
+    api_client: ApiClient, token: str, search_query: str, placeholder
+) -> ConversationTable | None:
+    """
+    검색어에 맞는 대화방이 표시 범위(conv_window)만큼 모일 때까지 다음 페이지를 이어서 불러옵니다.
+    불러온 페이지는 세션의 테이블 모델에 덧붙이므로, 이미 변환·색인한 행은 다시 처리하지 않습니다.
+    다음 페이지의 skip은 서버가 돌려준 행 수만큼만 늘어나는 conv_offset을 사용합니다.
+    (세션에서 대화방을 생성/삭제하면 테이블 행 수가 바뀌므로 테이블 길이를 쓰지 않습니다.)
+    한 번의 재실행에서는 CONVERSATION_MAX_PAGES_PER_RERUN 페이지까지만 불러오고 멈추므로,
+    일치하는 결과가 적은 검색어도 화면을 오래 막지 않습니다. (다음 재실행에서 이어서 불러옴)
+    페이지가 도착할 때마다 placeholder에 중간 결과를 보여주며, 통신 실패 시 None을 반환합니다.
+    """
+    state = st.session_state
+    if (
+        "conv_table" not in state
+        or time.time() - state.conv_loaded_at > CONVERSATION_LIST_TTL
+    ):
+        state.conv_table = ConversationTable()
+        state.conv_offset = 0
+        state.conv_exhausted = False
+        state.conv_loaded_at = time.time()
+    if "conv_window" not in state or state.get("conv_query") != search_query:
+        state.conv_window = CONVERSATION_WINDOW_STEP
+        state.conv_query = search_query
+
+    table = state.conv_table
+    if len(table.search(search_query)) >= state.conv_window or state.conv_exhausted:
+        return table
+
+    try:
+        for fetched_pages, page in enumerate(
+            api_client.iter_conversations_admin(
+                token, page_size=CONVERSATION_PAGE_SIZE, start=state.conv_offset
+            ),
+            start=1,
+        ):
+            state.conv_offset += len(page)
+            table.append(page)
+            matched_positions = table.search(search_query)
+            if len(matched_positions):
+                placeholder.dataframe(
+                    table.display(matched_positions[: state.conv_window]),
+                    use_container_width=True,
+                    hide_index=True,
+                )
+            if (
+                len(matched_positions) >= state.conv_window
+                or fetched_pages >= CONVERSATION_MAX_PAGES_PER_RERUN
+            ):
+                break
+        else:
+            state.conv_exhausted = True
+    except requests.exceptions.RequestException:
+        return None
+    return table
+
+
+def _scroll_to_element(element_id):
+    js = f"""
+    <script>
+        function scroll() {{
+            const element = parent.document.getElementById('{element_id}');
+            if (element) {{
+                element.scrollIntoView({{behavior: 'smooth', block: 'end', inline: 'nearest'}});
+            }}
+        }}
+        setTimeout(scroll, 250);
+    </script>
+    """
+    html(js, height=0, width=0)
+
+
+def _render_message(msg: dict, image_urls: dict):
+    sender_type = msg.get("sender_type", "user")
+    avatar = "👤" if sender_type == "user" else "🤖" if sender_type == "ai" else "⚙️"
+    with st.chat_message(name=sender_type, avatar=avatar):
+        # --- ✅ [수정] 이미지 키가 있는지 확인하고 이미지 표시 ---
+        image_key = msg.get("image_key")
+        if image_key:
+            image_url = image_urls.get(image_key)
+            if image_url:
+                # 이미지 너비를 제한하여 채팅 UI가 깨지지 않도록 합니다.
+                st.image(image_url, width=300)
+            else:
+                st.error("이미지를 불러올 수 없습니다.")
+
+        # 텍스트 내용이 있을 경우에만 표시
+        if msg.get("content"):
+            st.markdown(msg.get("content"))
+
+        # 상세 정보는 펼쳤을 때만 그립니다. (expander는 닫혀 있어도 내용을 그리므로 토글 사용)
+        if st.toggle("메시지 상세 정보", key=f"message_details_{msg.get('id')}"):
+            # content와 image_key를 제외한 나머지 정보 표시
+            filtered_msg_details = {
+                k: v for k, v in msg.items() if k not in ["content", "image_key"]
+            }
+            st.json(filtered_msg_details)
+
+
+def _send_test_message(
+    api_client: ApiClient,
+    token: str,
+    conversation_id: int,
+    content: str,
+    image: PreparedImage | None = None,
+) -> bool:
+    """
+    메시지를 전송하고 AI 응답을 받는 대로 화면에 그립니다. (스트리밍 미지원 시 일반 응답)
+    성공하면 새로 추가된 메시지만 받아 채팅 기록에 덧붙이고, 응답 시간을 기록합니다.
+    """
+    with st.spinner("메시지 전송 중..."):
+        stream = api_client.stream_message(
+            token=token,
+            conversation_id=conversation_id,
+            content=content,
+            image=image.data if image else None,
+            image_content_type=image.content_type if image else "image/webp",
+        )
+    if stream is None:
+        return False
+    if stream.streamed:
+        with st.chat_message(name="ai", avatar="🤖"):
+            st.write_stream(stream)
+    else:
+        with st.spinner("AI가 답변을 생성하는 중..."):
+            stream.consume()
+    if stream.error:
+        st.warning(f"AI 응답을 끝까지 받지 못했습니다: {stream.error}")
+
+    st.session_state.last_api_response = stream.response
+    st.session_state.last_response_timing = {
+        "ttft": stream.ttft,
+        "elapsed": stream.elapsed,
+        "streamed": stream.streamed,
+    }
+    messages = st.session_state.get("messages") or []
+    last_id = max((msg["id"] for msg in messages), default=None)
+    with st.spinner("채팅 기록 업데이트 중..."):
+        new_messages = api_client.get_messages_since(token, conversation_id, last_id)
+    if new_messages is None:
+        # 새 메시지만 받지 못하면 전체 기록을 다시 불러옵니다.
+        st.session_state.messages = api_client.get_messages_for_conversation_admin(
+            token, conversation_id
+        )
+    else:
+        # 기존 리스트를 복사하지 않고 새 메시지만 덧붙입니다.
+        messages.extend(new_messages)
+        st.session_state.messages = messages
+    st.session_state.scroll_to_anchor = True
+    return True
+
+
+@st.fragment
+def _render_chat_panel(
+    api_client: ApiClient, token: str, selected_conv_id: int, selected_conv_data: dict
+):
+    """메시지 기록, 메시지 전송 폼, 빠른 선택지를 그리는 채팅 영역 fragment."""
+    header_c1, header_c2 = st.columns([3, 1])
+    with header_c1:
+        st.subheader("✉️ 메시지 기록")
+    with header_c2:
+        if "sort_asc" not in st.session_state:
+            st.session_state.sort_asc = False
+        button_text = (
+            "과거순으로 보기" if not st.session_state.sort_asc else "최신순으로 보기"
+        )
+        if st.button(button_text, use_container_width=True):
+            st.session_state.sort_asc = not st.session_state.sort_asc
+            st.rerun(scope="fragment")
+
+    st.divider()
+
+    messages = st.session_state.get("messages")
+    if not messages:
+        st.info("메시지 기록이 없습니다.")
+    else:
+        # 최신 메시지부터 window 크기만큼만 그립니다.
+        window = st.session_state.setdefault("message_window", MESSAGE_WINDOW_SIZE)
+        visible_messages = messages[-window:]
+        hidden_count = len(messages) - len(visible_messages)
+
+        def render_load_older_button():
+            if hidden_count and st.button(
+                f"이전 메시지 더 보기 ({hidden_count}개 남음)",
+                key="load_older_messages",
+                use_container_width=True,
+            ):
+                st.session_state.message_window += MESSAGE_WINDOW_SIZE
+                st.rerun(scope="fragment")
+
+        # 화면에 그리는 메시지의 이미지 URL만 한 번에 받아옵니다.
+        with st.spinner("이미지 로딩 중..."):
+            image_urls = api_client.get_presigned_urls_for_download(
+                token, [msg.get("image_key") for msg in visible_messages]
+            )
+
+        if st.session_state.sort_asc:
+            render_load_older_button()
+            for msg in visible_messages:
+                _render_message(msg, image_urls)
+        else:
+            for msg in reversed(visible_messages):
+                _render_message(msg, image_urls)
+            render_load_older_button()
+
+    st.markdown("<div id='chat_anchor'></div>", unsafe_allow_html=True)
+    st.divider()
+
+    with st.expander("**AI 응답 테스트하기**", expanded=True):
+        # --- ✅ [수정] 파일 업로더와 폼 로직 ---
+        uploaded_file = st.file_uploader(
+            "이미지 첨부 (선택)", type=["png", "jpg", "jpeg", "webp"]
+        )
+
+        if uploaded_file is not None:
+            # 업로드된 이미지 미리보기
+            st.image(uploaded_file, caption="첨부할 이미지 미리보기", width=200)
+
+        with st.form(key=f"send_message_form_{selected_conv_id}"):
+            content = st.text_area(
+                "보낼 메시지 내용*",
+                placeholder="여기에 메시지를 입력하거나 아래 선택지 버튼을 클릭하세요.",
+            )
+            submitted = st.form_submit_button(
+                "메시지 전송 및 AI 응답 확인", use_container_width=True
+            )
+
+        if submitted:
+            # 텍스트 또는 이미지가 하나라도 있어야 전송 가능
+            if content or uploaded_file:
+                prepared = None
+                if uploaded_file is not None:
+                    # 크기를 줄이고 다시 압축한 이미지를 전송합니다.
+                    prepared = prepare_uploaded_image(uploaded_file)
+                    st.caption(f"🗜️ 첨부 이미지: {prepared.summary()}")
+
+                sent = _send_test_message(
+                    api_client, token, selected_conv_id, content, prepared
+                )
+                if sent:
+                    st.rerun(scope="fragment")
+                else:
+                    st.error("메시지 전송 또는 AI 응답 수신에 실패했습니다.")
+            else:
+                st.warning("메시지 내용 또는 이미지를 첨부해야 합니다.")
+
+        st.markdown("##### 빠른 선택지")
+        options_to_show = []
+        messages_exist = st.session_state.get("messages")
+
+        if not messages_exist:
+            starters = selected_conv_data.get("persona", {}).get(
+                "conversation_starters"
+            )
+            if starters and isinstance(starters, list):
+                options_to_show = starters
+                st.caption("ℹ️ 페르소나의 '대화 시작 선택지'입니다.")
+        elif st.session_state.get("last_api_response"):
+            suggestions = st.session_state.last_api_response.get(
+                "suggested_user_questions"
+            )
+            if suggestions:
+                options_to_show = suggestions
+                st.caption("ℹ️ AI가 생성한 '추천 질문'입니다.")
+
+        if options_to_show:
+            # 선택지 개수에 따라 유연하게 컬럼 생성
+            cols = st.columns(len(options_to_show))
+            for i, option in enumerate(options_to_show):
+                if cols[i].button(option, key=f"option_{i}", use_container_width=True):
+                    sent = _send_test_message(
+                        api_client, token, selected_conv_id, option
+                    )
+                    if sent:
+                        st.rerun(scope="fragment")
+                    else:
+                        st.error("메시지 전송 또는 AI 응답 수신에 실패했습니다.")
+        else:
+            st.info("표시할 선택지가 없습니다.")
+
+    if "last_api_response" in st.session_state:
+        st.success("AI 응답을 성공적으로 받았습니다!")
+        timing = st.session_state.get("last_response_timing")
+        if timing:
+            t_c1, t_c2 = st.columns(2)
+            t_c1.metric(
+                "첫 토큰까지 (TTFT)",
+                f"{timing['ttft']:.2f}초" if timing["streamed"] else "스트리밍 미지원",
+            )
+            t_c2.metric("전체 응답 시간", f"{timing['elapsed']:.2f}초")
+        with st.expander("API Raw Response 보기", expanded=False):
+            display_api_result(st.session_state.last_api_response)
+
+    if st.session_state.get("scroll_to_anchor"):
+        _scroll_to_element("chat_anchor")
+        st.session_state.scroll_to_anchor = False
+
+
+@st.fragment
+def _render_action_panel(
+    api_client: ApiClient, token: str, selected_conv_id: int, selected_conv_data: dict
+):
+    """페르소나/시나리오 정보와 대화방 삭제를 그리는 액션 패널 fragment."""
+    st.subheader("⚡️ 액션")
+
+    with st.expander("🤖 현재 페르소나 정보", expanded=True):
+        persona_info = selected_conv_data.get("persona", {})
+        st.markdown(f"**이름**: `{persona_info.get('name', 'N/A')}`")
+
+        starting_message = persona_info.get("starting_message")
+        if starting_message:
+            st.markdown("**시작 메시지**:")
+            st.info(starting_message)
+
+        st.markdown("**시스템 프롬프트**:")
+        st.text_area(
+            label="Original System Prompt",
+            value=persona_info.get("system_prompt", "프롬프트 정보 없음"),
+            height=150,
+            disabled=True,
+            key=f"system_prompt_{selected_conv_id}",
+        )
+
+    with st.expander("🎣 현재 적용된 피싱 시나리오", expanded=True):
+        # 대화방 데이터에서 피싱 사례 ID를 가져옵니다.
+        case_id = selected_conv_data.get("applied_phishing_case_id")
+
+        if case_id:
+            # 메시지 기록을 불러올 때 함께 조회해 둔 결과를 사용합니다.
+            phishing_info = st.session_state.get("applied_phishing_case")
+
+            if phishing_info:
+                st.markdown(f"**ID**: `{phishing_info.get('id', 'N/A')}`")
+                st.markdown(f"**유형**: `{phishing_info.get('category_code', 'N/A')}`")
+                st.markdown(f"**제목**: `{phishing_info.get('title', 'N/A')}`")
+                st.text_area(
+                    label="시나리오 내용",
+                    value=phishing_info.get("content", "내용 없음"),
+                    height=150,
+                    disabled=True,
+                    key=f"phishing_content_{selected_conv_id}",
+                )
+                with st.popover("전체 데이터 보기"):
+                    st.json(phishing_info)
+            else:
+                st.error(f"피싱 사례(ID: {case_id}) 정보를 불러오는 데 실패했습니다.")
+        else:
+            st.info("현재 적용된 피싱 시나리오가 없습니다.")
+
+    with st.expander("**대화방 삭제하기**"):
+        st.error("주의: 이 작업은 되돌릴 수 없습니다.")
+        if st.button(
+            f"대화방 ID {selected_conv_id} 영구 삭제",
+            type="primary",
+            use_container_width=True,
+        ):
+            if api_client.delete_conversation_admin(token, selected_conv_id):
+                st.toast("🗑️ 대화방이 성공적으로 삭제되었습니다.")
+                _remove_conversation_from_list(selected_conv_id)
+                keys_to_clear = [
+                    "messages",
+                    "current_conv_id",
+                    "applied_phishing_case",
+                    "last_api_response",
+                    "last_response_timing",
+                    "sort_asc",
+                    "message_window",
+                    "scroll_to_anchor",
+                    "selected_conv_id",
+                ]
+                for key in keys_to_clear:
+                    st.session_state.pop(key, None)
+                # 목록과 선택 상태가 바뀌었으므로 전체 페이지를 다시 실행합니다.
+                st.rerun()
+            else:
+                st.error("삭제에 실패했습니다.")
 
 
 def render_conversation_test_page(api_client: ApiClient, token: str):
@@ -17,20 +436,6 @@ def render_conversation_test_page(api_client: ApiClient, token: str):
     (시작 메시지 표시, 동적 선택지 버튼 기능 포함)
     """
 
-    def scroll_to_element(element_id):
-        js = f"""
-        <script>
-            function scroll() {{
-                const element = parent.document.getElementById('{element_id}');
-                if (element) {{
-                    element.scrollIntoView({{behavior: 'smooth', block: 'end', inline: 'nearest'}});
-                }}
-            }}
-            setTimeout(scroll, 250);
-        </script>
-        """
-        html(js, height=0, width=0)
-
     st.header("대화방 관리 및 테스트")
     st.info(
         "이곳에서 전체 대화방을 관리하고, 특정 대화방을 선택하여 메시지 기록을 보거나 새 메시지를 보내 AI 응답을 직접 테스트할 수 있습니다."
@@ -38,21 +443,36 @@ def render_conversation_test_page(api_client: ApiClient, token: str):
 
     with st.expander("새 대화방 생성하기", expanded=False):
 
-        @st.cache_data(ttl=120)
-        def get_all_users_for_selection():
-            return api_client.get_all_users(token=token)
+        def load_creation_form_data():
+            # 사용자, 페르소나, 피싱 유형 목록을 동시에 조회합니다.
+            aio = api_client.aio
+            results = aio.gather(
+                aio.get_all_users(token),
+                aio.get_personas(token),
+                aio.get_phishing_categories(),
+            )
+            return None if None in results else results
 
-        @st.cache_data(ttl=120)
-        def get_all_personas_for_selection():
-            return api_client.get_personas(token=token)
+        form_data = api_client.cache.get_or_load(
+            "conversation_creation_form",
+            load_creation_form_data,
+            tags=["users", "personas", "categories"],
+            ttl=120,
+        )
+        all_users, all_personas, all_categories = form_data or (None, None, None)
 
-        @st.cache_data(ttl=300)
-        def get_all_phishing_categories():
-            return api_client.get_phishing_categories()
+        def on_create_finished(job):
+            result = job.result
+            if result and "id" in result:
+                st.success(f"성공! 새 대화방이 생성되었습니다. (ID: {result['id']})")
+                _upsert_conversation_in_list(result)
+            else:
+                error_detail = job.error or (
+                    result.get("detail", "알 수 없는 오류") if result else "알 수 없는 오류"
+                )
+                st.error(f"생성 실패: {error_detail}")
 
-        all_users = get_all_users_for_selection()
-        all_personas = get_all_personas_for_selection()
-        all_categories = get_all_phishing_categories()
+        track_job("conversation_create_job", on_create_finished)
 
         if not all_users or not all_personas or not all_categories:
             st.warning(
@@ -104,7 +524,11 @@ def render_conversation_test_page(api_client: ApiClient, token: str):
                     )
 
                 title = st.text_input("대화방 제목 (선택 사항)")
-                submitted = st.form_submit_button("생성하기", use_container_width=True)
+                submitted = st.form_submit_button(
+                    "생성하기",
+                    use_container_width=True,
+                    disabled="conversation_create_job" in st.session_state,
+                )
 
                 if submitted:
                     user_id = selected_user["id"] if selected_user else None
@@ -120,8 +544,7 @@ def render_conversation_test_page(api_client: ApiClient, token: str):
                             "시나리오 적용 방식으로 '특정 카테고리'를 선택한 경우, 피싱 유형을 반드시 선택해야 합니다."
                         )
                     else:
-                        with st.spinner("대화방 생성 중..."):
-                            result = None
+                        def run_create(job):
                             # 🔄 [수정] 옵션 텍스트가 짧아졌으므로 조건문도 맞춰서 수정
                             if creation_method == "랜덤 시나리오 적용":
                                 result = api_client.create_conversation_admin(
@@ -140,7 +563,7 @@ def render_conversation_test_page(api_client: ApiClient, token: str):
                                         title=title,
                                     )
                                 )
-                            elif creation_method == "특정 카테고리 적용 (AI 항상 생성)":
+                            else:
                                 result = (
                                     api_client.create_conversation_with_ai_case_admin(
                                         token=token,
@@ -150,118 +573,111 @@ def render_conversation_test_page(api_client: ApiClient, token: str):
                                         title=title,
                                     )
                                 )
-
-                        if result and "id" in result:
-                            st.success(
-                                f"성공! 새 대화방이 생성되었습니다. (ID: {result['id']})"
-                            )
-                            st.cache_data.clear()
-                            time.sleep(1)
-                            st.rerun()
-                        else:
-                            error_detail = (
-                                result.get("detail", "알 수 없는 오류")
-                                if result
-                                else "알 수 없는 오류"
-                            )
-                            st.error(f"생성 실패: {error_detail}")
-                            # 실패 후에는 다시 그릴 필요 없이 메시지만 보여주면 됩니다.
+                            if result and "id" in result:
+                                # 목록에 바로 표시할 수 있도록 선택한 사용자/페르소나 정보를 채웁니다.
+                                result = {
+                                    "user": selected_user,
+                                    "persona": selected_persona,
+                                    **result,
+                                }
+                            return result
+
+                        # AI 사례 생성은 오래 걸리므로 백그라운드 작업으로 실행합니다.
+                        job = get_job_runner().submit(
+                            job_owner(token),
+                            "conversation_create",
+                            f"대화방 생성 ({creation_method})",
+                            run_create,
+                        )
+                        st.session_state.conversation_create_job = job.id
+                        st.rerun()
 
     st.divider()
 
-    @st.cache_data(ttl=30)
-    def get_conversations_data():
-        return api_client.get_all_conversations_admin(token=token, limit=1000)
-
-    all_conversations = get_conversations_data()
-    if all_conversations is None:
-        st.error("대화방 목록을 가져오는데 실패했습니다.")
-        if st.button("다시 시도"):
-            st.cache_data.clear()
-            st.rerun()
-        return
-
-    search_query = st.text_input("검색 (사용자 이메일 또는 페르소나 이름)")
+    search_query = st.text_input(
+        "검색 (사용자 이메일/이름, 페르소나 이름 또는 대화방 제목)"
+    )
     if st.button("새로고침", use_container_width=True):
         keys_to_clear = [
             "messages",
             "current_conv_id",
+            "applied_phishing_case",
             "last_api_response",
+            "last_response_timing",
             "sort_asc",
+            "message_window",
             "scroll_to_anchor",
             "selected_conv_id",
         ]
         for key in keys_to_clear:
             st.session_state.pop(key, None)
-        st.cache_data.clear()
+        _reset_conversation_list()
+        api_client.cache.invalidate("conversations")
         st.rerun()
 
-    if not all_conversations:
-        st.info("조회된 대화방이 없습니다.")
+    summary_placeholder = st.empty()
+    table_placeholder = st.empty()
+    conversation_table = _load_conversation_window(
+        api_client, token, search_query, table_placeholder
+    )
+    if conversation_table is None:
+        st.error("대화방 목록을 가져오는데 실패했습니다.")
+        if st.button("다시 시도"):
+            _reset_conversation_list()
+            st.rerun()
         return
 
-    # 원본 JSON 구조를 유지한 DataFrame 생성
-    df_original = pd.DataFrame(all_conversations)
-    df_normalized = pd.json_normalize(all_conversations, sep=".")
+    if not len(conversation_table):
+        table_placeholder.info("조회된 대화방이 없습니다.")
+        return
 
-    if search_query:
-        mask = df_normalized["user.email"].str.contains(
-            search_query, case=False, na=False
-        ) | df_normalized["persona.name"].str.contains(
-            search_query, case=False, na=False
+    # 재실행 시에는 미리 계산된 테이블에서 검색과 슬라이스만 수행합니다.
+    matched_positions = conversation_table.search(search_query)
+    visible_positions = matched_positions[: st.session_state.conv_window]
+    has_more = len(matched_positions) > len(visible_positions) or (
+        not st.session_state.conv_exhausted
+    )
+    # 페이지 수 제한으로 검색을 멈춘 경우, 이어서 찾을지는 사용자가 정합니다.
+    search_paused = (
+        len(matched_positions) < st.session_state.conv_window
+        and not st.session_state.conv_exhausted
+    )
+    if search_paused:
+        summary_placeholder.write(
+            f"지금까지 불러온 대화방 {len(conversation_table)}개 중 "
+            f"{len(matched_positions)}개가 검색되었습니다."
+        )
+        if st.button("이어서 검색하기", use_container_width=True):
+            st.rerun()
+    elif has_more:
+        summary_placeholder.write(
+            f"{len(visible_positions)}개의 대화방을 표시하고 있습니다. (더 보기 가능)"
         )
-        filtered_indices = df_normalized[mask].index
-        filtered_df = df_original.loc[filtered_indices]
     else:
-        filtered_df = df_original
-
-    st.write(f"총 {len(filtered_df)}개의 대화방이 조회되었습니다.")
+        summary_placeholder.write(
+            f"총 {len(matched_positions)}개의 대화방이 조회되었습니다."
+        )
 
-    if filtered_df.empty:
-        st.info("검색 결과에 해당하는 대화방이 없습니다.")
+    if not len(visible_positions):
+        if not search_paused:
+            table_placeholder.info("검색 결과에 해당하는 대화방이 없습니다.")
         return
 
-    # 화면 표시용 DataFrame 생성
-    display_df = pd.DataFrame(
-        {
-            "ID": filtered_df["id"],
-            "사용자 ID": filtered_df["user"].apply(lambda u: u.get("id", "N/A")),
-            "사용자 이메일": filtered_df["user"].apply(lambda u: u.get("email", "N/A")),
-            "페르소나": filtered_df["persona"].apply(lambda p: p.get("name", "N/A")),
-            "시나리오 ID": filtered_df["applied_phishing_case_id"]
-            .fillna(0)
-            .astype(int),
-            "대화방 제목": filtered_df["title"],
-            "마지막 대화": filtered_df["last_message_at"],
-        }
-    )
-
-    # '마지막 대화' 열의 문자열을 datetime 객체로 변환합니다.
-    # 변환 실패 시 (예: 값이 None인 경우) NaT(Not a Time)으로 처리됩니다.
-    dt_series = pd.to_datetime(display_df["마지막 대화"], errors="coerce")
-
-    # 1. 원본 시간이 UTC 기준임을 명시하고,
-    # 2. 'Asia/Seoul' (KST) 타임존으로 변환한 후,
-    # 3. 'YYYY-MM-DD HH:MM:SS' 형식의 문자열로 만듭니다.
-    # 4. 변환에 실패했던 NaT 값은 'N/A'로 채웁니다.
-    display_df["마지막 대화"] = (
-        dt_series.dt.tz_localize("UTC")
-        .dt.tz_convert("Asia/Seoul")
-        .dt.strftime("%Y-%m-%d %H:%M:%S")
-        .fillna("N/A")
-    )
-
-    selection = st.dataframe(
-        display_df,
+    selection = table_placeholder.dataframe(
+        conversation_table.display(visible_positions),
         use_container_width=True,
         hide_index=True,
         on_select="rerun",
         selection_mode="single-row",
     )
+    if has_more and not search_paused and st.button("더 보기", use_container_width=True):
+        st.session_state.conv_window += CONVERSATION_WINDOW_STEP
+        st.rerun()
 
     if selection.selection.rows:
         selected_row_index = selection.selection.rows[0]
-        selected_id = int(filtered_df.iloc[selected_row_index]["id"])
+        selected_position = visible_positions[selected_row_index]
+        selected_id = int(conversation_table.rows[selected_position]["id"])
 
         if st.session_state.get("selected_conv_id") != selected_id:
             st.session_state.selected_conv_id = selected_id
@@ -272,299 +688,56 @@ def render_conversation_test_page(api_client: ApiClient, token: str):
     if st.session_state.get("selected_conv_id"):
         selected_conv_id = st.session_state.get("selected_conv_id")
 
-        selected_conv_data_row = filtered_df[filtered_df["id"] == selected_conv_id]
+        selected_position = conversation_table.position_of(selected_conv_id)
 
-        if selected_conv_data_row.empty:
+        if selected_position is None or selected_position not in set(
+            visible_positions.tolist()
+        ):
             del st.session_state.selected_conv_id
             st.rerun()
             return
 
-        selected_conv_data = selected_conv_data_row.iloc[0].to_dict()
+        selected_conv_data = conversation_table.rows[selected_position]
 
         section_title(f"대화 상세 및 테스트 (ID: {selected_conv_id})")
 
         if st.session_state.get("current_conv_id") != selected_conv_id:
             keys_to_clear = [
                 "messages",
+                "applied_phishing_case",
                 "last_api_response",
+                "last_response_timing",
                 "sort_asc",
+                "message_window",
                 "scroll_to_anchor",
             ]
             for key in keys_to_clear:
                 st.session_state.pop(key, None)
 
-        detail_c1, detail_c2 = st.columns([2, 1])
+        if (
+            "messages" not in st.session_state
+            or st.session_state.get("current_conv_id") != selected_conv_id
+        ):
+            st.session_state.current_conv_id = selected_conv_id
+            case_id = selected_conv_data.get("applied_phishing_case_id")
+            aio = api_client.aio
+            calls = [aio.get_messages_for_conversation_admin(token, selected_conv_id)]
+            if case_id:
+                calls.append(aio.get_phishing_case_by_id(token, int(case_id)))
+            with st.spinner("메시지 기록을 불러오는 중..."):
+                # 메시지 기록과 적용된 피싱 사례를 동시에 조회합니다.
+                results = aio.gather(*calls)
+            st.session_state.messages = results[0]
+            st.session_state.applied_phishing_case = results[1] if case_id else None
 
+        detail_c1, detail_c2 = st.columns([2, 1])
+        # 채팅 영역과 액션 패널은 각각 독립적으로 재실행되는 fragment입니다.
+        # 메시지 전송이나 정렬 변경은 채팅 영역만 다시 그리며,
+        # 전체 페이지는 선택한 대화방이 바뀌거나 삭제될 때만 다시 실행됩니다.
         with detail_c1:
-            header_c1, header_c2 = st.columns([3, 1])
-            with header_c1:
-                st.subheader("✉️ 메시지 기록")
-            with header_c2:
-                if "sort_asc" not in st.session_state:
-                    st.session_state.sort_asc = False
-                button_text = (
-                    "과거순으로 보기"
-                    if not st.session_state.sort_asc
-                    else "최신순으로 보기"
-                )
-                if st.button(button_text, use_container_width=True):
-                    st.session_state.sort_asc = not st.session_state.sort_asc
-                    st.rerun()
-
-            st.divider()
-
-            if (
-                "messages" not in st.session_state
-                or st.session_state.get("current_conv_id") != selected_conv_id
-            ):
-                st.session_state.current_conv_id = selected_conv_id
-                with st.spinner("메시지 기록을 불러오는 중..."):
-                    st.session_state.messages = (
-                        api_client.get_messages_for_conversation_admin(
-                            token, selected_conv_id
-                        )
-                    )
-
-            if not st.session_state.get("messages"):
-                st.info("메시지 기록이 없습니다.")
-            else:
-                messages_to_display = st.session_state.messages
-                if not st.session_state.sort_asc:
-                    messages_to_display = reversed(list(messages_to_display))
-
-                for msg in messages_to_display:
-                    sender_type = msg.get("sender_type", "user")
-                    avatar = (
-                        "👤"
-                        if sender_type == "user"
-                        else "🤖"
-                        if sender_type == "ai"
-                        else "⚙️"
-                    )
-                    with st.chat_message(name=sender_type, avatar=avatar):
-                        # --- ✅ [수정] 이미지 키가 있는지 확인하고 이미지 표시 ---
-                        image_key = msg.get("image_key")
-                        if image_key:
-                            # Presigned URL은 만료될 수 있으므로 매번 새로 가져오되,
-                            # Streamlit의 캐시를 활용하여 동일 키에 대한 중복 호출을 방지합니다.
-                            @st.cache_data(ttl=300)
-                            def get_cached_image_url(key):
-                                return api_client.get_presigned_url_for_download(
-                                    token=token, object_key=key
-                                )
-
-                            with st.spinner("이미지 로딩 중..."):
-                                image_url = get_cached_image_url(image_key)
-
-                            if image_url:
-                                # 이미지 너비를 제한하여 채팅 UI가 깨지지 않도록 합니다.
-                                st.image(image_url, width=300)
-                            else:
-                                st.error("이미지를 불러올 수 없습니다.")
-
-                        # 텍스트 내용이 있을 경우에만 표시
-                        if msg.get("content"):
-                            st.markdown(msg.get("content"))
-
-                        with st.expander("메시지 상세 정보"):
-                            # content와 image_key를 제외한 나머지 정보 표시
-                            filtered_msg_details = {
-                                k: v
-                                for k, v in msg.items()
-                                if k not in ["content", "image_key"]
-                            }
-                            st.json(filtered_msg_details)
-
-            st.markdown("<div id='chat_anchor'></div>", unsafe_allow_html=True)
-            st.divider()
-
+            _render_chat_panel(api_client, token, selected_conv_id, selected_conv_data)
         with detail_c2:
-            st.subheader("⚡️ 액션")
-
-            with st.expander("🤖 현재 페르소나 정보", expanded=True):
-                persona_info = selected_conv_data.get("persona", {})
-                st.markdown(f"**이름**: `{persona_info.get('name', 'N/A')}`")
-
-                starting_message = persona_info.get("starting_message")
-                if starting_message:
-                    st.markdown("**시작 메시지**:")
-                    st.info(starting_message)
-
-                st.markdown("**시스템 프롬프트**:")
-                st.text_area(
-                    label="Original System Prompt",
-                    value=persona_info.get("system_prompt", "프롬프트 정보 없음"),
-                    height=150,
-                    disabled=True,
-                    key=f"system_prompt_{selected_conv_id}",
-                )
-
-            with st.expander("🎣 현재 적용된 피싱 시나리오", expanded=True):
-                # 대화방 데이터에서 피싱 사례 ID를 가져옵니다.
-                case_id = selected_conv_data.get("applied_phishing_case_id")
-
-                # API 호출 결과를 캐싱하기 위한 함수를 내부에 정의합니다.
-                @st.cache_data(ttl=300)  # 5분 동안 결과 캐시
-                def get_phishing_case_details(id_to_fetch: int):
-                    return api_client.get_phishing_case_by_id(
-                        token=token, case_id=id_to_fetch
-                    )
-
-                if case_id:
-                    with st.spinner(f"피싱 사례(ID: {case_id}) 정보 조회 중..."):
-                        phishing_info = get_phishing_case_details(case_id)
-
-                    if phishing_info:
-                        st.markdown(f"**ID**: `{phishing_info.get('id', 'N/A')}`")
-                        st.markdown(
-                            f"**유형**: `{phishing_info.get('category_code', 'N/A')}`"
-                        )
-                        st.markdown(f"**제목**: `{phishing_info.get('title', 'N/A')}`")
-                        st.text_area(
-                            label="시나리오 내용",
-                            value=phishing_info.get("content", "내용 없음"),
-                            height=150,
-                            disabled=True,
-                            key=f"phishing_content_{selected_conv_id}",
-                        )
-                        with st.popover("전체 데이터 보기"):
-                            st.json(phishing_info)
-                    else:
-                        st.error(
-                            f"피싱 사례(ID: {case_id}) 정보를 불러오는 데 실패했습니다."
-                        )
-                else:
-                    st.info("현재 적용된 피싱 시나리오가 없습니다.")
-
-            with st.expander("**AI 응답 테스트하기**", expanded=True):
-                # --- ✅ [수정] 파일 업로더와 폼 로직 ---
-                uploaded_file = st.file_uploader(
-                    "이미지 첨부 (선택)", type=["png", "jpg", "jpeg", "webp"]
-                )
-
-                if uploaded_file is not None:
-                    # 업로드된 이미지 미리보기
-                    st.image(uploaded_file, caption="첨부할 이미지 미리보기", width=200)
-
-                with st.form(key=f"send_message_form_{selected_conv_id}"):
-                    content = st.text_area(
-                        "보낼 메시지 내용*",
-                        placeholder="여기에 메시지를 입력하거나 아래 선택지 버튼을 클릭하세요.",
-                    )
-                    submitted = st.form_submit_button(
-                        "메시지 전송 및 AI 응답 확인", use_container_width=True
-                    )
-
-                if submitted:
-                    # 텍스트 또는 이미지가 하나라도 있어야 전송 가능
-                    if content or uploaded_file:
-                        image_b64_string = None
-                        if uploaded_file is not None:
-                            # 파일을 읽어 Base64로 인코딩
-                            image_b64_string = base64.b64encode(
-                                uploaded_file.getvalue()
-                            ).decode("utf-8")
-
-                        with st.spinner("AI가 답변을 생성하는 중..."):
-                            response_data = api_client.send_message(
-                                token=token,
-                                conversation_id=selected_conv_id,
-                                content=content,
-                                image_base64=image_b64_string,
-                            )
-                        if response_data:
-                            st.session_state.last_api_response = response_data
-                            with st.spinner("채팅 기록 업데이트 중..."):
-                                st.session_state.messages = (
-                                    api_client.get_messages_for_conversation_admin(
-                                        token, selected_conv_id
-                                    )
-                                )
-                            st.session_state.scroll_to_anchor = True
-                            st.rerun()
-                        else:
-                            st.error("메시지 전송 또는 AI 응답 수신에 실패했습니다.")
-                    else:
-                        st.warning("메시지 내용 또는 이미지를 첨부해야 합니다.")
-
-                st.markdown("##### 빠른 선택지")
-                options_to_show = []
-                messages_exist = st.session_state.get("messages")
-
-                if not messages_exist:
-                    starters = selected_conv_data.get("persona", {}).get(
-                        "conversation_starters"
-                    )
-                    if starters and isinstance(starters, list):
-                        options_to_show = starters
-                        st.caption("ℹ️ 페르소나의 '대화 시작 선택지'입니다.")
-                elif st.session_state.get("last_api_response"):
-                    suggestions = st.session_state.last_api_response.get(
-                        "suggested_user_questions"
-                    )
-                    if suggestions:
-                        options_to_show = suggestions
-                        st.caption("ℹ️ AI가 생성한 '추천 질문'입니다.")
-
-                if options_to_show:
-                    # 선택지 개수에 따라 유연하게 컬럼 생성
-                    num_options = len(options_to_show)
-                    cols = st.columns(num_options) if num_options > 0 else []
-                    for i, option in enumerate(options_to_show):
-                        if cols[i].button(
-                            option, key=f"option_{i}", use_container_width=True
-                        ):
-                            with st.spinner(f"'{option}' 메시지 전송 중..."):
-                                response_data = api_client.send_message(
-                                    token, selected_conv_id, option
-                                )
-                            if response_data:
-                                st.session_state.last_api_response = response_data
-                                with st.spinner("채팅 기록 업데이트 중..."):
-                                    st.session_state.messages = (
-                                        api_client.get_messages_for_conversation_admin(
-                                            token, selected_conv_id
-                                        )
-                                    )
-                                st.session_state.scroll_to_anchor = True
-                                st.rerun()
-                            else:
-                                st.error(
-                                    "메시지 전송 또는 AI 응답 수신에 실패했습니다."
-                                )
-                else:
-                    st.info("표시할 선택지가 없습니다.")
-
-            if "last_api_response" in st.session_state:
-                st.success("AI 응답을 성공적으로 받았습니다!")
-                with st.expander("API Raw Response 보기", expanded=False):
-                    display_api_result(st.session_state.last_api_response)
-
-            with st.expander("**대화방 삭제하기**"):
-                st.error("주의: 이 작업은 되돌릴 수 없습니다.")
-                if st.button(
-                    f"대화방 ID {selected_conv_id} 영구 삭제",
-                    type="primary",
-                    use_container_width=True,
-                ):
-                    if api_client.delete_conversation_admin(token, selected_conv_id):
-                        st.success("대화방이 성공적으로 삭제되었습니다.")
-                        st.cache_data.clear()
-                        keys_to_clear = [
-                            "messages",
-                            "current_conv_id",
-                            "last_api_response",
-                            "sort_asc",
-                            "scroll_to_anchor",
-                            "selected_conv_id",
-                        ]
-                        for key in keys_to_clear:
-                            st.session_state.pop(key, None)
-                        time.sleep(1)
-                        st.rerun()
-                    else:
-                        st.error("삭제에 실패했습니다.")
+            _render_action_panel(
+                api_client, token, selected_conv_id, selected_conv_data
+            )
 
-    if st.session_state.get("scroll_to_anchor"):
-        scroll_to_element("chat_anchor")
-        st.session_state.scroll_to_anchor = False
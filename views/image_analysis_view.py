@@ -1,9 +1,29 @@
 # views/image_analysis_view.py
-import base64
+import io
+import time
 
+import pandas as pd
 import streamlit as st
 
 from api import ApiClient
+from services.image_batch import (
+    IMAGE_BATCH_MAX_WORKERS,
+    IMAGE_BATCH_RATE_PER_SEC,
+    analyze_image_batch,
+    collect_batch_images,
+)
+from services.image_preprocess import (
+    IMAGE_MAX_DIMENSION,
+    IMAGE_OUTPUT_FORMAT,
+    IMAGE_QUALITY,
+    OUTPUT_FORMATS,
+    prepare_uploaded_image,
+)
+from services.jobs import get_job_runner, job_owner
+from views.job_view import JOB_POLL_INTERVAL, track_job
+
+# 점수 분포를 집계할 구간 경계
+SCORE_BINS = list(range(0, 101, 10))
 
 
 def render_image_analysis_page(api_client: ApiClient, token: str):
@@ -13,6 +33,62 @@ def render_image_analysis_page(api_client: ApiClient, token: str):
         "분석하고 싶은 이미지를 업로드하고 '분석 시작' 버튼을 누르면, AI가 해당 이미지의 피싱 위험도를 분석하여 점수와 이유를 알려줍니다."
     )
 
+    mode = st.radio(
+        "분석 방식", ["단일 이미지", "일괄 분석"], horizontal=True, key="analysis_mode"
+    )
+    preprocess = _render_preprocess_options()
+    if mode == "일괄 분석":
+        _render_batch_analysis(api_client, token, preprocess)
+    else:
+        _render_single_analysis(api_client, token, preprocess)
+
+
+def _render_preprocess_options():
+    """이미지 전처리 설정을 입력받아 preprocess_image 옵션으로 반환합니다. (미사용 시 None)"""
+    with st.expander("🗜️ 이미지 전처리 설정"):
+        enabled = st.toggle(
+            "분석 전에 이미지 크기 줄이기 및 재압축",
+            value=True,
+            key="analysis_preprocess",
+            help="긴 변을 최대 크기 이하로 줄이고 EXIF를 제거한 뒤 다시 압축해 전송합니다.",
+        )
+        col1, col2, col3 = st.columns(3)
+        formats = list(OUTPUT_FORMATS)
+        output_format = col1.selectbox(
+            "출력 형식",
+            formats,
+            index=formats.index(IMAGE_OUTPUT_FORMAT),
+            disabled=not enabled,
+        )
+        max_dimension = col2.number_input(
+            "최대 크기(px)",
+            min_value=256,
+            max_value=8192,
+            value=IMAGE_MAX_DIMENSION,
+            step=128,
+            disabled=not enabled,
+        )
+        quality = col3.slider(
+            "압축 품질", 10, 100, value=IMAGE_QUALITY, disabled=not enabled
+        )
+    if not enabled:
+        return None
+    return {
+        "max_dimension": int(max_dimension),
+        "output_format": output_format,
+        "quality": quality,
+    }
+
+
+def _analyze_with_latency(
+    api_client: ApiClient, token: str, image_bytes: bytes, content_type: str
+):
+    started_at = time.perf_counter()
+    result = api_client.analyze_image(token, image_bytes, content_type, force=True)
+    return result, time.perf_counter() - started_at
+
+
+def _render_single_analysis(api_client: ApiClient, token: str, preprocess):
     # 분석 결과와 에러 메시지를 저장할 세션 상태 초기화
     if "analysis_result" not in st.session_state:
         st.session_state.analysis_result = None
@@ -34,31 +110,91 @@ def render_image_analysis_page(api_client: ApiClient, token: str):
 
     with col2:
         st.subheader("📊 분석 결과")
+
+        def on_analysis_finished(job):
+            result = job.result["result"] if job.result else None
+            st.session_state.analysis_comparison = (
+                job.result["comparison"] if job.result else None
+            )
+            if result and "phishing_score" in result:
+                st.session_state.analysis_result = result
+            elif result:
+                st.session_state.analysis_error = result.get(
+                    "detail", "알 수 없는 오류가 발생했습니다."
+                )
+            else:
+                st.session_state.analysis_error = (
+                    job.error or "알 수 없는 오류가 발생했습니다."
+                )
+
+        # 분석은 백그라운드 작업으로 실행되며, 진행 중에는 이 자리에 상태를 표시합니다.
+        track_job("analysis_job", on_analysis_finished)
+
+        force = st.checkbox(
+            "강제 재분석",
+            key="analysis_force",
+            help="같은 이미지의 이전 분석 결과가 있어도 다시 분석합니다.",
+        )
+        compare = st.checkbox(
+            "원본과 비교",
+            key="analysis_compare",
+            disabled=preprocess is None,
+            help="원본과 전처리한 이미지를 모두 분석해 점수와 응답 시간을 비교합니다.",
+        )
         if st.button(
-            "분석 시작", disabled=(uploaded_file is None), use_container_width=True
+            "분석 시작",
+            disabled=(uploaded_file is None or "analysis_job" in st.session_state),
+            use_container_width=True,
         ):
             # 버튼 클릭 시 이전 결과 초기화
             st.session_state.analysis_result = None
             st.session_state.analysis_error = None
+            st.session_state.analysis_comparison = None
+            original_bytes = uploaded_file.getvalue()
+            original_type = uploaded_file.type or "application/octet-stream"
+            prepared = None
+            if preprocess is not None:
+                prepared = prepare_uploaded_image(uploaded_file, **preprocess)
+            st.session_state.analysis_prepared = prepared and prepared.summary()
 
-            with st.spinner("AI가 이미지를 분석하는 중입니다. 잠시만 기다려주세요..."):
-                # 파일을 읽어 Base64로 인코딩
-                image_b64_string = base64.b64encode(uploaded_file.getvalue()).decode(
-                    "utf-8"
-                )
-
-                # API 호출
-                result = api_client.analyze_image_for_phishing(
-                    token=token, image_base64=image_b64_string
-                )
-
-                if result and "phishing_score" in result:
-                    st.session_state.analysis_result = result
-                else:
-                    st.session_state.analysis_error = result.get(
-                        "detail", "알 수 없는 오류가 발생했습니다."
+            def run_analysis(job):
+                if prepared is None:
+                    result = api_client.analyze_image(
+                        token, original_bytes, original_type, force=force
+                    )
+                    return {"result": result, "comparison": None}
+                if not compare:
+                    result = api_client.analyze_image(
+                        token, prepared.data, prepared.content_type, force=force
+                    )
+                    return {"result": result, "comparison": None}
+                # 비교할 때는 캐시를 사용하지 않고 두 이미지를 모두 실제로 분석합니다.
+                comparison = []
+                for label, image_bytes, content_type in [
+                    ("원본", original_bytes, original_type),
+                    ("전처리", prepared.data, prepared.content_type),
+                ]:
+                    job.set_progress(len(comparison), 2, f"{label} 이미지 분석 중")
+                    result, latency = _analyze_with_latency(
+                        api_client, token, image_bytes, content_type
                     )
-            # 분석 완료 후 UI를 다시 그리도록 rerun
+                    comparison.append(
+                        {
+                            "이미지": label,
+                            "크기(KB)": round(len(image_bytes) / 1024, 1),
+                            "점수": (result or {}).get("phishing_score"),
+                            "응답 시간(초)": round(latency, 2),
+                        }
+                    )
+                return {"result": result, "comparison": comparison}
+
+            job = get_job_runner().submit(
+                job_owner(token),
+                "image_analysis",
+                f"이미지 분석 ({uploaded_file.name})",
+                run_analysis,
+            )
+            st.session_state.analysis_job = job.id
             st.rerun()
 
         # 분석 결과 또는 에러 메시지 표시
@@ -74,8 +210,212 @@ def render_image_analysis_page(api_client: ApiClient, token: str):
                 delta_color="inverse",
             )
             st.text_area("분석 이유", value=reason, height=200, disabled=True)
+            if result.get("cached"):
+                st.caption(
+                    "💾 같은 이미지의 이전 분석 결과입니다. "
+                    "다시 분석하려면 '강제 재분석'을 선택하세요."
+                )
+            if st.session_state.get("analysis_prepared"):
+                st.caption(f"🗜️ 전송한 이미지: {st.session_state.analysis_prepared}")
+            if st.session_state.get("analysis_comparison"):
+                st.dataframe(
+                    st.session_state.analysis_comparison,
+                    use_container_width=True,
+                    hide_index=True,
+                )
 
         elif st.session_state.analysis_error:
             st.error(f"분석 실패: {st.session_state.analysis_error}")
-        else:
+        elif "analysis_job" not in st.session_state:
             st.info("분석 버튼을 눌러주세요.")
+
+
+def _batch_results_frame(rows) -> pd.DataFrame:
+    frame = pd.DataFrame(
+        list(rows),
+        columns=[
+            "file",
+            "phishing_score",
+            "reason",
+            "latency_sec",
+            "cached",
+            "original_kb",
+            "sent_kb",
+            "error",
+        ],
+    )
+    return frame.rename(
+        columns={
+            "file": "파일",
+            "phishing_score": "점수",
+            "reason": "이유",
+            "latency_sec": "응답 시간(초)",
+            "cached": "캐시",
+            "original_kb": "원본 크기(KB)",
+            "sent_kb": "전송 크기(KB)",
+            "error": "오류",
+        }
+    )
+
+
+def _render_score_distribution(frame: pd.DataFrame):
+    scores = frame["점수"].dropna().astype(float)
+    if scores.empty:
+        return
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("평균 점수", f"{scores.mean():.1f}")
+    col2.metric("중앙값", f"{scores.median():.1f}")
+    col3.metric("위험도 높음 (70점 초과)", f"{(scores > 70).sum()}건")
+    # 캐시에서 가져온 결과는 요청을 보내지 않았으므로 평균에서 제외합니다.
+    latencies = frame.loc[~frame["캐시"].astype(bool), "응답 시간(초)"].dropna()
+    if not latencies.empty:
+        col4.metric("평균 응답 시간 (캐시 제외)", f"{latencies.mean():.1f}초")
+    labels = [f"{low}-{high}" for low, high in zip(SCORE_BINS, SCORE_BINS[1:])]
+    buckets = pd.cut(scores, bins=SCORE_BINS, labels=labels, include_lowest=True)
+    st.bar_chart(buckets.value_counts(sort=False).rename("이미지 수"))
+
+
+def _batch_results(rows, total: int):
+    frame = _batch_results_frame(rows)
+    failed = int(frame["오류"].notna().sum())
+    st.caption(f"분석 완료 {len(frame)}/{total}건 (실패 {failed}건)")
+    _render_score_distribution(frame)
+    # 표의 열 제목을 누르면 점수나 응답 시간 순으로 정렬할 수 있습니다.
+    st.dataframe(
+        frame,
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            "점수": st.column_config.ProgressColumn(
+                "점수", min_value=0, max_value=100, format="%d"
+            ),
+        },
+    )
+    return frame
+
+
+def _render_batch_export(frame: pd.DataFrame):
+    col1, col2 = st.columns(2)
+    with col1:
+        st.download_button(
+            "CSV로 내보내기",
+            data=frame.to_csv(index=False).encode("utf-8-sig"),
+            file_name="image_analysis_results.csv",
+            mime="text/csv",
+            use_container_width=True,
+        )
+    with col2:
+        try:
+            buffer = io.BytesIO()
+            frame.to_parquet(buffer, index=False)
+        except ImportError:
+            st.caption("Parquet로 내보내려면 pyarrow를 설치해야 합니다.")
+        else:
+            st.download_button(
+                "Parquet로 내보내기",
+                data=buffer.getvalue(),
+                file_name="image_analysis_results.parquet",
+                mime="application/vnd.apache.parquet",
+                use_container_width=True,
+            )
+
+
+def _render_batch_analysis(api_client: ApiClient, token: str, preprocess):
+    """여러 이미지(또는 zip)를 동시에 분석하고 결과를 표로 보여줍니다."""
+    uploaded_files = st.file_uploader(
+        "분석할 이미지 또는 zip 파일 업로드",
+        type=["png", "jpg", "jpeg", "webp", "zip"],
+        accept_multiple_files=True,
+        key="batch_analysis_uploader",
+    )
+
+    col1, col2 = st.columns(2)
+    max_workers = col1.slider(
+        "동시 분석 수",
+        min_value=1,
+        max_value=16,
+        value=min(IMAGE_BATCH_MAX_WORKERS, 16),
+    )
+    rate_per_sec = col2.number_input(
+        "초당 최대 요청 수",
+        min_value=0.1,
+        max_value=50.0,
+        value=IMAGE_BATCH_RATE_PER_SEC,
+        step=0.5,
+    )
+
+    force = st.checkbox(
+        "강제 재분석",
+        key="batch_analysis_force",
+        help="이전 분석 결과가 있는 이미지도 모두 다시 분석합니다.",
+    )
+
+    def on_batch_finished(job):
+        if job.error:
+            st.error(f"일괄 분석 중 오류가 발생했습니다: {job.error}")
+        else:
+            st.toast(f"일괄 분석 완료! ({len(job.result)}건)")
+
+    running = "batch_analysis_job" in st.session_state
+    if st.button(
+        "일괄 분석 시작",
+        type="primary",
+        disabled=not uploaded_files or running,
+        use_container_width=True,
+    ):
+        # 업로드 위젯이 다음 재실행에서 파일을 바꾸거나 닫아도 작업이 읽을 수 있도록
+        # 사본을 만들어 작업에 넘깁니다.
+        file_copies = []
+        for uploaded_file in uploaded_files:
+            file_copy = io.BytesIO(uploaded_file.getvalue())
+            file_copy.name = uploaded_file.name
+            file_copies.append(file_copy)
+        try:
+            images = collect_batch_images(file_copies)
+        except Exception as e:
+            st.error(f"업로드한 파일을 읽지 못했습니다: {e}")
+            images = []
+        if not images:
+            st.warning("분석할 이미지가 없습니다.")
+        else:
+            # 작업 스레드가 결과를 덧붙이는 리스트를 화면에서도 함께 읽습니다.
+            rows = []
+
+            def run_batch(job):
+                return analyze_image_batch(
+                    api_client,
+                    token,
+                    images,
+                    rows,
+                    max_workers=max_workers,
+                    rate_per_sec=rate_per_sec,
+                    force=force,
+                    preprocess=preprocess,
+                    on_progress=job.set_progress,
+                )
+
+            job = get_job_runner().submit(
+                job_owner(token),
+                "image_batch_analysis",
+                f"이미지 일괄 분석 ({len(images)}개)",
+                run_batch,
+            )
+            st.session_state.batch_analysis_job = job.id
+            st.session_state.batch_analysis = {"rows": rows, "total": len(images)}
+            st.rerun()
+
+    track_job("batch_analysis_job", on_batch_finished)
+
+    batch = st.session_state.get("batch_analysis")
+    if batch is None:
+        st.info("이미지를 업로드하고 '일괄 분석 시작' 버튼을 눌러주세요.")
+        return
+    if "batch_analysis_job" in st.session_state:
+        # 분석이 진행되는 동안 결과 영역만 주기적으로 다시 그립니다.
+        st.fragment(_batch_results, run_every=JOB_POLL_INTERVAL)(
+            batch["rows"], batch["total"]
+        )
+    else:
+        frame = _batch_results(batch["rows"], batch["total"])
+        if not frame.empty:
+            _render_batch_export(frame)
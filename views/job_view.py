@@ -0,0 +1,79 @@
+# views/job_view.py
+from typing import Callable
+
+import streamlit as st
+
+from services.jobs import FAILED, Job, get_job_runner, job_owner
+
+# 진행 중인 작업 상태를 다시 확인하는 주기(초)
+JOB_POLL_INTERVAL = 1.0
+
+_STATE_LABELS = {
+    "queued": "⏳ 대기 중",
+    "running": "🔄 실행 중",
+    "done": "✅ 완료",
+    "failed": "❌ 실패",
+}
+
+
+def _render_job(job: Job):
+    st.markdown(f"**{job.label}** · {_STATE_LABELS[job.state]}")
+    if not job.is_finished:
+        st.progress(job.progress, text=job.message or None)
+    elif job.state == FAILED:
+        st.caption(f"오류: {job.error}")
+    else:
+        st.caption(f"{job.elapsed:.1f}초 소요")
+
+
+def _job_panel(owner: str):
+    runner = get_job_runner()
+    jobs = runner.list_jobs(owner)
+    if not jobs:
+        st.caption("실행한 작업이 없습니다.")
+        return
+    for job in jobs:
+        _render_job(job)
+    if any(job.is_finished for job in jobs) and st.button(
+        "완료된 작업 지우기", key="clear_finished_jobs", use_container_width=True
+    ):
+        runner.clear_finished(owner)
+        st.rerun(scope="fragment")
+
+
+def render_job_panel(token: str):
+    """
+    로그인한 관리자의 백그라운드 작업 목록을 표시합니다.
+    진행 중인 작업이 있으면 이 영역만 주기적으로 다시 그립니다.
+    """
+    owner = job_owner(token)
+    active = any(not job.is_finished for job in get_job_runner().list_jobs(owner))
+    with st.expander("백그라운드 작업", expanded=active):
+        st.fragment(_job_panel, run_every=JOB_POLL_INTERVAL if active else None)(owner)
+
+
+def _poll_job(job_id: int):
+    job = get_job_runner().get(job_id)
+    if job is None or job.is_finished:
+        # 결과는 전체 재실행에서 track_job()이 처리합니다.
+        st.rerun()
+    _render_job(job)
+
+
+def track_job(state_key: str, on_finish: Callable[[Job], None]):
+    """
+    session_state[state_key]에 저장된 작업의 진행 상황을 표시합니다.
+    작업이 끝나면 state_key를 지우고 on_finish(job)를 한 번 호출합니다.
+    """
+    job_id = st.session_state.get(state_key)
+    if job_id is None:
+        return
+    job = get_job_runner().get(job_id)
+    if job is None:
+        st.session_state.pop(state_key, None)
+        return
+    if job.is_finished:
+        st.session_state.pop(state_key, None)
+        on_finish(job)
+        return
+    st.fragment(_poll_job, run_every=JOB_POLL_INTERVAL)(job_id)
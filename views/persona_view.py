@@ -1,11 +1,19 @@
 # views/persona_view.py
-import json
-import time
+import io
 
 import streamlit as st
 
 from api import ApiClient
-from utils import section_title
+from services.backup_stream import export_ndjson_gz
+from services.image_preprocess import prepare_uploaded_image
+from services.jobs import get_job_runner, job_owner
+from services.persona_backup import (
+    export_persona_backup_zip,
+    read_persona_backup,
+    restore_personas,
+)
+from utils import count_uploaded_records, render_lazy_download, section_title
+from views.job_view import track_job
 
 
 def render_backup_restore_section_for_persona(
@@ -16,6 +24,23 @@ def render_backup_restore_section_for_persona(
     if "persona_is_restoring" not in st.session_state:
         st.session_state.persona_is_restoring = False
 
+    def on_restore_finished(job):
+        if job.error:
+            st.error(f"복원 중 오류가 발생했습니다: {job.error}")
+            return
+        summary = job.result
+        message = (
+            f"복원 완료! 성공: {summary['success']}건, "
+            f"실패: {summary['failed']}건, "
+            f"이미지 연결: {summary['images_relinked']}건"
+        )
+        if summary["images_failed"]:
+            message += f", 이미지 업로드 실패: {summary['images_failed']}건"
+        st.toast(message)
+
+    # 복원은 백그라운드 작업으로 실행되며, 진행 중에는 이 자리에 진행률을 표시합니다.
+    track_job("persona_restore_job", on_restore_finished)
+
     def on_file_upload():
         if st.session_state.get("persona_restore_uploader"):
             st.session_state.persona_is_restoring = True
@@ -27,92 +52,109 @@ def render_backup_restore_section_for_persona(
         expanded=st.session_state.persona_is_restoring,
     ):
         st.info(
-            "페르소나 데이터를 JSON 파일로 내보내거나, 파일로부터 복원할 수 있습니다. "
+            "페르소나 데이터를 압축된 NDJSON 파일로 내보내거나, 파일로부터 복원할 수 있습니다. "
             "복원 기능은 기존 데이터를 덮어쓰지 않고 **새로운 페르소나를 추가**합니다."
         )
 
         st.subheader("데이터 내보내기 (백업)")
-        try:
-            personas_json = json.dumps(all_personas, ensure_ascii=False, indent=2)
-            st.download_button(
-                label="📁 모든 페르소나 다운로드 (.json)",
-                data=personas_json,
-                file_name="mung_personas_backup.json",
-                mime="application/json",
-                use_container_width=True,
-            )
-        except Exception as e:
-            st.error(f"백업 파일 생성 중 오류가 발생했습니다: {e}")
+        # 백업 파일은 요청할 때만 페이지 단위로 받아 압축 파일로 생성합니다.
+        render_lazy_download(
+            key="persona_backup",
+            build_label="📁 페르소나 백업 만들기 (.ndjson.gz)",
+            download_label="📥 페르소나 백업 다운로드",
+            build_file=lambda: export_ndjson_gz(
+                api_client.iter_personas(token), prefix="mung_personas_"
+            ),
+            file_name="mung_personas_backup.ndjson.gz",
+            mime="application/gzip",
+        )
+
+        # 프로필 이미지까지 포함한 백업은 이미지를 내려받아야 하므로 요청 시에만
+        # 임시 파일로 생성합니다.
+        render_lazy_download(
+            key="persona_backup_zip",
+            build_label="🖼️ 이미지 포함 백업 만들기 (.zip)",
+            download_label="📦 이미지 포함 백업 다운로드",
+            build_file=lambda: export_persona_backup_zip(
+                api_client, token, all_personas
+            ),
+            file_name="mung_personas_backup.zip",
+            mime="application/zip",
+        )
 
         st.divider()
 
         st.subheader("데이터 가져오기 (복원)")
         uploaded_file = st.file_uploader(
-            "복원할 페르소나 JSON 파일을 업로드하세요.",
-            type="json",
+            "복원할 페르소나 백업 파일(.ndjson.gz, .json 또는 이미지 포함 .zip)을 "
+            "업로드하세요.",
+            type=["gz", "ndjson", "json", "zip"],
             key="persona_restore_uploader",
             on_change=on_file_upload,
         )
 
         if uploaded_file is not None:
-            try:
-                restored_data = json.load(uploaded_file)
-                if not isinstance(restored_data, list):
-                    st.error("오류: 파일의 최상위 구조는 리스트(배열) 형태여야 합니다.")
-                else:
-                    st.success(
-                        f"✅ 파일에서 {len(restored_data)}개의 페르소나를 찾았습니다."
-                    )
-                    st.warning(
-                        "**주의:** 아래 버튼을 누르면 이 페르소나들이 시스템에 **새로 추가**됩니다."
-                    )
+            def count_backup():
+                # 레코드 수만 세며 읽으므로 파일 크기와 관계없이 메모리를 적게 사용합니다.
+                records, images = read_persona_backup(uploaded_file)
+                return sum(1 for _ in records), len(images)
 
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        if st.button(
-                            "복원 시작하기", type="primary", use_container_width=True
-                        ):
-                            success_count, fail_count = 0, 0
-                            progress_bar = st.progress(0, text="복원을 시작합니다...")
-
-                            for i, persona_data in enumerate(restored_data):
-                                result = api_client.create_persona(
-                                    token=token,
-                                    name=persona_data.get("name", "이름 없음"),
-                                    system_prompt=persona_data.get("system_prompt", ""),
-                                    description=persona_data.get("description"),
-                                    profile_image_key=None,
-                                    starting_message=persona_data.get(
-                                        "starting_message"
-                                    ),
-                                    conversation_starters=persona_data.get(
-                                        "conversation_starters"
-                                    ),
-                                )
-                                if result and "id" in result:
-                                    success_count += 1
-                                else:
-                                    fail_count += 1
-
-                                progress_text = f"진행 중... ({i + 1}/{len(restored_data)}) 성공: {success_count}, 실패: {fail_count}"
-                                progress_bar.progress(
-                                    (i + 1) / len(restored_data), text=progress_text
-                                )
-
-                            st.success(
-                                f"복원 완료! 성공: {success_count}건, 실패: {fail_count}건"
-                            )
-                            st.session_state.persona_is_restoring = False
-                            st.cache_data.clear()
-                            time.sleep(1)
-                            st.rerun()
-                    with col2:
-                        if st.button("취소", use_container_width=True):
-                            st.session_state.persona_is_restoring = False
-                            st.rerun()
+            try:
+                # 파일마다 한 번만 세고, 재실행 시에는 저장된 값을 사용합니다.
+                record_count, image_count = count_uploaded_records(
+                    "persona_restore", uploaded_file, count_backup
+                )
             except Exception as e:
                 st.error(f"파일 처리 중 오류가 발생했습니다: {e}")
                 st.session_state.persona_is_restoring = False
+                return
+
+            st.success(
+                f"✅ 파일에서 {record_count}개의 페르소나"
+                f"(이미지 {image_count}개)를 찾았습니다."
+            )
+            if not image_count:
+                st.info("이미지가 없는 백업이므로 프로필 이미지 없이 복원됩니다.")
+            st.warning(
+                "**주의:** 아래 버튼을 누르면 이 페르소나들이 시스템에 **새로 추가**됩니다."
+            )
+
+            col1, col2 = st.columns(2)
+            with col1:
+                if st.button(
+                    "복원 시작하기",
+                    type="primary",
+                    use_container_width=True,
+                    disabled="persona_restore_job" in st.session_state,
+                ):
+                    # 업로드 위젯과 파일 위치를 공유하지 않도록 사본을 작업에 넘깁니다.
+                    backup_file = io.BytesIO(uploaded_file.getvalue())
+                    backup_file.name = uploaded_file.name
+
+                    def run_restore(job):
+                        records, images = read_persona_backup(backup_file)
+                        return restore_personas(
+                            api_client,
+                            token,
+                            records,
+                            images,
+                            total=record_count,
+                            on_progress=job.set_progress,
+                        )
+
+                    job = get_job_runner().submit(
+                        job_owner(token),
+                        "persona_restore",
+                        f"페르소나 복원 ({record_count}개)",
+                        run_restore,
+                    )
+                    st.session_state.persona_restore_job = job.id
+                    st.session_state.persona_is_restoring = False
+                    st.rerun()
+            with col2:
+                if st.button("취소", use_container_width=True):
+                    st.session_state.persona_is_restoring = False
+                    st.rerun()
 
 
 def render_persona_management_page(api_client: ApiClient, token: str):
@@ -121,10 +163,6 @@ def render_persona_management_page(api_client: ApiClient, token: str):
     """
     st.header("페르소나 관리")
 
-    @st.cache_data(ttl=60)
-    def get_personas_data():
-        return api_client.get_personas(token)
-
     def handle_file_upload():
         if st.session_state.get("file_uploader_key"):
             st.session_state.uploaded_file = st.session_state.file_uploader_key
@@ -141,6 +179,7 @@ def render_persona_management_page(api_client: ApiClient, token: str):
             "init_create_mode",
             "persona_view_mode",
             "persona_is_restoring",
+            "persona_backup_zip_export",
         ]
         for key in keys_to_delete:
             if key in st.session_state:
@@ -151,7 +190,7 @@ def render_persona_management_page(api_client: ApiClient, token: str):
         "editing_persona_id" in st.session_state
         and st.session_state.editing_persona_id is not None
     ):
-        all_personas = get_personas_data()
+        all_personas = api_client.get_personas(token)
         if all_personas is None:
             st.error("페르소나 목록을 가져오는 데 실패했습니다.")
             return
@@ -258,25 +297,20 @@ def render_persona_management_page(api_client: ApiClient, token: str):
                 elif st.session_state.get("uploaded_file") is not None:
                     file_to_upload = st.session_state.uploaded_file
                     with st.spinner("이미지 업로드 중..."):
-                        presigned_data = api_client.get_presigned_url_for_upload(
-                            token=token,
-                            filename=file_to_upload.name,
-                            category="personas",
+                        prepared = prepare_uploaded_image(file_to_upload)
+                        uploaded_key = api_client.upload_file(
+                            token,
+                            prepared.data,
+                            prepared.file_name(file_to_upload.name),
+                            "personas",
+                            prepared.content_type,
                         )
-                        if presigned_data:
-                            upload_success = api_client.upload_file_to_s3(
-                                presigned_url=presigned_data["url"],
-                                file_data=file_to_upload.getvalue(),
-                                content_type=file_to_upload.type,
-                            )
-                            if upload_success:
-                                final_image_key = presigned_data["object_key"]
-                                if previous_image_key:
-                                    should_delete_previous_image = True
-                            else:
-                                st.error("S3에 이미지를 업로드하는 데 실패했습니다.")
+                        if uploaded_key:
+                            final_image_key = uploaded_key
+                            if previous_image_key:
+                                should_delete_previous_image = True
                         else:
-                            st.error("이미지 업로드 URL을 받아오는 데 실패했습니다.")
+                            st.error("S3에 이미지를 업로드하는 데 실패했습니다.")
 
                 starters_list = [
                     line.strip()
@@ -301,10 +335,9 @@ def render_persona_management_page(api_client: ApiClient, token: str):
                         if should_delete_previous_image:
                             with st.spinner("이전 이미지 정리 중..."):
                                 api_client.delete_s3_object(token, previous_image_key)
-                        st.success("페르소나 정보가 성공적으로 업데이트되었습니다.")
-                        st.cache_data.clear()
+                        # 목록 캐시는 응답으로 바로 갱신되므로 기다리지 않고 다시 그립니다.
+                        st.toast("✅ 페르소나 정보가 성공적으로 업데이트되었습니다.")
                         reset_form_states()
-                        time.sleep(1)
                         st.rerun()
                     else:
                         st.error("페르소나 정보 업데이트에 실패했습니다.")
@@ -328,17 +361,15 @@ def render_persona_management_page(api_client: ApiClient, token: str):
                             )
                             st.stop()
                 if api_client.delete_persona(token, persona_to_edit["id"]):
-                    st.success("페르소나가 성공적으로 삭제되었습니다.")
-                    st.cache_data.clear()
+                    st.toast("🗑️ 페르소나가 성공적으로 삭제되었습니다.")
                     reset_form_states()
-                    time.sleep(1)
                     st.rerun()
                 else:
                     st.error("삭제에 실패했습니다.")
         return
 
     # --- 2. 목록 및 생성/백업 뷰 렌더링 ---
-    all_personas = get_personas_data()
+    all_personas = api_client.get_personas(token)
     if all_personas is None:
         st.error("페르소나 목록을 가져오는 데 실패했습니다.")
         return
@@ -360,27 +391,25 @@ def render_persona_management_page(api_client: ApiClient, token: str):
 
     if st.session_state.persona_view_mode == "페르소나 목록":
         if st.button("페르소나 목록 새로고침", use_container_width=True):
-            st.cache_data.clear()
+            api_client.cache.invalidate("personas")
             st.rerun()
 
         personas = sorted(all_personas, key=lambda p: p["id"])
         st.write(f"총 {len(personas)}개의 페르소나가 조회되었습니다.")
         st.divider()
 
+        # 목록의 모든 프로필 이미지 URL을 한 번에 받아옵니다.
+        image_urls = api_client.get_presigned_urls_for_download(
+            token, [p.get("profile_image_key") for p in personas]
+        )
+
         for p in personas:
             with st.container(border=True):
                 c1, c2 = st.columns([1, 3])
                 with c1:
                     image_key = p.get("profile_image_key")
                     if image_key:
-
-                        @st.cache_data(ttl=300)
-                        def get_cached_download_url(key, auth_token):
-                            return api_client.get_presigned_url_for_download(
-                                token=auth_token, object_key=key
-                            )
-
-                        img_url = get_cached_download_url(image_key, token)
+                        img_url = image_urls.get(image_key)
                         if img_url:
                             st.image(img_url, width=150)
                         else:
@@ -455,24 +484,16 @@ def render_persona_management_page(api_client: ApiClient, token: str):
                     if st.session_state.get("uploaded_file"):
                         file_to_upload = st.session_state.uploaded_file
                         with st.spinner("이미지 업로드 중..."):
-                            presigned_data = api_client.get_presigned_url_for_upload(
-                                token=token,
-                                filename=file_to_upload.name,
-                                category="personas",
+                            prepared = prepare_uploaded_image(file_to_upload)
+                            image_key_to_create = api_client.upload_file(
+                                token,
+                                prepared.data,
+                                prepared.file_name(file_to_upload.name),
+                                "personas",
+                                prepared.content_type,
                             )
-                            if presigned_data:
-                                upload_success = api_client.upload_file_to_s3(
-                                    presigned_url=presigned_data["url"],
-                                    file_data=file_to_upload.getvalue(),
-                                    content_type=file_to_upload.type,
-                                )
-                                if upload_success:
-                                    image_key_to_create = presigned_data["object_key"]
-                                else:
-                                    st.error("S3 업로드 실패.")
-                                    st.stop()
-                            else:
-                                st.error("업로드 URL 생성 실패.")
+                            if not image_key_to_create:
+                                st.error("S3 업로드 실패.")
                                 st.stop()
 
                     starters_list = [
@@ -493,12 +514,8 @@ def render_persona_management_page(api_client: ApiClient, token: str):
                         )
 
                     if creation_success:
-                        st.success(
-                            "페르소나가 성공적으로 생성되었습니다! 목록을 새로고침합니다."
-                        )
-                        st.cache_data.clear()
+                        st.toast("✅ 페르소나가 성공적으로 생성되었습니다!")
                         reset_form_states()
-                        time.sleep(1)
                         st.rerun()
                     else:
                         st.error("페르소나 생성에 실패했습니다.")
@@ -1,11 +1,24 @@
 # views/phishing_view.py
-import json
-import time
+import io
+import math
 
 import pandas as pd
 import streamlit as st
 
 from api import ApiClient
+from services.backup_stream import export_ndjson_gz, iter_backup_records
+from services.jobs import get_job_runner, job_owner
+from services.phishing_import import (
+    ImportCheckpoint,
+    import_id_for,
+    import_phishing_cases,
+)
+from utils import count_uploaded_records, render_lazy_download
+from views.job_view import track_job
+
+# 사례 목록에서 한 페이지에 표시할 사례 수와 미리보기 글자 수
+PHISHING_CASES_PER_PAGE = 10
+PHISHING_PREVIEW_CHARS = 150
 
 
 def render_phishing_case_form(api_client, token, category_map, case_data=None):
@@ -68,12 +81,9 @@ def render_phishing_case_form(api_client, token, category_map, case_data=None):
                 else:
                     result = api_client.create_phishing_case(token, form_data)
             if result and "id" in result:
-                st.success(
-                    f"성공적으로 {'수정' if is_edit_mode else '생성'}되었습니다."
-                )
-                st.cache_data.clear()
+                # 목록 캐시는 응답으로 바로 갱신되므로 기다리지 않고 다시 그립니다.
+                st.toast(f"✅ 성공적으로 {'수정' if is_edit_mode else '생성'}되었습니다.")
                 st.session_state.phishing_view_mode = "list"
-                time.sleep(1)
                 st.rerun()
             else:
                 error_detail = (
@@ -93,16 +103,30 @@ def render_phishing_case_form(api_client, token, category_map, case_data=None):
             ):
                 with st.spinner("사례 삭제 중..."):
                     if api_client.delete_phishing_case(token, case_data["id"]):
-                        st.success("사례가 성공적으로 삭제되었습니다.")
-                        st.cache_data.clear()
+                        st.toast("🗑️ 사례가 성공적으로 삭제되었습니다.")
                         st.session_state.phishing_view_mode = "list"
                         st.session_state.phishing_target_id = None
-                        time.sleep(1)
                         st.rerun()
                     else:
                         st.error("삭제에 실패했습니다.")
 
 
+def _group_cases_by_category(all_cases: list) -> dict:
+    """
+    사례를 유형 코드별로 묶은 dict(각 목록은 ID 내림차순)를 반환합니다.
+    캐시된 목록 객체가 바뀔 때(=데이터가 바뀔 때)만 다시 계산합니다.
+    """
+    cached = st.session_state.get("phishing_case_groups")
+    if cached is not None and cached[0] is all_cases:
+        return cached[1]
+    groups = {}
+    for case in sorted(all_cases, key=lambda c: c["id"], reverse=True):
+        groups.setdefault(case.get("category_code"), []).append(case)
+    groups = dict(sorted(groups.items(), key=lambda item: str(item[0])))
+    st.session_state.phishing_case_groups = (all_cases, groups)
+    return groups
+
+
 def render_case_list_view(api_client, token, category_map, all_cases):
     st.subheader("🗂️ 피싱 사례 목록")
     col1, col2 = st.columns([3, 1])
@@ -114,7 +138,7 @@ def render_case_list_view(api_client, token, category_map, all_cases):
             st.rerun()
     with col2:
         if st.button("🔄 새로고침", use_container_width=True):
-            st.cache_data.clear()
+            api_client.cache.invalidate("phishing_cases", "categories")
             st.rerun()
     st.divider()
 
@@ -122,37 +146,89 @@ def render_case_list_view(api_client, token, category_map, all_cases):
         st.info("등록된 피싱 사례가 없습니다.")
         return
 
-    df_cases = pd.DataFrame(all_cases).sort_values(by="id", ascending=False)
-    grouped = df_cases.groupby("category_code")
-    for category_code, group in grouped:
-        expander_title = f"{category_code} - {category_map.get(category_code, '알 수 없는 유형')} ({len(group)}개)"
-        with st.expander(expander_title):
-            for _, case in group.iterrows():
-                with st.container(border=True):
-                    st.markdown(
-                        f"**ID: {case['id']}** | 발생일: {case.get('case_date', 'N/A')}"
-                    )
-                    st.markdown(f"##### {case['title']}")
-                    st.text_area(
-                        f"내용_{case['id']}",
-                        value=case["content"],
-                        height=100,
-                        disabled=True,
-                    )
-                    if st.button(
-                        "관리하기", key=f"manage_{case['id']}", use_container_width=True
-                    ):
-                        st.session_state.phishing_view_mode = "edit"
-                        st.session_state.phishing_target_id = case["id"]
-                        st.rerun()
+    groups = _group_cases_by_category(all_cases)
+    if st.session_state.get("phishing_list_category") not in groups:
+        st.session_state.pop("phishing_list_category", None)
+    selected_code = st.selectbox(
+        "피싱 유형",
+        options=list(groups),
+        format_func=lambda code: (
+            f"{code} - {category_map.get(code, '알 수 없는 유형')} "
+            f"({len(groups[code])}개)"
+        ),
+        key="phishing_list_category",
+    )
+
+    # 선택한 유형의 사례만, 한 페이지씩 그립니다.
+    cases = groups[selected_code]
+    total_pages = math.ceil(len(cases) / PHISHING_CASES_PER_PAGE)
+    page_nums = st.session_state.setdefault("phishing_case_page_nums", {})
+    page_num = min(page_nums.get(selected_code, 1), total_pages)
+    start_idx = (page_num - 1) * PHISHING_CASES_PER_PAGE
+
+    for case in cases[start_idx : start_idx + PHISHING_CASES_PER_PAGE]:
+        with st.container(border=True):
+            st.markdown(
+                f"**ID: {case['id']}** | 발생일: {case.get('case_date') or 'N/A'}"
+            )
+            st.markdown(f"##### {case['title']}")
+            content = case.get("content") or ""
+            if len(content) <= PHISHING_PREVIEW_CHARS:
+                st.text(content)
+            elif st.toggle("전체 내용 보기", key=f"expand_case_{case['id']}"):
+                st.text_area(
+                    f"내용_{case['id']}",
+                    value=content,
+                    height=200,
+                    disabled=True,
+                    label_visibility="collapsed",
+                )
+            else:
+                st.text(content[:PHISHING_PREVIEW_CHARS] + "…")
+            if st.button(
+                "관리하기", key=f"manage_{case['id']}", use_container_width=True
+            ):
+                st.session_state.phishing_view_mode = "edit"
+                st.session_state.phishing_target_id = case["id"]
+                st.rerun()
+
+    # --- 페이지네이션 컨트롤 ---
+    p_c1, p_c2, p_c3 = st.columns([1, 8, 1])
+    with p_c1:
+        if st.button("이전", key="phishing_prev_page", disabled=page_num <= 1):
+            page_nums[selected_code] = page_num - 1
+            st.rerun()
+    with p_c2:
+        st.caption(f"페이지: {page_num}/{total_pages}")
+    with p_c3:
+        if st.button(
+            "다음", key="phishing_next_page", disabled=page_num >= total_pages
+        ):
+            page_nums[selected_code] = page_num + 1
+            st.rerun()
 
 
-def render_backup_restore_section_for_phishing(
-    api_client: ApiClient, token: str, all_cases: list
-):
+def render_backup_restore_section_for_phishing(api_client: ApiClient, token: str):
     if "phishing_is_restoring" not in st.session_state:
         st.session_state.phishing_is_restoring = False
 
+    def on_import_finished(job):
+        if job.error:
+            st.error(f"복원을 완료하지 못했습니다: {job.error}")
+            st.info("같은 파일로 다시 복원하면 이미 생성된 사례는 건너뛰고 이어서 진행합니다.")
+            return
+        summary = job.result
+        st.toast(
+            f"복원 완료! 생성: {summary['created']}건, "
+            f"이어서 건너뜀: {summary['resumed']}건, "
+            f"중복: {summary['duplicates']}건, 실패: {summary['failed']}건"
+        )
+        if summary["failed"]:
+            st.toast("실패한 사례는 같은 파일로 다시 복원하면 이어서 처리됩니다.")
+
+    # 가져오기는 백그라운드 작업으로 실행되며, 진행 중에는 이 자리에 진행률을 표시합니다.
+    track_job("phishing_import_job", on_import_finished)
+
     def on_file_upload():
         if st.session_state.get("phishing_restore_uploader"):
             st.session_state.phishing_is_restoring = True
@@ -164,81 +240,95 @@ def render_backup_restore_section_for_phishing(
         expanded=st.session_state.phishing_is_restoring,
     ):
         st.info(
-            "피싱 사례 데이터를 JSON 파일로 내보내거나, 파일로부터 복원할 수 있습니다. 복원 기능은 기존 데이터를 덮어쓰지 않고 **새로운 사례를 추가**합니다."
+            "피싱 사례 데이터를 압축된 NDJSON 파일로 내보내거나, 파일로부터 복원할 수 있습니다. "
+            "복원 기능은 기존 데이터를 덮어쓰지 않고 **새로운 사례를 추가**합니다."
         )
         st.subheader("데이터 내보내기 (백업)")
-        try:
-            cases_json = json.dumps(all_cases, ensure_ascii=False, indent=2)
-            st.download_button(
-                "📁 모든 피싱 사례 다운로드 (.json)",
-                data=cases_json,
-                file_name="mung_phishing_cases_backup.json",
-                mime="application/json",
-                use_container_width=True,
-            )
-        except Exception as e:
-            st.error(f"백업 파일 생성 중 오류가 발생했습니다: {e}")
+        # 백업 파일은 요청할 때만 페이지 단위로 받아 압축 파일로 생성합니다.
+        render_lazy_download(
+            key="phishing_backup",
+            build_label="📁 피싱 사례 백업 만들기 (.ndjson.gz)",
+            download_label="📥 피싱 사례 백업 다운로드",
+            build_file=lambda: export_ndjson_gz(
+                api_client.iter_phishing_cases(token), prefix="mung_phishing_cases_"
+            ),
+            file_name="mung_phishing_cases_backup.ndjson.gz",
+            mime="application/gzip",
+        )
         st.divider()
         st.subheader("데이터 가져오기 (복원)")
         uploaded_file = st.file_uploader(
-            "복원할 피싱 사례 JSON 파일을 업로드하세요.",
-            type="json",
+            "복원할 피싱 사례 백업 파일(.ndjson.gz 또는 .json)을 업로드하세요.",
+            type=["gz", "ndjson", "json"],
             key="phishing_restore_uploader",
             on_change=on_file_upload,
         )
 
         if uploaded_file is not None:
+            def count_backup():
+                # 레코드 수만 세며 읽으므로 파일 크기와 관계없이 메모리를 적게 사용합니다.
+                record_count = sum(1 for _ in iter_backup_records(uploaded_file))
+                return record_count, import_id_for(uploaded_file.getvalue())
+
             try:
-                restored_data = json.load(uploaded_file)
-                if not isinstance(restored_data, list):
-                    st.error("오류: 파일의 최상위 구조는 리스트(배열) 형태여야 합니다.")
-                else:
-                    st.success(
-                        f"✅ 파일에서 {len(restored_data)}개의 피싱 사례를 찾았습니다."
-                    )
-                    st.warning(
-                        "**주의:** 아래 버튼을 누르면 이 사례들이 시스템에 **새로 추가**됩니다."
-                    )
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        if st.button(
-                            "복원 시작하기",
-                            type="primary",
-                            use_container_width=True,
-                            key="phishing_restore_start",
-                        ):
-                            success_count, fail_count = 0, 0
-                            progress_bar = st.progress(0, text="복원을 시작합니다...")
-                            for i, case_data in enumerate(restored_data):
-                                result = api_client.create_phishing_case(
-                                    token, case_data
-                                )
-                                if result and "id" in result:
-                                    success_count += 1
-                                else:
-                                    fail_count += 1
-                                progress_text = f"진행 중... ({i + 1}/{len(restored_data)}) 성공: {success_count}, 실패: {fail_count}"
-                                progress_bar.progress(
-                                    (i + 1) / len(restored_data), text=progress_text
-                                )
-                            st.success(
-                                f"복원 완료! 성공: {success_count}건, 실패: {fail_count}건"
-                            )
-                            st.session_state.phishing_is_restoring = False
-                            st.cache_data.clear()
-                            time.sleep(1)
-                            st.rerun()
-                    with col2:
-                        if st.button(
-                            "취소",
-                            use_container_width=True,
-                            key="phishing_restore_cancel",
-                        ):
-                            st.session_state.phishing_is_restoring = False
-                            st.rerun()
+                # 파일마다 한 번만 세고, 재실행 시에는 저장된 값을 사용합니다.
+                record_count, import_id = count_uploaded_records(
+                    "phishing_restore", uploaded_file, count_backup
+                )
             except Exception as e:
                 st.error(f"파일 처리 중 오류가 발생했습니다: {e}")
                 st.session_state.phishing_is_restoring = False
+                return
+
+            st.success(f"✅ 파일에서 {record_count}개의 피싱 사례를 찾았습니다.")
+            if ImportCheckpoint(import_id).exists():
+                st.info(
+                    "이 파일의 이전 가져오기 기록이 있습니다. "
+                    "이미 생성된 사례는 건너뛰고 이어서 진행합니다."
+                )
+            st.warning(
+                "**주의:** 아래 버튼을 누르면 서버에 없는 사례만 시스템에 **새로 추가**됩니다. "
+                "(유형 코드, 제목, 내용이 같은 사례는 중복으로 보고 건너뜁니다.)"
+            )
+            col1, col2 = st.columns(2)
+            with col1:
+                if st.button(
+                    "복원 시작하기",
+                    type="primary",
+                    use_container_width=True,
+                    key="phishing_restore_start",
+                    disabled="phishing_import_job" in st.session_state,
+                ):
+                    # 업로드 위젯과 파일 위치를 공유하지 않도록 사본을 작업에 넘깁니다.
+                    backup_file = io.BytesIO(uploaded_file.getvalue())
+
+                    def run_import(job):
+                        return import_phishing_cases(
+                            api_client,
+                            token,
+                            iter_backup_records(backup_file),
+                            import_id,
+                            total=record_count,
+                            on_progress=job.set_progress,
+                        )
+
+                    job = get_job_runner().submit(
+                        job_owner(token),
+                        "phishing_import",
+                        f"피싱 사례 가져오기 ({record_count}개)",
+                        run_import,
+                    )
+                    st.session_state.phishing_import_job = job.id
+                    st.session_state.phishing_is_restoring = False
+                    st.rerun()
+            with col2:
+                if st.button(
+                    "취소",
+                    use_container_width=True,
+                    key="phishing_restore_cancel",
+                ):
+                    st.session_state.phishing_is_restoring = False
+                    st.rerun()
 
 
 def render_phishing_case_management_page(api_client: ApiClient, token: str):
@@ -248,17 +338,9 @@ def render_phishing_case_management_page(api_client: ApiClient, token: str):
     if "phishing_target_id" not in st.session_state:
         st.session_state.phishing_target_id = None
 
-    @st.cache_data(ttl=300)
-    def get_categories():
-        return api_client.get_phishing_categories()
-
-    @st.cache_data(ttl=60)
-    def get_all_cases():
-        return api_client.get_all_phishing_cases(token)
-
     mode = st.session_state.phishing_view_mode
     if mode in ["edit", "create"]:
-        categories = get_categories()
+        categories = api_client.get_phishing_categories()
         if categories is None:
             st.error("피싱 유형 목록을 불러오는 데 실패했습니다.")
             return
@@ -272,13 +354,8 @@ def render_phishing_case_management_page(api_client: ApiClient, token: str):
             render_phishing_case_form(api_client, token, category_map)
         elif mode == "edit":
             target_id = st.session_state.phishing_target_id
-            all_cases = get_all_cases()
-            if all_cases is None:
-                st.error("피싱 사례 목록을 불러오는 데 실패했습니다.")
-                return
-            case_to_edit = next(
-                (case for case in all_cases if case["id"] == target_id), None
-            )
+            # 목록에서 이미 받은 사례는 ID별 캐시에서 바로 가져옵니다.
+            case_to_edit = api_client.get_phishing_case_by_id(token, target_id)
             if case_to_edit:
                 render_phishing_case_form(
                     api_client, token, category_map, case_data=case_to_edit
@@ -291,16 +368,16 @@ def render_phishing_case_management_page(api_client: ApiClient, token: str):
                 st.rerun()
         return
 
-    categories = get_categories()
+    categories = api_client.get_phishing_categories()
     if categories is None:
         st.error("피싱 유형 목록을 불러오는 데 실패했습니다.")
         return
     category_map = {cat["code"]: cat["description"] for cat in categories}
-    all_cases = get_all_cases()
+    all_cases = api_client.get_all_phishing_cases(token)
     if all_cases is None:
         st.error("피싱 사례 목록을 불러오는 데 실패했습니다.")
         return
 
-    render_backup_restore_section_for_phishing(api_client, token, all_cases)
+    render_backup_restore_section_for_phishing(api_client, token)
     st.divider()
     render_case_list_view(api_client, token, category_map, all_cases)
@@ -1,11 +1,11 @@
 # views/user_view.py
 import math
-import time
 
 import pandas as pd
 import streamlit as st
 
 from api import ApiClient
+from services.image_preprocess import prepare_uploaded_image
 from utils import section_title
 
 
@@ -16,11 +16,6 @@ def render_user_management_page(api_client: ApiClient, token: str):
     """
     st.header("사용자 관리")
 
-    # --- 데이터 로드 및 캐싱 ---
-    @st.cache_data(ttl=60)
-    def get_users_data():
-        return api_client.get_all_users(token=token)
-
     # --- 콜백 및 상태 초기화 함수 ---
     def handle_file_upload():
         if st.session_state.get("user_file_uploader_key"):
@@ -41,14 +36,6 @@ def render_user_management_page(api_client: ApiClient, token: str):
             if key in st.session_state:
                 del st.session_state[key]
 
-    all_users = get_users_data()
-    if all_users is None:
-        st.error("사용자 목록을 가져오는데 실패했습니다.")
-        if st.button("다시 시도"):
-            st.cache_data.clear()
-            st.rerun()
-        return
-
     # --- 세션 상태 초기화 ---
     if "users_page_num" not in st.session_state:
         st.session_state.users_page_num = 1
@@ -73,7 +60,7 @@ def render_user_management_page(api_client: ApiClient, token: str):
             st.rerun()
     with c2:
         if st.button("새로고침", use_container_width=True):
-            st.cache_data.clear()
+            api_client.cache.invalidate("users")
             reset_user_form_states()
             st.rerun()
     with c3:
@@ -89,24 +76,40 @@ def render_user_management_page(api_client: ApiClient, token: str):
             st.session_state.users_page_num = 1
             st.rerun()
 
-    # --- 데이터 필터링 및 페이지네이션 ---
-    df = pd.DataFrame(all_users)
-    if search_query:
-        mask = df["email"].str.contains(search_query, case=False, na=False) | df[
-            "username"
-        ].str.contains(search_query, case=False, na=False)
-        filtered_df = df[mask]
-    else:
-        filtered_df = df
+    # --- 현재 페이지 데이터만 조회 (검색/페이지네이션은 서버에서 처리) ---
+    start_idx = (st.session_state.users_page_num - 1) * items_per_page
+    page = api_client.get_users_page(
+        token=token, skip=start_idx, limit=items_per_page, q=search_query
+    )
+    if page is None:
+        st.error("사용자 목록을 가져오는데 실패했습니다.")
+        if st.button("다시 시도"):
+            st.rerun()
+        return
+    page_users, total_items = page
 
-    total_items = len(filtered_df)
     total_pages = math.ceil(total_items / items_per_page) if total_items > 0 else 1
-    st.session_state.users_page_num = max(
-        1, min(st.session_state.users_page_num, total_pages)
+    if st.session_state.users_page_num > total_pages:
+        # 데이터가 줄어 현재 페이지가 범위를 벗어난 경우 마지막 페이지로 이동합니다.
+        st.session_state.users_page_num = total_pages
+        st.rerun()
+
+    # 이전/다음 페이지를 백그라운드에서 미리 받아 둡니다.
+    api_client.prefetch_users_pages(
+        token,
+        [
+            skip
+            for skip in (start_idx - items_per_page, start_idx + items_per_page)
+            if 0 <= skip < total_items
+        ],
+        limit=items_per_page,
+        q=search_query,
+    )
+
+    paginated_df = pd.DataFrame(
+        page_users,
+        columns=["id", "email", "username", "is_active", "is_superuser"],
     )
-    start_idx = (st.session_state.users_page_num - 1) * items_per_page
-    end_idx = start_idx + items_per_page
-    paginated_df = filtered_df.iloc[start_idx:end_idx]
 
     # --- 데이터프레임 표시 ---
     st.write(
@@ -152,7 +155,7 @@ def render_user_management_page(api_client: ApiClient, token: str):
     if selection.selection.rows:
         selected_row_index = selection.selection.rows[0]
         selected_user_id = paginated_df.iloc[selected_row_index]["id"]
-        user = next((u for u in all_users if u["id"] == selected_user_id), None)
+        user = next((u for u in page_users if u["id"] == selected_user_id), None)
 
         if user:
             # [추가] 다른 사용자를 선택하면 이미지 관련 상태 초기화
@@ -170,16 +173,11 @@ def render_user_management_page(api_client: ApiClient, token: str):
                         st.markdown("**현재 프로필 이미지**")
                         current_image_key = user.get("profile_image_key")
                         if current_image_key:
-
-                            @st.cache_data(ttl=300)
-                            def get_cached_user_image_url(key):
-                                return api_client.get_presigned_url_for_download(
-                                    token=token, object_key=key
-                                )
-
                             with st.spinner("이미지 로딩 중..."):
-                                download_url = get_cached_user_image_url(
-                                    current_image_key
+                                download_url = (
+                                    api_client.get_presigned_url_for_download(
+                                        token=token, object_key=current_image_key
+                                    )
                                 )
 
                             if download_url:
@@ -246,32 +244,23 @@ def render_user_management_page(api_client: ApiClient, token: str):
                                     is not None
                                 ):
                                     file = st.session_state.user_uploaded_file
-                                    presigned_data = (
-                                        api_client.get_presigned_url_for_upload(
-                                            token=token,
-                                            filename=file.name,
-                                            category="users",
-                                        )
+                                    prepared = prepare_uploaded_image(file)
+                                    uploaded_key = api_client.upload_file(
+                                        token,
+                                        prepared.data,
+                                        prepared.file_name(file.name),
+                                        "users",
+                                        prepared.content_type,
                                     )
-                                    if presigned_data:
-                                        upload_ok = api_client.upload_file_to_s3(
-                                            presigned_data["url"],
-                                            file.getvalue(),
-                                            file.type,
+                                    if uploaded_key:
+                                        final_image_key = uploaded_key
+                                        st.toast(
+                                            "✅ 이미지가 성공적으로 업로드되었습니다."
                                         )
-                                        if upload_ok:
-                                            final_image_key = presigned_data[
-                                                "object_key"
-                                            ]
-                                            st.toast(
-                                                "✅ 이미지가 성공적으로 업로드되었습니다."
-                                            )
-                                            if previous_image_key:
-                                                should_delete_previous_image = True
-                                        else:
-                                            st.error("S3에 이미지 업로드 실패.")
+                                        if previous_image_key:
+                                            should_delete_previous_image = True
                                     else:
-                                        st.error("업로드 URL 생성 실패.")
+                                        st.error("S3에 이미지 업로드 실패.")
 
                             update_data = {
                                 "username": new_username,
@@ -291,10 +280,9 @@ def render_user_management_page(api_client: ApiClient, token: str):
                                             )
                                             st.toast("🗑️ 이전 이미지가 삭제되었습니다.")
 
-                                    st.success("사용자 정보가 업데이트되었습니다.")
-                                    st.cache_data.clear()
+                                    # 목록 캐시는 응답으로 바로 갱신되므로 기다리지 않습니다.
+                                    st.toast("✅ 사용자 정보가 업데이트되었습니다.")
                                     reset_user_form_states()
-                                    time.sleep(1)
                                     st.rerun()
                                 else:
                                     st.error("업데이트에 실패했습니다.")
@@ -325,10 +313,8 @@ def render_user_management_page(api_client: ApiClient, token: str):
 
                         # 사용자 삭제 API 호출
                         if api_client.delete_user(token, user["id"]):
-                            st.success("사용자가 삭제되었습니다.")
-                            st.cache_data.clear()
+                            st.toast("🗑️ 사용자가 삭제되었습니다.")
                             reset_user_form_states()
-                            time.sleep(1)
                             st.rerun()
                         else:
                             st.error("삭제에 실패했습니다.")